@@ -1,4 +1,10 @@
-from config.settings import (
+import os
+
+# Older pydantic releases re-validate every generated core schema; skip it since
+# the settings models are static. Must be set before pydantic is imported.
+os.environ.setdefault("PYDANTIC_SKIP_VALIDATING_CORE_SCHEMAS", "true")
+
+from config.settings import (  # noqa: E402
     FeatureFlags,
     LLMProvider,
     LLMSettings,
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from enum import StrEnum
+from functools import cache, cached_property
 from pathlib import Path
 from typing import Literal
 
@@ -21,7 +22,7 @@ class TTSProvider(StrEnum):
 
 
 class LLMSettings(BaseSettings):
-    model_config = SettingsConfigDict(env_prefix="")
+    model_config = SettingsConfigDict(env_prefix="", defer_build=True)
 
     # OpenCode OAuth integration (reads from ~/.local/share/opencode/auth.json)
     use_opencode_auth: bool = True
@@ -37,9 +38,18 @@ class LLMSettings(BaseSettings):
     max_retries: int = 3
     timeout: int = 120
 
+    # Shared httpx pool for the Anthropic/OpenAI SDK clients
+    http_max_connections: int = 512
+    http_max_keepalive_connections: int = 256
+    http_connect_timeout: float = 10.0
+
+    # In-process cache of parsed script responses; a TTL of 0 disables it
+    script_cache_ttl: float = 3600.0
+    script_cache_size: int = 512
+
 
 class TTSSettings(BaseSettings):
-    model_config = SettingsConfigDict(env_prefix="ELEVENLABS_")
+    model_config = SettingsConfigDict(env_prefix="ELEVENLABS_", defer_build=True)
 
     # Optional - empty string allowed for DRY_RUN mode
     api_key: SecretStr = Field(default=SecretStr(""))
@@ -54,7 +64,7 @@ class TTSSettings(BaseSettings):
 
 
 class VisualSettings(BaseSettings):
-    model_config = SettingsConfigDict(env_prefix="")
+    model_config = SettingsConfigDict(env_prefix="", defer_build=True)
 
     replicate_api_token: SecretStr = Field(default=SecretStr(""))
     midjourney_api_key: SecretStr = Field(default=SecretStr(""))
@@ -68,7 +78,7 @@ class VisualSettings(BaseSettings):
 
 
 class MusicSettings(BaseSettings):
-    model_config = SettingsConfigDict(env_prefix="SUNO_")
+    model_config = SettingsConfigDict(env_prefix="SUNO_", defer_build=True)
 
     api_key: SecretStr = Field(default=SecretStr(""))
     default_duration: int = 180
@@ -76,7 +86,7 @@ class MusicSettings(BaseSettings):
 
 
 class YouTubeSettings(BaseSettings):
-    model_config = SettingsConfigDict(env_prefix="YOUTUBE_")
+    model_config = SettingsConfigDict(env_prefix="YOUTUBE_", defer_build=True)
 
     client_secrets_file: Path = Path("config/client_secrets.json")
     token_file: Path = Path("config/youtube_token.json")
@@ -95,7 +105,7 @@ class YouTubeSettings(BaseSettings):
 
 
 class ScheduleSettings(BaseSettings):
-    model_config = SettingsConfigDict(env_prefix="SCHEDULE_")
+    model_config = SettingsConfigDict(env_prefix="SCHEDULE_", defer_build=True)
 
     horror: str = "0 18 * * 1,3,5"
     facts: str = "0 18 * * 2,4,6"
@@ -105,7 +115,7 @@ class ScheduleSettings(BaseSettings):
 
 
 class PathSettings(BaseSettings):
-    model_config = SettingsConfigDict(env_prefix="")
+    model_config = SettingsConfigDict(env_prefix="", defer_build=True)
 
     output_dir: Path = Path("data/output")
     assets_dir: Path = Path("data/assets")
@@ -114,13 +124,16 @@ class PathSettings(BaseSettings):
     @field_validator("output_dir", "assets_dir", "templates_dir", mode="before")
     @classmethod
     def ensure_path(cls, v: str | Path) -> Path:
-        path = Path(v)
-        path.mkdir(parents=True, exist_ok=True)
-        return path.resolve()
+        return Path(v).resolve()
+
+    def ensure_directories(self) -> None:
+        """Create the configured directories; called by writers, not on load."""
+        for path in (self.output_dir, self.assets_dir, self.templates_dir):
+            path.mkdir(parents=True, exist_ok=True)
 
 
 class FeatureFlags(BaseSettings):
-    model_config = SettingsConfigDict(env_prefix="ENABLE_")
+    model_config = SettingsConfigDict(env_prefix="ENABLE_", defer_build=True)
 
     thumbnail_ab_test: bool = True
     multilang: bool = False
@@ -132,32 +145,52 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
+        defer_build=True,
     )
 
-    llm: LLMSettings = Field(default_factory=LLMSettings)
-    tts: TTSSettings = Field(default_factory=TTSSettings)
-    visual: VisualSettings = Field(default_factory=VisualSettings)
-    music: MusicSettings = Field(default_factory=MusicSettings)
-    youtube: YouTubeSettings = Field(default_factory=YouTubeSettings)
-    schedule: ScheduleSettings = Field(default_factory=ScheduleSettings)
-    paths: PathSettings = Field(default_factory=PathSettings)
-    features: FeatureFlags = Field(default_factory=FeatureFlags)
-
     log_level: str = "INFO"
     log_format: Literal["json", "console"] = "console"
 
+    # Sub-settings are built on first access so callers only pay for the
+    # subsystems they actually touch (e.g. the FFmpeg worker never reads llm/tts).
+    @cached_property
+    def llm(self) -> LLMSettings:
+        return LLMSettings()
+
+    @cached_property
+    def tts(self) -> TTSSettings:
+        return TTSSettings()
+
+    @cached_property
+    def visual(self) -> VisualSettings:
+        return VisualSettings()
+
+    @cached_property
+    def music(self) -> MusicSettings:
+        return MusicSettings()
+
+    @cached_property
+    def youtube(self) -> YouTubeSettings:
+        return YouTubeSettings()
+
+    @cached_property
+    def schedule(self) -> ScheduleSettings:
+        return ScheduleSettings()
+
+    @cached_property
+    def paths(self) -> PathSettings:
+        return PathSettings()
 
-_settings: Settings | None = None
+    @cached_property
+    def features(self) -> FeatureFlags:
+        return FeatureFlags()
 
 
+@cache
 def get_settings() -> Settings:
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    return Settings()
 
 
 def reload_settings() -> Settings:
-    global _settings
-    _settings = Settings()
-    return _settings
+    get_settings.cache_clear()
+    return get_settings()
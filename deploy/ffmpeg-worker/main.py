@@ -1,17 +1,22 @@
 """FFmpeg Worker API - Video Composition Service for YouTube Automation."""
 
 import asyncio
+import functools
 import logging
 import os
 import shutil
 import subprocess
 import uuid
 from pathlib import Path
+from typing import TypeVar
 
 import boto3
 import httpx
-from fastapi import BackgroundTasks, FastAPI, HTTPException
-from pydantic import BaseModel
+import msgspec
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse
 
 # ============================================================================
 # Configuration
@@ -26,6 +31,19 @@ MINIO_SECRET_KEY = os.getenv("MINIO_SECRET_KEY", "minioadmin")
 MINIO_BUCKET = os.getenv("MINIO_BUCKET", "youtube-assets")
 MINIO_PUBLIC_URL = os.getenv("MINIO_PUBLIC_URL", "https://minio.jclee.me")
 
+# Shared job state across worker replicas; in-memory when unset
+REDIS_URL = os.getenv("REDIS_URL")
+
+# Encoder-specific output flags at comparable quality; hardware first
+H264_ENCODER_ARGS: dict[str, tuple[str, ...]] = {
+    "h264_nvenc": (
+        "-c:v", "h264_nvenc", "-preset", "p4", "-rc", "vbr", "-cq", "23", "-b:v", "0",
+        "-pix_fmt", "yuv420p",
+    ),
+    "h264_qsv": ("-c:v", "h264_qsv", "-global_quality", "23", "-pix_fmt", "nv12"),
+    "libx264": ("-c:v", "libx264", "-preset", "medium", "-crf", "23", "-pix_fmt", "yuv420p"),
+}  # fmt: skip
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -38,6 +56,15 @@ s3_client = boto3.client(
     endpoint_url=MINIO_ENDPOINT,
     aws_access_key_id=MINIO_ACCESS_KEY,
     aws_secret_access_key=MINIO_SECRET_KEY,
+    config=Config(max_pool_connections=32, tcp_keepalive=True),
+)
+
+# Split large renders into 8 MiB parts uploaded over parallel connections
+transfer_config = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=True,
 )
 
 
@@ -55,13 +82,13 @@ def ensure_bucket():
 # ============================================================================
 
 
-class Scene(BaseModel):
+class Scene(msgspec.Struct, frozen=True):
     imageUrl: str  # noqa: N815
     sceneIndex: int  # noqa: N815
     duration: int  # seconds
 
 
-class ComposeRequest(BaseModel):
+class ComposeRequest(msgspec.Struct, frozen=True):
     audioUrl: str  # noqa: N815
     scenes: list[Scene]
     outputFormat: str = "mp4"  # noqa: N815
@@ -71,7 +98,7 @@ class ComposeRequest(BaseModel):
     videoId: str | None = None  # noqa: N815
 
 
-class JobStatus(BaseModel):
+class JobStatus(msgspec.Struct):
     jobId: str  # noqa: N815
     status: str  # pending, processing, completed, failed
     progress: int = 0
@@ -81,142 +108,264 @@ class JobStatus(BaseModel):
     fileSize: int | None = None  # noqa: N815
 
 
+T = TypeVar("T")
+
+
+async def decode_body(request: Request, model: type[T]) -> T:
+    """Decode and validate a JSON request body with msgspec."""
+    try:
+        return msgspec.json.decode(await request.body(), type=model)
+    except msgspec.ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid JSON: {e}")
+
+
+class MsgspecJSONResponse(JSONResponse):
+    """JSON response rendered with msgspec instead of the stdlib encoder.
+
+    Routes return it directly for Structs so FastAPI's jsonable_encoder
+    pass is skipped as well.
+    """
+
+    def render(self, content: object) -> bytes:
+        return msgspec.json.encode(content)
+
+
 # ============================================================================
-# Job Storage (In-memory - replace with Redis for production)
+# Job Storage (Redis when REDIS_URL is set, in-memory otherwise)
 # ============================================================================
 
-jobs: dict[str, JobStatus] = {}
+
+class MemoryJobStore:
+    """Process-local job store for single-replica and local runs."""
+
+    def __init__(self) -> None:
+        self._jobs: dict[str, JobStatus] = {}
+
+    async def save(self, job: JobStatus) -> None:
+        self._jobs[job.jobId] = job
+
+    async def update(self, job_id: str, **fields: object) -> None:
+        job = self._jobs[job_id]
+        for name, value in fields.items():
+            setattr(job, name, value)
+
+    async def get(self, job_id: str) -> JobStatus | None:
+        return self._jobs.get(job_id)
+
+    async def list(self) -> list[JobStatus]:
+        return list(self._jobs.values())
+
+    async def delete(self, job_id: str) -> bool:
+        return self._jobs.pop(job_id, None) is not None
+
+
+class RedisJobStore:
+    """Redis hash per job (job:{id}) so any replica can serve status reads."""
+
+    def __init__(self, url: str) -> None:
+        import redis.asyncio as redis
+
+        self._redis = redis.from_url(url, decode_responses=True)
+
+    @staticmethod
+    def _key(job_id: str) -> str:
+        return f"job:{job_id}"
+
+    async def save(self, job: JobStatus) -> None:
+        await self.update(job.jobId, **msgspec.structs.asdict(job))
+
+    async def update(self, job_id: str, **fields: object) -> None:
+        mapping = {name: value for name, value in fields.items() if value is not None}
+        await self._redis.hset(self._key(job_id), mapping=mapping)
+
+    async def get(self, job_id: str) -> JobStatus | None:
+        data = await self._redis.hgetall(self._key(job_id))
+        return msgspec.convert(data, JobStatus, strict=False) if data else None
+
+    async def list(self) -> list[JobStatus]:
+        keys = [key async for key in self._redis.scan_iter(match="job:*")]
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.hgetall(key)
+            results = await pipe.execute()
+        return [msgspec.convert(data, JobStatus, strict=False) for data in results if data]
+
+    async def delete(self, job_id: str) -> bool:
+        return bool(await self._redis.delete(self._key(job_id)))
+
+
+job_store: MemoryJobStore | RedisJobStore = (
+    RedisJobStore(REDIS_URL) if REDIS_URL else MemoryJobStore()
+)
 
 # ============================================================================
 # FFmpeg Processing
 # ============================================================================
 
 
-async def download_file(url: str, dest: Path) -> None:
-    """Download file from URL."""
-    async with httpx.AsyncClient(timeout=300.0) as client:
-        resp = await client.get(url)
+@functools.cache
+def h264_encoder() -> str:
+    """Pick the fastest working H.264 encoder, falling back to libx264.
+
+    Distro ffmpeg builds list hardware encoders even without the device, so
+    each candidate is verified with a one-frame test encode.
+    """
+    forced = os.getenv("FFMPEG_ENCODER")
+    if forced in H264_ENCODER_ARGS:
+        return forced
+
+    for encoder in ("h264_nvenc", "h264_qsv"):
+        probe = [
+            "ffmpeg",
+            "-hide_banner",
+            "-f",
+            "lavfi",
+            "-i",
+            "color=black:s=256x256:d=0.1",
+            "-frames:v",
+            "1",
+            *H264_ENCODER_ARGS[encoder],
+            "-f",
+            "null",
+            "-",
+        ]
+        try:
+            subprocess.run(probe, check=True, capture_output=True, timeout=30)
+        except (OSError, subprocess.SubprocessError):
+            continue
+        return encoder
+    return "libx264"
+
+
+async def download_file(client: httpx.AsyncClient, url: str, dest: Path) -> None:
+    """Stream file from URL to disk."""
+    async with client.stream("GET", url) as resp:
         resp.raise_for_status()
-        dest.write_bytes(resp.content)
-        logger.info(f"Downloaded: {url} -> {dest}")
+        with dest.open("wb") as f:
+            # Fixed 1 MiB chunks bound memory per download and cut write() calls
+            async for chunk in resp.aiter_bytes(chunk_size=1 << 20):
+                f.write(chunk)
+    logger.info(f"Downloaded: {url} -> {dest}")
+
+
+async def run_command(cmd: list[str], capture_stdout: bool = False, check: bool = True) -> str:
+    """Run an ffmpeg/ffprobe command under the event loop and return its stdout."""
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE if capture_stdout else asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await proc.communicate()
+    if check and proc.returncode:
+        raise RuntimeError(f"{cmd[0]} exited with {proc.returncode}: {stderr.decode()[-2000:]}")
+    return stdout.decode() if stdout else ""
 
 
-def create_ken_burns_segment(
-    image_path: Path,
-    output_path: Path,
-    duration: int,
-    fps: int,
-    resolution: str,
-) -> None:
-    """Create video segment with Ken Burns zoom effect."""
-    width, height = resolution.split("x")
+@functools.lru_cache(maxsize=64)
+def ken_burns_filter(duration: int, fps: int, resolution: str) -> str:
+    """Build the Ken Burns zoom filter for a single still image input.
+
+    Scenes in a batch mostly share duration/fps/resolution, so the
+    formatted string is memoized.
+    """
     zoom_increment = 0.0015
     total_frames = duration * fps
-
-    cmd = [
-        "ffmpeg",
-        "-y",
-        "-loop",
-        "1",
-        "-i",
-        str(image_path),
-        "-vf",
-        (
-            f"scale=8000:-1,"
-            f"zoompan=z='min(zoom+{zoom_increment},1.5)':"
-            f"x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)':"
-            f"d={total_frames}:s={resolution}:fps={fps}"
-        ),
-        "-t",
-        str(duration),
-        "-c:v",
-        "libx264",
-        "-preset",
-        "medium",
-        "-crf",
-        "23",
-        "-pix_fmt",
-        "yuv420p",
-        str(output_path),
-    ]
-
-    logger.info(f"Creating segment: {image_path} -> {output_path}")
-    subprocess.run(cmd, check=True, capture_output=True)
+    # Upscale ~4x the output width to avoid zoompan jitter; the input is a single
+    # frame, so this runs once per image rather than per output frame
+    prescale_width = min(int(resolution.split("x")[0]) * 4, 8000)
+    return (
+        f"scale={prescale_width}:-1,"
+        f"zoompan=z='min(zoom+{zoom_increment},1.5)':"
+        f"x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)':"
+        f"d={total_frames}:s={resolution}:fps={fps},"
+        f"setsar=1"
+    )
 
 
-def concatenate_segments(segment_paths: list[Path], output_path: Path) -> None:
-    """Concatenate video segments."""
-    concat_file = output_path.parent / "concat.txt"
+@functools.cache
+def output_args(encoder: str) -> tuple[str, ...]:
+    """Encoder and audio flags shared by every render on this host."""
+    return (*H264_ENCODER_ARGS[encoder], "-c:a", "aac", "-b:a", "192k", "-shortest")
 
-    with open(concat_file, "w") as f:
-        for seg in segment_paths:
-            f.write(f"file '{seg}'\n")
 
-    cmd = [
-        "ffmpeg",
-        "-y",
-        "-f",
-        "concat",
-        "-safe",
-        "0",
-        "-i",
-        str(concat_file),
-        "-c",
-        "copy",
-        str(output_path),
+async def render_video(
+    scenes: list[Scene],
+    image_paths: list[Path],
+    audio_path: Path,
+    output_path: Path,
+    fps: int,
+    resolution: str,
+) -> None:
+    """Render all scenes, concatenate them and mux audio in one ffmpeg pass."""
+    cmd = ["ffmpeg", "-y"]
+    for image_path in image_paths:
+        cmd += ["-i", str(image_path)]
+    cmd += ["-i", str(audio_path)]
+
+    # Each still image is a single input frame; zoompan expands it to duration * fps frames
+    filters = [
+        f"[{i}:v]{ken_burns_filter(scene.duration, fps, resolution)}[v{i}]"
+        for i, scene in enumerate(scenes)
     ]
-
-    subprocess.run(cmd, check=True, capture_output=True)
-
-
-def add_audio(video_path: Path, audio_path: Path, output_path: Path) -> None:
-    """Add audio track to video."""
-    cmd = [
-        "ffmpeg",
-        "-y",
-        "-i",
-        str(video_path),
-        "-i",
-        str(audio_path),
-        "-c:v",
-        "copy",
-        "-c:a",
-        "aac",
-        "-b:a",
-        "192k",
-        "-shortest",
+    labels = "".join(f"[v{i}]" for i in range(len(scenes)))
+    filters.append(f"{labels}concat=n={len(scenes)}:v=1:a=0[v]")
+
+    cmd += [
+        "-filter_complex",
+        ";".join(filters),
+        "-map",
+        "[v]",
+        "-map",
+        f"{len(scenes)}:a",
+        *output_args(h264_encoder()),
         str(output_path),
     ]
 
-    subprocess.run(cmd, check=True, capture_output=True)
+    logger.info(f"Composing {len(scenes)} scenes -> {output_path}")
+    await run_command(cmd)
 
 
-def get_video_info(path: Path) -> tuple[int, int]:
-    """Get video duration and file size."""
+async def probe_duration(path: Path) -> float | None:
+    """Read a media file's container duration in seconds with ffprobe."""
     cmd = [
         "ffprobe",
         "-v",
         "error",
-        "-select_streams",
-        "v:0",
         "-show_entries",
         "format=duration",
         "-of",
         "default=noprint_wrappers=1:nokey=1",
         str(path),
     ]
+    stdout = (await run_command(cmd, capture_stdout=True, check=False)).strip()
+    try:
+        return float(stdout)
+    except ValueError:
+        return None
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    duration = int(float(result.stdout.strip())) if result.stdout.strip() else 0
-    file_size = path.stat().st_size
 
+async def get_video_info(path: Path, duration: int | None = None) -> tuple[int, int]:
+    """Get video duration and file size.
+
+    ffprobe is only spawned when the caller cannot supply the duration.
+    """
+    file_size = path.stat().st_size
+    if duration is None:
+        probed = await probe_duration(path)
+        duration = int(probed) if probed is not None else 0
     return duration, file_size
 
 
 def upload_to_minio(local_path: Path, object_key: str) -> str:
     """Upload file to MinIO and return public URL."""
     s3_client.upload_file(
-        str(local_path), MINIO_BUCKET, object_key, ExtraArgs={"ContentType": "video/mp4"}
+        str(local_path),
+        MINIO_BUCKET,
+        object_key,
+        ExtraArgs={"ContentType": "video/mp4"},
+        Config=transfer_config,
     )
 
     return f"{MINIO_PUBLIC_URL}/{MINIO_BUCKET}/{object_key}"
@@ -233,64 +382,80 @@ async def process_video(job_id: str, request: ComposeRequest) -> None:
     job_dir.mkdir(exist_ok=True)
 
     try:
-        jobs[job_id].status = "processing"
-        jobs[job_id].progress = 5
-
-        logger.info(f"[{job_id}] Downloading audio...")
-        audio_path = job_dir / "audio.mp3"
-        await download_file(request.audioUrl, audio_path)
-        jobs[job_id].progress = 15
+        await job_store.update(job_id, status="processing", progress=5)
 
         sorted_scenes = sorted(request.scenes, key=lambda s: s.sceneIndex)
         total_scenes = len(sorted_scenes)
-        segment_paths = []
-
-        for i, scene in enumerate(sorted_scenes):
-            logger.info(f"[{job_id}] Processing scene {i + 1}/{total_scenes}")
-
-            img_path = job_dir / f"scene_{scene.sceneIndex}.png"
-            await download_file(scene.imageUrl, img_path)
+        audio_path = job_dir / "audio.mp3"
+        image_paths = [job_dir / f"scene_{scene.sceneIndex}.png" for scene in sorted_scenes]
+
+        logger.info(f"[{job_id}] Downloading audio and {total_scenes} images...")
+        # Downloads span progress 5 -> 15; step is computed once, not per file
+        step = 10.0 / (total_scenes + 1)
+        progress = 5.0
+
+        async def fetch(client: httpx.AsyncClient, url: str, dest: Path) -> None:
+            nonlocal progress
+            await download_file(client, url, dest)
+            progress += step
+            await job_store.update(job_id, progress=int(progress))
+
+        async with httpx.AsyncClient(
+            timeout=300.0, http2=True, limits=httpx.Limits(max_connections=32)
+        ) as client:
+            await asyncio.gather(
+                fetch(client, request.audioUrl, audio_path),
+                *(
+                    fetch(client, scene.imageUrl, img_path)
+                    for scene, img_path in zip(sorted_scenes, image_paths, strict=True)
+                ),
+            )
 
-            segment_path = job_dir / f"segment_{scene.sceneIndex}.mp4"
-            await asyncio.to_thread(
-                create_ken_burns_segment,
-                img_path,
-                segment_path,
-                scene.duration,
+        logger.info(f"[{job_id}] Composing {total_scenes} scenes...")
+        output_path = job_dir / f"output.{request.outputFormat}"
+        # The narration is probed while the render runs, not after it
+        audio_probe = asyncio.create_task(probe_duration(audio_path))
+        try:
+            await render_video(
+                sorted_scenes,
+                image_paths,
+                audio_path,
+                output_path,
                 request.fps,
                 request.resolution,
             )
-            segment_paths.append(segment_path)
-            jobs[job_id].progress = 15 + int((i + 1) / total_scenes * 60)
-
-        logger.info(f"[{job_id}] Concatenating segments...")
-        video_no_audio = job_dir / "video_no_audio.mp4"
-        await asyncio.to_thread(concatenate_segments, segment_paths, video_no_audio)
-        jobs[job_id].progress = 80
-
-        logger.info(f"[{job_id}] Adding audio...")
-        output_path = job_dir / f"output.{request.outputFormat}"
-        await asyncio.to_thread(add_audio, video_no_audio, audio_path, output_path)
-        jobs[job_id].progress = 90
-
-        duration, file_size = get_video_info(output_path)
+        except BaseException:
+            audio_probe.cancel()
+            raise
+        await job_store.update(job_id, progress=90)
+
+        # Hard cuts make the video track the sum of scene durations, but -shortest
+        # ends the file with the audio when the narration is shorter
+        audio_duration = await audio_probe
+        known_duration = None
+        if audio_duration is not None:
+            scenes_duration = sum(scene.duration for scene in sorted_scenes)
+            known_duration = min(scenes_duration, int(audio_duration))
+        duration, file_size = await get_video_info(output_path, known_duration)
 
         logger.info(f"[{job_id}] Uploading to MinIO...")
         object_key = f"videos/{job_id}/output.mp4"
         output_url = await asyncio.to_thread(upload_to_minio, output_path, object_key)
 
-        jobs[job_id].status = "completed"
-        jobs[job_id].progress = 100
-        jobs[job_id].outputUrl = output_url
-        jobs[job_id].duration = duration
-        jobs[job_id].fileSize = file_size
+        await job_store.update(
+            job_id,
+            status="completed",
+            progress=100,
+            outputUrl=output_url,
+            duration=duration,
+            fileSize=file_size,
+        )
 
         logger.info(f"[{job_id}] Completed! Output: {output_url}")
 
     except Exception as e:
         logger.error(f"[{job_id}] Failed: {e}")
-        jobs[job_id].status = "failed"
-        jobs[job_id].error = str(e)
+        await job_store.update(job_id, status="failed", error=str(e))
 
     finally:
         # Cleanup job directory to reclaim disk space
@@ -310,6 +475,7 @@ app = FastAPI(
     title="FFmpeg Worker API",
     description="Video composition service for YouTube Automation",
     version="1.0.0",
+    default_response_class=MsgspecJSONResponse,
 )
 
 
@@ -317,7 +483,7 @@ app = FastAPI(
 async def startup():
     """Initialize on startup."""
     ensure_bucket()
-    logger.info("FFmpeg Worker API started")
+    logger.info(f"FFmpeg Worker API started (encoder: {h264_encoder()})")
 
 
 @app.get("/health")
@@ -326,50 +492,51 @@ async def health_check():
     return {"status": "healthy", "service": "ffmpeg-worker"}
 
 
-@app.post("/api/compose", response_model=JobStatus)
-async def compose_video(request: ComposeRequest, background_tasks: BackgroundTasks):
+@app.post("/api/compose")
+async def compose_video(http_request: Request, background_tasks: BackgroundTasks):
     """Start video composition job."""
+    request = await decode_body(http_request, ComposeRequest)
     job_id = f"job_{uuid.uuid4().hex[:12]}"
 
     if request.videoId:
         job_id = f"job_{request.videoId}"
 
-    jobs[job_id] = JobStatus(jobId=job_id, status="pending", progress=0)
+    job = JobStatus(jobId=job_id, status="pending", progress=0)
+    await job_store.save(job)
 
     background_tasks.add_task(process_video, job_id, request)
 
     logger.info(f"Created job: {job_id} with {len(request.scenes)} scenes")
 
-    return jobs[job_id]
+    return MsgspecJSONResponse(job)
 
 
-@app.get("/api/jobs/{job_id}", response_model=JobStatus)
+@app.get("/api/jobs/{job_id}")
 async def get_job_status(job_id: str):
     """Get job status."""
-    if job_id not in jobs:
+    job = await job_store.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    return jobs[job_id]
+    return MsgspecJSONResponse(job)
 
 
 @app.get("/api/jobs")
 async def list_jobs():
     """List all jobs."""
-    return list(jobs.values())
+    return MsgspecJSONResponse(await job_store.list())
 
 
 @app.delete("/api/jobs/{job_id}")
 async def delete_job(job_id: str):
     """Delete job and cleanup."""
-    if job_id not in jobs:
+    if not await job_store.delete(job_id):
         raise HTTPException(status_code=404, detail="Job not found")
 
     job_dir = WORK_DIR / job_id
     if job_dir.exists():
         shutil.rmtree(job_dir, ignore_errors=True)
 
-    del jobs[job_id]
-
     return {"deleted": job_id}
 
 
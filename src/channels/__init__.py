@@ -1,8 +1,32 @@
 """Channel-specific pipelines."""
 
-from src.channels.facts import FactsPipeline
-from src.channels.finance import FinancePipeline
-from src.channels.horror import HorrorPipeline
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.channels.facts import FactsPipeline
+    from src.channels.finance import FinancePipeline
+    from src.channels.horror import HorrorPipeline
+
+# Pipelines are imported on first access so running one channel
+# does not load the other channels' modules.
+_LAZY_EXPORTS = {
+    "HorrorPipeline": "src.channels.horror",
+    "FactsPipeline": "src.channels.facts",
+    "FinancePipeline": "src.channels.finance",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "HorrorPipeline",
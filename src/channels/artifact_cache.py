@@ -0,0 +1,64 @@
+"""Content-addressed disk cache for generated media shared by channel pipelines."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import shutil
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+
+class ArtifactCache:
+    """Reuse generated images, clips and thumbnails across runs.
+
+    Entries are stored as ``{root}/{sha256}{suffix}`` and hardlinked into
+    project directories, falling back to a copy across filesystems.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        return hashlib.sha256("\x1f".join(map(str, parts)).encode()).hexdigest()
+
+    async def fetch(
+        self,
+        key: str,
+        output_path: Path,
+        produce: Callable[[], Awaitable[Any]],
+    ) -> Path:
+        """Place the artifact for key at output_path, calling produce() on a miss."""
+        cached = self.root / f"{key}{output_path.suffix}"
+        # Filesystem work runs in a worker thread, one hop per lookup/store
+        if await asyncio.to_thread(_restore, cached, output_path):
+            return output_path
+
+        await produce()
+        await asyncio.to_thread(_store, output_path, cached)
+        return output_path
+
+
+def _restore(cached: Path, output_path: Path) -> bool:
+    if not cached.exists():
+        return False
+    _link_or_copy(cached, output_path)
+    return True
+
+
+def _store(output_path: Path, cached: Path) -> None:
+    if output_path.exists():
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        _link_or_copy(output_path, cached)
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    try:
+        os.link(src, dst)
+    except FileExistsError:
+        pass
+    except OSError:
+        shutil.copyfile(src, dst)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -15,12 +16,14 @@ from src.channels.facts.prompts import (
     TITLE_OPTIMIZATION,
     TOPIC_GENERATION,
     VISUAL_PROMPT_TEMPLATE,
+    find_forbidden_topic,
 )
 
 if TYPE_CHECKING:
     pass
 
 
+@cache
 def create_pipeline(output_base: Path | None = None) -> FactsPipeline:
     from src.services import (
         ImageGenerator,
@@ -50,6 +53,7 @@ __all__ = [
     "FactsPipeline",
     "create_pipeline",
     "FORBIDDEN_TOPICS",
+    "find_forbidden_topic",
     "TOPIC_GENERATION",
     "SCRIPT_TEMPLATE",
     "VISUAL_PROMPT_TEMPLATE",
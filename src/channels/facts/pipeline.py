@@ -13,12 +13,12 @@ from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 from src.channels.facts.prompts import (
     DESCRIPTION_TEMPLATE,
-    FORBIDDEN_TOPICS,
     SCRIPT_TEMPLATE,
     TAGS_GENERATION,
     TITLE_OPTIMIZATION,
     TOPIC_GENERATION,
     VISUAL_PROMPT_TEMPLATE,
+    find_forbidden_topic,
 )
 from src.core.exceptions import PipelineError
 from src.core.interfaces import ContentPipeline
@@ -217,10 +217,9 @@ class FactsPipeline(ContentPipeline):
 
     def _validate_script(self, script: Script) -> None:
         """Validate script content."""
-        content = script.body.lower()
-        for forbidden in FORBIDDEN_TOPICS:
-            if forbidden in content:
-                raise PipelineError(f"Script contains forbidden topic: {forbidden}")
+        forbidden = find_forbidden_topic(script.body)
+        if forbidden:
+            raise PipelineError(f"Script contains forbidden topic: {forbidden}")
 
         wc = script.word_count
         if wc < 800:
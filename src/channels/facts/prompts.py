@@ -1,5 +1,7 @@
 """Facts channel prompt templates."""
 
+import re
+
 FORBIDDEN_TOPICS = frozenset(
     [
         "misinformation",
@@ -13,6 +15,19 @@ FORBIDDEN_TOPICS = frozenset(
     ]
 )
 
+# All forbidden phrases as one alternation so scripts are scanned in a single pass
+_FORBIDDEN_PATTERN = re.compile(
+    "|".join(re.escape(topic) for topic in sorted(FORBIDDEN_TOPICS, key=len, reverse=True)),
+    re.IGNORECASE,
+)
+
+
+def find_forbidden_topic(text: str) -> str | None:
+    """Return the first forbidden topic mentioned in text, if any."""
+    match = _FORBIDDEN_PATTERN.search(text)
+    return match.group().lower() if match else None
+
+
 TOPIC_GENERATION = """You are a content strategist for an educational "Mind-Blowing Facts" YouTube channel.
 Generate {count} unique, viral-worthy educational video topics.
 
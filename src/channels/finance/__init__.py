@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from functools import cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import httpx
+
 from src.channels.finance.pipeline import FinancePipeline
 from src.channels.finance.prompts import (
     DESCRIPTION_TEMPLATE,
@@ -15,13 +18,16 @@ from src.channels.finance.prompts import (
     THUMBNAIL_PROMPT_TEMPLATE,
     TITLE_OPTIMIZATION,
     TOPIC_GENERATION,
+    TOPIC_WITH_TITLES,
     VISUAL_PROMPT_TEMPLATE,
+    find_forbidden_topic,
 )
 
 if TYPE_CHECKING:
     pass
 
 
+@cache
 def create_pipeline(output_base: Path | None = None) -> FinancePipeline:
     from src.services import (
         ImageGenerator,
@@ -34,16 +40,24 @@ def create_pipeline(output_base: Path | None = None) -> FinancePipeline:
         get_script_generator,
     )
 
+    # One pooled HTTP/2 client shared by the media generators
+    http_client = httpx.AsyncClient(
+        http2=True,
+        timeout=600.0,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    )
+
     return FinancePipeline(
         script_generator=get_script_generator(),
         tts_engine=TTSEngineImpl(),  # type: ignore[arg-type]
-        image_generator=ImageGenerator(),
-        video_generator=VideoGenerator(),
+        image_generator=ImageGenerator(http_client=http_client),
+        video_generator=VideoGenerator(http_client=http_client),
         video_composer=VideoComposer(),  # type: ignore[arg-type]
         thumbnail_generator=ThumbnailGenerator(),
         youtube_uploader=YouTubeUploader(),
         output_base=output_base,
         llm_client=get_llm_client(),
+        http_client=http_client,
     )
 
 
@@ -51,7 +65,9 @@ __all__ = [
     "FinancePipeline",
     "create_pipeline",
     "FORBIDDEN_TOPICS",
+    "find_forbidden_topic",
     "TOPIC_GENERATION",
+    "TOPIC_WITH_TITLES",
     "SCRIPT_TEMPLATE",
     "VISUAL_PROMPT_TEMPLATE",
     "THUMBNAIL_PROMPT_TEMPLATE",
@@ -2,15 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import re
 import uuid
-from collections.abc import AsyncIterator, Awaitable
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable
+from contextlib import aclosing
 from datetime import UTC, datetime, timedelta
+from functools import partial
 from logging import getLogger
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
+import httpx
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+from src.channels.artifact_cache import ArtifactCache
 from src.channels.finance.prompts import (
     DESCRIPTION_TEMPLATE,
     DISCLAIMER_TEXT,
@@ -18,10 +31,13 @@ from src.channels.finance.prompts import (
     SCRIPT_TEMPLATE,
     TAGS_GENERATION,
     TITLE_OPTIMIZATION,
-    TOPIC_GENERATION,
+    TOPIC_WITH_TITLES,
     VISUAL_PROMPT_TEMPLATE,
+    find_forbidden_topic,
 )
-from src.core.exceptions import PipelineError
+from src.channels.llm_cache import LLMResponseCache
+from src.channels.prompt_template import PromptTemplate
+from src.core.exceptions import LLMRateLimitError, LLMTransientError, PipelineError
 from src.core.interfaces import ContentPipeline
 from src.core.models import (
     CHANNEL_CONFIGS,
@@ -44,6 +60,85 @@ if TYPE_CHECKING:
 
 logger = getLogger(__name__)
 
+# Any bracketed marker ([CONFIDENT], [SERIOUS], ...) is stripped in one pass
+_TTS_MARKER_RE = re.compile(r"\[.*?\]")
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*([\s\S]*?)```")
+_JSON_ARRAY_RE = re.compile(r"\[[\s\S]*\]")
+_JSON_OBJECT_RE = re.compile(r"\{[\s\S]*\}")
+
+# Phrases that warrant manual review, matched in a single scan of the script
+_RED_FLAGS = (
+    "guaranteed",
+    "100%",
+    "risk-free",
+    "can't lose",
+    "sure thing",
+    "secret method",
+    "millionaire overnight",
+)
+_RED_FLAG_RE = re.compile("|".join(re.escape(flag) for flag in _RED_FLAGS), re.IGNORECASE)
+
+# Scene mood keywords; cautionary wins when a paragraph matches both
+_CAUTION_MOOD_RE = re.compile("mistake|wrong|lose|risk")
+_ASPIRATIONAL_MOOD_RE = re.compile("grow|wealth|success|freedom")
+
+# Templates are parsed once here rather than by str.format on every prompt
+_TOPIC_WITH_TITLES = PromptTemplate(TOPIC_WITH_TITLES)
+_SCRIPT_TEMPLATE = PromptTemplate(SCRIPT_TEMPLATE)
+_TITLE_OPTIMIZATION = PromptTemplate(TITLE_OPTIMIZATION)
+_DESCRIPTION_TEMPLATE = PromptTemplate(DESCRIPTION_TEMPLATE)
+_TAGS_GENERATION = PromptTemplate(TAGS_GENERATION)
+_VISUAL_PROMPT_TEMPLATE = PromptTemplate(VISUAL_PROMPT_TEMPLATE)
+
+_DISCLAIMER = DISCLAIMER_TEXT.strip()
+_MOTION_PROMPT = "professional slow zoom with subtle motion"
+
+_LLM_BACKOFF = wait_random_exponential(multiplier=1, max=30)
+
+
+def _retry_after_seconds(exc: BaseException | None) -> float | None:
+    """Read a Retry-After header from an HTTP error or the error it wraps."""
+    while exc is not None:
+        response = getattr(exc, "response", None)
+        retry_after = getattr(response, "headers", {}).get("retry-after")
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), 60.0)
+            except ValueError:
+                return None
+        exc = exc.__cause__
+    return None
+
+
+def _is_transient_llm_error(exc: BaseException) -> bool:
+    if isinstance(exc, LLMRateLimitError | LLMTransientError | TimeoutError | httpx.TransportError):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code == 429 or exc.response.status_code >= 500
+    return False
+
+
+def _llm_retry_wait(retry_state: RetryCallState) -> float:
+    """Honor the provider's Retry-After, otherwise back off with full jitter."""
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    retry_after = _retry_after_seconds(exc)
+    return retry_after if retry_after is not None else _LLM_BACKOFF(retry_state)
+
+
+# Streamed chunks are scanned with this much overlap so phrases split across chunks match
+_FORBIDDEN_OVERLAP = max(len(topic) for topic in FORBIDDEN_TOPICS) - 1
+
+
+def _with_disclaimer(text: str) -> str:
+    """Append the canonical disclaimer; idempotent, so no scan of the text is needed.
+
+    The script and description prompts tell the model not to write its own.
+    """
+    text = text.rstrip()
+    if text.endswith(_DISCLAIMER):
+        return text
+    return f"{text}\n\n{_DISCLAIMER}"
+
 
 @runtime_checkable
 class LLMClient(Protocol):
@@ -66,6 +161,9 @@ class FinancePipeline(ContentPipeline):
         youtube_uploader: YouTubeUploader,
         output_base: Path | None = None,
         llm_client: LLMClient | None = None,
+        llm_cache: LLMResponseCache | None = None,
+        artifact_cache: ArtifactCache | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         self.script_generator = script_generator
         self.tts_engine = tts_engine
@@ -77,6 +175,17 @@ class FinancePipeline(ContentPipeline):
         self.config: ChannelConfig = CHANNEL_CONFIGS[ChannelType.FINANCE]
         self.output_base = output_base or Path("data/output")
         self._llm_client = llm_client
+        # Optional capabilities are resolved once instead of probed on every call
+        self._llm_call = self._resolve_llm_call(llm_client, script_generator)
+        self._llm_stream = getattr(llm_client, "stream", None)
+        self._compose = getattr(video_composer, "compose", None)
+        self._upload = getattr(youtube_uploader, "upload", None)
+        self._llm_cache = llm_cache or LLMResponseCache(self.output_base / ".llm_cache.db")
+        self._llm_inflight: dict[str, asyncio.Task[str]] = {}
+        # Shapes concurrent batch traffic below provider rate limits
+        self._llm_semaphore = asyncio.Semaphore(self._cfg("llm_concurrency", 8))
+        self._artifacts = artifact_cache or ArtifactCache(self.output_base / ".artifacts")
+        self._http_client = http_client
 
     async def run(self, channel: ChannelType) -> VideoProject:
         """Run single video generation pipeline."""
@@ -84,7 +193,7 @@ class FinancePipeline(ContentPipeline):
         topic = await self._generate_topic()
         script = await self._build_script(topic)
         output_path = self.output_base / str(project_id)
-        output_path.mkdir(parents=True, exist_ok=True)
+        await asyncio.to_thread(output_path.mkdir, parents=True, exist_ok=True)
 
         project = VideoProject(
             id=project_id,
@@ -96,8 +205,7 @@ class FinancePipeline(ContentPipeline):
 
         try:
             self._validate_script(script)
-            audio_path = await self._generate_audio(output_path, script)
-            visuals = await self._generate_visuals(output_path, script)
+            audio_path, visuals = await self._generate_media(output_path, script)
             video_path = await self._compose_video(
                 project, output_path, audio_path, visuals, script
             )
@@ -111,54 +219,114 @@ class FinancePipeline(ContentPipeline):
             logger.error("finance_pipeline_failed project_id=%s error=%s", project_id, e)
             project.mark_failed(error=str(e))
             raise PipelineError(f"Finance pipeline failed: {e}") from e
+        finally:
+            await self._llm_cache.flush()
 
         return project
 
     async def run_batch(self, channel: ChannelType, count: int) -> AsyncIterator[VideoProject]:
         """Run batch video generation."""
         topics = await self._generate_topics_batch(count)
-        for topic in topics:
-            project_id = uuid.uuid4()
-            script = await self._build_script(topic)
-            output_path = self.output_base / str(project_id)
-            output_path.mkdir(parents=True, exist_ok=True)
+        semaphore = asyncio.Semaphore(self._cfg("batch_concurrency", 3))
+
+        # Tags only depend on the topic, so the whole batch is requested up front;
+        # per-project calls then hit the cache or join the in-flight request
+        prefetch = asyncio.create_task(
+            self._llm_generate_many([self._tags_prompt(topic) for topic in topics])
+        )
+
+        async def process(topic: dict[str, Any]) -> VideoProject:
+            async with semaphore:
+                return await self._run_batch_item(topic)
 
+        # Projects are independent; yield each one as soon as it finishes
+        tasks = [asyncio.create_task(process(topic)) for topic in topics]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    project = await next_done
+                except Exception as e:
+                    # One failed item never stops the projects still running
+                    logger.error("finance_batch_item_failed error=%s", e)
+                    continue
+                yield project
+        finally:
+            # Runs on every exit. After a normal finish this only flushes the cache;
+            # when the consumer closes the generator early it also stops the
+            # remaining work. Awaiting the tasks retrieves their outcomes so none
+            # is logged as "never retrieved"
+            prefetch.cancel()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(prefetch, *tasks, return_exceptions=True)
+            await self._llm_cache.flush()
+
+    async def _run_batch_item(self, topic: dict[str, Any]) -> VideoProject:
+        project_id = uuid.uuid4()
+        try:
+            script = await self._build_script(topic)
+        except Exception as e:
+            # A rejected or failed script only fails this item, not the whole batch
+            logger.error("finance_batch_item_failed project_id=%s error=%s", project_id, e)
             project = VideoProject(
                 id=project_id,
                 channel=ChannelType.FINANCE,
-                script=script,
-                output_path=output_path,
+                script=Script(
+                    title=topic.get("title", "Untitled"),
+                    hook="",
+                    body="",
+                    cta="",
+                    channel=ChannelType.FINANCE,
+                ),
             )
-            logger.info(
-                "finance_batch_item_start project_id=%s topic=%s", project_id, topic.get("title")
+            project.mark_failed(error=str(e))
+            return project
+
+        output_path = self.output_base / str(project_id)
+        await asyncio.to_thread(output_path.mkdir, parents=True, exist_ok=True)
+
+        project = VideoProject(
+            id=project_id,
+            channel=ChannelType.FINANCE,
+            script=script,
+            output_path=output_path,
+        )
+        logger.info(
+            "finance_batch_item_start project_id=%s topic=%s", project_id, topic.get("title")
+        )
+        try:
+            self._validate_script(script)
+            audio_path, visuals = await self._generate_media(output_path, script)
+            video_path = await self._compose_video(
+                project, output_path, audio_path, visuals, script
             )
-            try:
-                self._validate_script(script)
-                audio_path = await self._generate_audio(output_path, script)
-                visuals = await self._generate_visuals(output_path, script)
-                video_path = await self._compose_video(
-                    project, output_path, audio_path, visuals, script
-                )
-                thumbnails = await self._generate_thumbnails(output_path, topic)
-                await self._upload_video(project, video_path, thumbnails, script, topic)
-                project.mark_completed(output_path)
-            except Exception as e:
-                logger.error("finance_batch_item_failed project_id=%s error=%s", project_id, e)
-                project.mark_failed(error=str(e))
-            yield project
+            thumbnails = await self._generate_thumbnails(output_path, topic)
+            await self._upload_video(project, video_path, thumbnails, script, topic)
+            project.mark_completed(output_path)
+        except Exception as e:
+            logger.error("finance_batch_item_failed project_id=%s error=%s", project_id, e)
+            project.mark_failed(error=str(e))
+        return project
+
+    async def aclose(self) -> None:
+        """Close the HTTP client shared with this pipeline's generators."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
 
     # Topic generation
     async def _generate_topic(self) -> dict[str, Any]:
-        prompt = TOPIC_GENERATION.format(count=1)
-        response = await self._llm_generate(prompt)
+        # Title variants come back with the topic, saving a round-trip per video
+        prompt = _TOPIC_WITH_TITLES.format(count=1)
+        response = await self._llm_generate(prompt, cache=False)
         topics = self._parse_json_response(response)
         if not topics:
             raise PipelineError("No topics generated")
         return topics[0] if isinstance(topics, list) else topics
 
     async def _generate_topics_batch(self, count: int) -> list[dict[str, Any]]:
-        prompt = TOPIC_GENERATION.format(count=count)
-        response = await self._llm_generate(prompt)
+        prompt = _TOPIC_WITH_TITLES.format(count=count)
+        response = await self._llm_generate(prompt, cache=False)
         topics = self._parse_json_response(response)
         if not topics:
             raise PipelineError("No topics generated")
@@ -167,19 +335,20 @@ class FinancePipeline(ContentPipeline):
     # Script building
     async def _build_script(self, topic: dict[str, Any]) -> Script:
         duration = self._cfg("target_duration_minutes", 8)
-        prompt = SCRIPT_TEMPLATE.format(
+        prompt = _SCRIPT_TEMPLATE.format(
             duration_minutes=duration,
             topic=topic.get("title", ""),
             hook=topic.get("hook", ""),
             category=topic.get("category", "investing"),
         )
-        body = await self._llm_generate(prompt)
+        # Title variants only depend on the topic, so they are generated alongside the body
+        body, title_variants = await asyncio.gather(
+            self._generate_script_body(prompt), self._generate_title_variants(topic)
+        )
 
         # Ensure disclaimer is in script
-        if "educational purposes" not in body.lower():
-            body = body + "\n\n" + DISCLAIMER_TEXT.strip()
+        body = _with_disclaimer(body)
 
-        title_variants = await self._generate_title_variants(topic)
         title = title_variants[0] if title_variants else topic.get("title", "Untitled")
 
         return Script(
@@ -190,8 +359,47 @@ class FinancePipeline(ContentPipeline):
             channel=ChannelType.FINANCE,
         )
 
+    async def _generate_script_body(self, prompt: str) -> str:
+        """Stream the script body, aborting as soon as a forbidden topic appears.
+
+        Rejected scripts stop generating mid-stream instead of paying for the
+        full body before _validate_script rejects it.
+        """
+        stream = self._llm_stream
+        if stream is None or await self._llm_cache.get(prompt) is not None:
+            return await self._llm_generate(prompt)
+
+        # Same retry and rate shaping as _llm_generate_uncached; a forbidden
+        # topic is not transient, so it aborts without a retry
+        async for attempt in self._llm_retrying():
+            with attempt:
+                async with self._llm_semaphore:
+                    body = await self._stream_script_body(stream, prompt)
+        await self._llm_cache.put(prompt, body)
+        return body
+
+    @staticmethod
+    async def _stream_script_body(
+        stream: Callable[[str], AsyncGenerator[str, None]], prompt: str
+    ) -> str:
+        parts: list[str] = []
+        tail = ""
+        async with aclosing(stream(prompt)) as chunks:
+            async for chunk in chunks:
+                parts.append(chunk)
+                window = tail + chunk
+                forbidden = find_forbidden_topic(window)
+                if forbidden:
+                    raise PipelineError(f"Script contains forbidden topic: {forbidden}")
+                tail = window[-_FORBIDDEN_OVERLAP:]
+        return "".join(parts)
+
     async def _generate_title_variants(self, topic: dict[str, Any]) -> list[str]:
-        prompt = TITLE_OPTIMIZATION.format(
+        variants = topic.get("title_variants")
+        if isinstance(variants, list) and variants:
+            return variants
+
+        prompt = _TITLE_OPTIMIZATION.format(
             original_title=topic.get("title", ""),
             topic=topic.get("title", ""),
         )
@@ -204,49 +412,36 @@ class FinancePipeline(ContentPipeline):
 
     async def _generate_description(self, topic: dict[str, Any], script_content: str) -> str:
         key_points = script_content[:500].replace("\n", " ")
-        prompt = DESCRIPTION_TEMPLATE.format(
+        prompt = _DESCRIPTION_TEMPLATE.format(
             title=topic.get("title", ""),
             topic=topic.get("title", ""),
             key_points=key_points,
             keywords=", ".join(topic.get("keywords", [])),
         )
-        description = await self._llm_generate(prompt)
         # Always add disclaimer to description
-        if "educational purposes" not in description.lower():
-            description = description + "\n\n" + DISCLAIMER_TEXT.strip()
-        return description
+        return _with_disclaimer(await self._llm_generate(prompt))
 
     async def _generate_tags(self, topic: dict[str, Any]) -> list[str]:
-        prompt = TAGS_GENERATION.format(
+        response = await self._llm_generate(self._tags_prompt(topic))
+        return [tag.strip() for tag in response.split(",") if tag.strip()]
+
+    def _tags_prompt(self, topic: dict[str, Any]) -> str:
+        return _TAGS_GENERATION.format(
             title=topic.get("title", ""),
             category=topic.get("category", "finance"),
             keywords=", ".join(topic.get("keywords", [])),
         )
-        response = await self._llm_generate(prompt)
-        return [tag.strip() for tag in response.split(",") if tag.strip()]
 
     def _validate_script(self, script: Script) -> None:
         """Validate script content - extra strict for finance."""
-        content = script.body.lower()
-
-        # Check forbidden topics
-        for forbidden in FORBIDDEN_TOPICS:
-            if forbidden in content:
-                raise PipelineError(f"Script contains forbidden topic: {forbidden}")
+        # Both scans match case-insensitively, so the body is never lowercased
+        forbidden = find_forbidden_topic(script.body)
+        if forbidden:
+            raise PipelineError(f"Script contains forbidden topic: {forbidden}")
 
         # Finance-specific validation
-        red_flags = [
-            "guaranteed",
-            "100%",
-            "risk-free",
-            "can't lose",
-            "sure thing",
-            "secret method",
-            "millionaire overnight",
-        ]
-        for flag in red_flags:
-            if flag in content:
-                logger.warning("finance_script_warning: contains '%s' - review recommended", flag)
+        for flag in dict.fromkeys(f.lower() for f in _RED_FLAG_RE.findall(script.body)):
+            logger.warning("finance_script_warning: contains '%s' - review recommended", flag)
 
         # Word count validation (finance videos slightly shorter)
         wc = script.word_count
@@ -258,6 +453,18 @@ class FinancePipeline(ContentPipeline):
         if not script.title or len(script.title) > 100:
             raise PipelineError("Invalid title length")
 
+    async def _generate_media(self, output_path: Path, script: Script) -> tuple[Path, list[Path]]:
+        """Synthesize narration and scene visuals concurrently; both feed composition."""
+        audio = asyncio.ensure_future(self._generate_audio(output_path, script))
+        visuals = asyncio.ensure_future(self._generate_visuals(output_path, script))
+        try:
+            return await asyncio.gather(audio, visuals)
+        except BaseException:
+            # Don't keep paying for one stage once the other has failed
+            audio.cancel()
+            visuals.cancel()
+            raise
+
     # Audio generation
     async def _generate_audio(self, output_path: Path, script: Script) -> Path:
         clean_script = self._clean_script_for_tts(script.body)
@@ -272,38 +479,45 @@ class FinancePipeline(ContentPipeline):
 
     def _clean_script_for_tts(self, content: str) -> str:
         """Remove markers for TTS."""
-        content = re.sub(r"\[CONFIDENT\]", "", content)
-        content = re.sub(r"\[SERIOUS\]", "", content)
-        content = re.sub(r"\[ENCOURAGING\]", "", content)
-        content = re.sub(r"\[.*?\]", "", content)
-        return content.strip()
+        return _TTS_MARKER_RE.sub("", content).strip()
 
     # Visual generation
     async def _generate_visuals(self, output_path: Path, script: Script) -> list[Path]:
         scenes = self._extract_scenes(script)
-        visual_paths: list[Path] = []
+        # Scenes are independent; the semaphore respects provider rate limits
+        semaphore = asyncio.Semaphore(self._cfg("visual_concurrency", 4))
 
-        for i, scene in enumerate(scenes):
-            prompt = VISUAL_PROMPT_TEMPLATE.format(
+        async def make_scene(i: int, scene: dict[str, Any]) -> Path:
+            prompt = _VISUAL_PROMPT_TEMPLATE.format(
                 scene_description=scene["description"],
                 mood=scene.get("mood", "professional, trustworthy"),
                 timestamp=scene.get("timestamp", f"{i * 30}s"),
             )
             image_file = output_path / f"visual_{i:03d}.png"
-            await self.image_generator.generate(prompt=prompt, output_path=image_file)
-
             video_file = output_path / f"clip_{i:03d}.mp4"
             duration = scene.get("duration", 5)
-            await self._create_video_clip(image_file, video_file, duration)
-            visual_paths.append(video_file)
+            # Reruns and repeated scene descriptions reuse earlier media
+            image_key = ArtifactCache.key("image", prompt)
+            clip_key = ArtifactCache.key("clip", image_key, _MOTION_PROMPT, duration)
+            async with semaphore:
+                await self._artifacts.fetch(
+                    image_key,
+                    image_file,
+                    lambda: self.image_generator.generate(prompt=prompt, output_path=image_file),
+                )
+                await self._artifacts.fetch(
+                    clip_key,
+                    video_file,
+                    lambda: self._create_video_clip(image_file, video_file, duration),
+                )
+            return video_file
 
-        return visual_paths
+        return list(await asyncio.gather(*(make_scene(i, s) for i, s in enumerate(scenes))))
 
     async def _create_video_clip(self, image_path: Path, output_path: Path, duration: int) -> None:
-        motion_prompt = "professional slow zoom with subtle motion"
         await self.video_generator.generate_from_image(
             image_path=image_path,
-            motion_prompt=motion_prompt,
+            motion_prompt=_MOTION_PROMPT,
             duration=float(duration),
             output_path=output_path,
         )
@@ -317,9 +531,10 @@ class FinancePipeline(ContentPipeline):
 
         for i, para in enumerate(paragraphs):
             # Mood detection for finance content
-            if any(w in para.lower() for w in ["mistake", "wrong", "lose", "risk"]):
+            lowered = para.lower()
+            if _CAUTION_MOOD_RE.search(lowered):
                 mood = "serious, cautionary"
-            elif any(w in para.lower() for w in ["grow", "wealth", "success", "freedom"]):
+            elif _ASPIRATIONAL_MOOD_RE.search(lowered):
                 mood = "aspirational, optimistic"
             else:
                 mood = "professional, educational"
@@ -344,22 +559,29 @@ class FinancePipeline(ContentPipeline):
         script: Script,
     ) -> Path:
         video_file = output_path / "final.mp4"
-        composer = self.video_composer
-        if hasattr(composer, "compose"):
-            await composer.compose(project=project, output_path=video_file)
+        if self._compose is not None:
+            await self._compose(project=project, output_path=video_file)
         return video_file
 
     # Thumbnail generation
     async def _generate_thumbnails(self, output_path: Path, topic: dict[str, Any]) -> list[Path]:
-        thumbnails: list[Path] = []
-        for variant in range(3):
-            thumb_file = output_path / f"thumbnail_{variant}.png"
-            await self.thumbnail_generator.generate(
-                title=topic.get("title", "")[:40],
-                channel=ChannelType.FINANCE,
-                output_path=thumb_file,
+        title = topic.get("title", "")[:40]
+        thumbnails = [output_path / f"thumbnail_{variant}.png" for variant in range(3)]
+        await asyncio.gather(
+            *(
+                self._artifacts.fetch(
+                    ArtifactCache.key("thumbnail", title, ChannelType.FINANCE, variant),
+                    thumb_file,
+                    partial(
+                        self.thumbnail_generator.generate,
+                        title=title,
+                        channel=ChannelType.FINANCE,
+                        output_path=thumb_file,
+                    ),
+                )
+                for variant, thumb_file in enumerate(thumbnails)
             )
-            thumbnails.append(thumb_file)
+        )
         return thumbnails
 
     # Upload
@@ -373,12 +595,12 @@ class FinancePipeline(ContentPipeline):
     ) -> None:
         offset_hours = self._cfg("schedule_offset_hours", 24)
         schedule_time = datetime.now(UTC) + timedelta(hours=offset_hours)
-        description = await self._generate_description(topic, script.body)
-        tags = await self._generate_tags(topic)
+        description, tags = await asyncio.gather(
+            self._generate_description(topic, script.body), self._generate_tags(topic)
+        )
 
-        uploader = self.youtube_uploader
-        if hasattr(uploader, "upload"):
-            await uploader.upload(
+        if self._upload is not None:
+            await self._upload(
                 video_path=video_path,
                 title=script.title,
                 description=description,
@@ -389,25 +611,64 @@ class FinancePipeline(ContentPipeline):
         logger.info("finance_video_uploaded project_id=%s", project.id)
 
     # Helpers
-    async def _llm_generate(self, prompt: str) -> str:
-        if self._llm_client is not None:
-            return await self._llm_client.generate(prompt)
-        gen = self.script_generator
-        llm_generate = getattr(gen, "_llm_generate", None)
+    async def _llm_generate(self, prompt: str, cache: bool = True) -> str:
+        """Generate raw text, reusing cached responses for identical prompts.
+
+        Concurrent callers with the same cacheable prompt share one request.
+        Topic prompts pass cache=False: they are identical on every run and
+        must yield fresh topics.
+        """
+        if not cache:
+            return await self._llm_generate_uncached(prompt)
+        if (cached := await self._llm_cache.get(prompt)) is not None:
+            return cached
+
+        task = self._llm_inflight.get(prompt)
+        if task is None:
+            task = asyncio.ensure_future(self._llm_generate_uncached(prompt))
+            self._llm_inflight[prompt] = task
+            task.add_done_callback(lambda _: self._llm_inflight.pop(prompt, None))
+        # Shielded so one cancelled caller does not cancel the shared request
+        response = await asyncio.shield(task)
+        await self._llm_cache.put(prompt, response)
+        return response
+
+    async def _llm_generate_many(self, prompts: list[str]) -> list[str | BaseException]:
+        """Generate cacheable prompts concurrently; failures are returned, not raised."""
+        return await asyncio.gather(
+            *(self._llm_generate(prompt) for prompt in prompts), return_exceptions=True
+        )
+
+    async def _llm_generate_uncached(self, prompt: str) -> str:
+        async for attempt in self._llm_retrying():
+            with attempt:
+                async with self._llm_semaphore:
+                    result = await self._llm_call(prompt)
+        if not isinstance(result, str):
+            raise PipelineError("LLM returned a non-text response")
+        return result
+
+    @staticmethod
+    def _llm_retrying() -> AsyncRetrying:
+        return AsyncRetrying(
+            stop=stop_after_attempt(5),
+            wait=_llm_retry_wait,
+            retry=retry_if_exception(_is_transient_llm_error),
+            reraise=True,
+        )
+
+    @staticmethod
+    def _resolve_llm_call(
+        llm_client: LLMClient | None, script_generator: ScriptGenerator
+    ) -> Callable[[str], Awaitable[str]]:
+        if llm_client is not None:
+            return llm_client.generate
+        llm_generate = getattr(script_generator, "_llm_generate", None)
         if callable(llm_generate):
-            maybe_result = llm_generate(prompt)
-            if isinstance(maybe_result, Awaitable):
-                result = await maybe_result
-                if isinstance(result, str):
-                    return result
-        client = getattr(gen, "client", None)
-        client_generate = getattr(client, "generate", None)
+            return llm_generate
+        client_generate = getattr(getattr(script_generator, "client", None), "generate", None)
         if callable(client_generate):
-            maybe_result = client_generate(prompt)
-            if isinstance(maybe_result, Awaitable):
-                result = await maybe_result
-                if isinstance(result, str):
-                    return result
+            return client_generate
         raise PipelineError("No LLM client available for raw text generation")
 
     def _cfg(self, key: str, default: Any) -> Any:
@@ -417,16 +678,16 @@ class FinancePipeline(ContentPipeline):
 
     def _parse_json_response(self, response: str) -> list[Any] | dict[str, Any]:
         response = response.strip()
-        json_match = re.search(r"```(?:json)?\s*([\s\S]*?)```", response)
+        json_match = _JSON_FENCE_RE.search(response)
         if json_match:
             response = json_match.group(1).strip()
         try:
             return json.loads(response)
         except json.JSONDecodeError:
-            array_match = re.search(r"\[[\s\S]*\]", response)
+            array_match = _JSON_ARRAY_RE.search(response)
             if array_match:
                 return json.loads(array_match.group())
-            obj_match = re.search(r"\{[\s\S]*\}", response)
+            obj_match = _JSON_OBJECT_RE.search(response)
             if obj_match:
                 return json.loads(obj_match.group())
             raise PipelineError(f"Failed to parse JSON: {response[:100]}")
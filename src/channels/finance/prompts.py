@@ -1,5 +1,7 @@
 """Finance channel prompt templates."""
 
+import re
+
 FORBIDDEN_TOPICS = frozenset(
     [
         "get rich quick",
@@ -19,6 +21,19 @@ FORBIDDEN_TOPICS = frozenset(
     ]
 )
 
+# All forbidden phrases as one alternation so scripts are scanned in a single pass
+_FORBIDDEN_PATTERN = re.compile(
+    "|".join(re.escape(topic) for topic in sorted(FORBIDDEN_TOPICS, key=len, reverse=True)),
+    re.IGNORECASE,
+)
+
+
+def find_forbidden_topic(text: str) -> str | None:
+    """Return the first forbidden topic mentioned in text, if any."""
+    match = _FORBIDDEN_PATTERN.search(text)
+    return match.group().lower() if match else None
+
+
 TOPIC_GENERATION = """You are a content strategist for a wealth-building educational YouTube channel.
 Generate {count} unique, viral-worthy personal finance/investing video topics.
 
@@ -44,6 +59,41 @@ FORMAT (JSON array):
 
 Generate exactly {count} topics. Output ONLY valid JSON."""
 
+TOPIC_WITH_TITLES = """You are a content strategist for a wealth-building educational YouTube channel.
+Generate {count} unique, viral-worthy personal finance/investing video topics, each with
+optimized title variants.
+
+REQUIREMENTS:
+- Topics must be educational and actionable for viewers
+- Mix categories: investing, passive income, stock market, real estate, crypto basics, financial independence
+- Each topic should have mass appeal (millions of potential viewers interested in wealth building)
+- Include trending angles: "How the wealthy...", "The truth about...", "Why most people fail at..."
+- Avoid get-rich-quick schemes, guaranteed returns claims, or specific financial advice
+- Focus on principles, mindset, and general strategies
+
+TITLE VARIANTS (5 per topic, one per formula):
+1. INSIDER KNOWLEDGE: "What Banks Don't Want You to Know About [Topic]"
+2. WEALTH CONTRAST: "Why the Rich [Do This] While Everyone Else [Does That]"
+3. NUMBERS HOOK: "The [Dollar Amount] Rule That Changed My Financial Life"
+4. MISTAKE AVOIDANCE: "[Number] [Topic] Mistakes That Keep You Poor"
+5. TRANSFORMATION: "How I Went From [State A] to [State B] With [Strategy]"
+- Under 60 characters, truthful, no misleading claims about returns or guarantees
+
+FORMAT (JSON array):
+[
+  {{
+    "title": "Hook-style title (under 60 chars)",
+    "hook": "Opening statement that creates immediate curiosity about money",
+    "category": "investing|passive_income|stock_market|real_estate|crypto|financial_independence|budgeting|side_hustles",
+    "viral_potential": 1-10,
+    "keywords": ["keyword1", "keyword2", "keyword3"],
+    "target_audience": "beginners|intermediate|advanced",
+    "title_variants": ["variant1", "variant2", "variant3", "variant4", "variant5"]
+  }}
+]
+
+Generate exactly {count} topics. Output ONLY valid JSON."""
+
 SCRIPT_TEMPLATE = """You are an elite financial content writer for a faceless YouTube wealth education channel.
 Write a compelling {duration_minutes}-minute script on: {topic}
 
@@ -62,7 +112,8 @@ STYLE RULES:
 - Include comparisons: "$100/month for 30 years at 10% becomes..."
 - Emotional markers: [CONFIDENT], [SERIOUS], [ENCOURAGING] for TTS guidance
 - Target: 1,200-1,500 words (approx 8 min at 160 WPM)
-- CRITICAL: Include disclaimer language - this is education, not financial advice
+- CRITICAL: This is education, not financial advice. Do NOT write a disclaimer - the
+  standard disclaimer is appended automatically
 
 FORBIDDEN CONTENT (will cause rejection):
 - Specific stock picks or "buy this now" recommendations
@@ -76,8 +127,6 @@ TOPIC: {topic}
 HOOK SUGGESTION: {hook}
 CATEGORY: {category}
 
-Include a brief disclaimer: "This is for educational purposes only and not financial advice. Always consult a qualified financial advisor."
-
 Output the script directly. No meta-commentary."""
 
 VISUAL_PROMPT_TEMPLATE = """Create a professional, wealth-themed visual for a finance YouTube video.
@@ -161,21 +210,20 @@ KEY POINTS: {key_points}
 FORMAT:
 Line 1-2: Hook expanding on title, promise of value
 Line 3: Empty
-Line 4: DISCLAIMER: "This video is for educational purposes only and not financial advice."
-Line 5: Empty
-Line 6-10: What viewers will learn (bullet points)
+Line 4-8: What viewers will learn (bullet points)
+Line 9: Empty
+Line 10: Engagement CTA ("What's your biggest money challenge? Comment below!")
 Line 11: Empty
-Line 12: Engagement CTA ("What's your biggest money challenge? Comment below!")
-Line 13: Empty
-Line 14-19: Timestamps
-Line 20: Empty
-Line 21-23: Resources mentioned (books, tools - no affiliate links placeholder)
-Line 24: Empty
-Line 25-28: Related video suggestions + subscribe reminder
+Line 12-17: Timestamps
+Line 18: Empty
+Line 19-21: Resources mentioned (books, tools - no affiliate links placeholder)
+Line 22: Empty
+Line 23-26: Related video suggestions + subscribe reminder
 
 KEYWORDS TO INCLUDE: {keywords}
 
-NO hashtags in main body. Max 3 hashtags at the very end (#finance #investing #wealthbuilding)."""
+NO hashtags in main body. Max 3 hashtags at the very end (#finance #investing #wealthbuilding).
+Do NOT write a disclaimer - the standard disclaimer is appended automatically."""
 
 TAGS_GENERATION = """Generate YouTube tags for this finance education video.
 
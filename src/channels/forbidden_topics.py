@@ -0,0 +1,40 @@
+"""Word-start forbidden-topic matching for channel prompt modules."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Mapping
+
+
+class ForbiddenTopicMatcher:
+    """Finds forbidden topics in one case-insensitive pass over the raw text.
+
+    A topic matches from the start of a word, with its words joined by a
+    hyphen, a space or nothing ("selfharm"), followed by any word suffix
+    ("snuffed", "self-harming"). ``stems`` maps a topic to the text matched
+    in its place, e.g. "suicid" so "suicidal" is caught as "suicide".
+    """
+
+    __slots__ = ("_order", "_pattern")
+
+    def __init__(self, topics: Iterable[str], stems: Mapping[str, str] | None = None) -> None:
+        stems = stems or {}
+        # Longer phrases first, then alphabetical so results don't depend on set order
+        self._order = sorted(topics, key=lambda topic: (-len(topic), topic))
+        # One capture group per topic, so a match maps back to its canonical name
+        self._pattern = re.compile(
+            "|".join(f"({_topic_pattern(stems.get(topic, topic))})" for topic in self._order),
+            re.IGNORECASE,
+        )
+
+    def find(self, text: str) -> str | None:
+        """Return the first forbidden topic mentioned in text, if any."""
+        match = self._pattern.search(text)
+        if match is None or match.lastindex is None:
+            return None
+        return self._order[match.lastindex - 1]
+
+
+def _topic_pattern(topic: str) -> str:
+    words = re.split(r"[\s-]+", topic)
+    return r"\b" + r"[\s-]?".join(map(re.escape, words)) + r"\w*"
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+from functools import cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from src.channels.horror.pipeline import HorrorPipeline
 from src.channels.horror.prompts import (
+    DESCRIPTION_AND_TAGS_TEMPLATE,
     DESCRIPTION_TEMPLATE,
     FORBIDDEN_TOPICS,
     SCRIPT_TEMPLATE,
@@ -15,12 +17,14 @@ from src.channels.horror.prompts import (
     TITLE_OPTIMIZATION,
     TOPIC_GENERATION,
     VISUAL_PROMPT_TEMPLATE,
+    find_forbidden_topic,
 )
 
 if TYPE_CHECKING:
     pass
 
 
+@cache
 def create_pipeline(output_base: Path | None = None) -> HorrorPipeline:
     from src.services import (
         ImageGenerator,
@@ -50,6 +54,7 @@ __all__ = [
     "HorrorPipeline",
     "create_pipeline",
     "FORBIDDEN_TOPICS",
+    "find_forbidden_topic",
     "TOPIC_GENERATION",
     "SCRIPT_TEMPLATE",
     "VISUAL_PROMPT_TEMPLATE",
@@ -57,4 +62,5 @@ __all__ = [
     "TITLE_OPTIMIZATION",
     "DESCRIPTION_TEMPLATE",
     "TAGS_GENERATION",
+    "DESCRIPTION_AND_TAGS_TEMPLATE",
 ]
@@ -2,24 +2,37 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import os
 import re
+import time
 import uuid
 from collections.abc import AsyncIterator, Awaitable
+from dataclasses import fields
 from datetime import UTC, datetime, timedelta
 from logging import getLogger
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 from src.channels.horror.prompts import (
-    DESCRIPTION_TEMPLATE,
-    FORBIDDEN_TOPICS,
-    SCRIPT_TEMPLATE,
-    TAGS_GENERATION,
-    TITLE_OPTIMIZATION,
-    TOPIC_GENERATION,
+    DESCRIPTION_AND_TAGS_DYNAMIC,
+    DESCRIPTION_AND_TAGS_STATIC,
+    DESCRIPTION_TEMPLATE_DYNAMIC,
+    DESCRIPTION_TEMPLATE_STATIC,
+    SCRIPT_TEMPLATE_DYNAMIC,
+    SCRIPT_TEMPLATE_STATIC,
+    TAGS_GENERATION_DYNAMIC,
+    TAGS_GENERATION_STATIC,
+    TITLE_OPTIMIZATION_DYNAMIC,
+    TITLE_OPTIMIZATION_STATIC,
+    TOPIC_GENERATION_DYNAMIC,
+    TOPIC_GENERATION_STATIC,
     VISUAL_PROMPT_TEMPLATE,
+    find_forbidden_topic,
 )
+from src.channels.llm_cache import LLMResponseCache
+from src.channels.prompt_template import PromptTemplate
 from src.core.exceptions import PipelineError
 from src.core.interfaces import ContentPipeline
 from src.core.models import (
@@ -43,12 +56,52 @@ if TYPE_CHECKING:
 
 logger = getLogger(__name__)
 
+# Any bracketed marker ([WHISPER], [INTENSE], [SLOW], ...) is stripped in one pass
+_TTS_MARKER_RE = re.compile(r"\[.*?\]")
+# Scene mood keywords, matched against already-lowered paragraphs
+_INTENSE_MOOD_RE = re.compile("terror|scream|fear")
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*([\s\S]*?)```")
+
+# LLM prompts by template id: a static system prefix, sent verbatim so the
+# provider can cache it, and a pre-parsed template for the per-call values
+_TEMPLATES: dict[str, tuple[str, PromptTemplate]] = {
+    "topic": (TOPIC_GENERATION_STATIC, PromptTemplate(TOPIC_GENERATION_DYNAMIC)),
+    "script": (SCRIPT_TEMPLATE_STATIC, PromptTemplate(SCRIPT_TEMPLATE_DYNAMIC)),
+    "title": (TITLE_OPTIMIZATION_STATIC, PromptTemplate(TITLE_OPTIMIZATION_DYNAMIC)),
+    "description_and_tags": (
+        DESCRIPTION_AND_TAGS_STATIC,
+        PromptTemplate(DESCRIPTION_AND_TAGS_DYNAMIC),
+    ),
+    # Plain-text fallbacks for when the merged reply cannot be used
+    "description": (DESCRIPTION_TEMPLATE_STATIC, PromptTemplate(DESCRIPTION_TEMPLATE_DYNAMIC)),
+    "tags": (TAGS_GENERATION_STATIC, PromptTemplate(TAGS_GENERATION_DYNAMIC)),
+}
+
+
+def _new_project_id() -> tuple[uuid.UUID, str]:
+    """Return a time-ordered UUIDv7 and its string form.
+
+    Ids sort by creation time, so project directories are created in
+    order, and the string is built once for paths and logs.
+    """
+    ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10))
+    value = (
+        (ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | (rand >> 68) << 64
+        | 0b10 << 62
+        | rand & ((1 << 62) - 1)
+    )
+    project_id = uuid.UUID(int=value)
+    return project_id, str(project_id)
+
 
 @runtime_checkable
 class LLMClient(Protocol):
     """Protocol for raw LLM text generation."""
 
-    async def generate(self, prompt: str) -> str: ...
+    async def generate(self, prompt: str, system: str | None = None) -> str: ...
 
 
 class HorrorPipeline(ContentPipeline):
@@ -65,6 +118,7 @@ class HorrorPipeline(ContentPipeline):
         youtube_uploader: YouTubeUploader,
         output_base: Path | None = None,
         llm_client: LLMClient | None = None,
+        llm_cache: LLMResponseCache | None = None,
     ) -> None:
         self.script_generator = script_generator
         self.tts_engine = tts_engine
@@ -74,15 +128,27 @@ class HorrorPipeline(ContentPipeline):
         self.thumbnail_generator = thumbnail_generator
         self.youtube_uploader = youtube_uploader
         self.config: ChannelConfig = CHANNEL_CONFIGS[ChannelType.HORROR]
+        # Settings are read on every stage, so they are snapshotted into a flat dict once
+        self._settings: dict[str, Any] = (
+            dict(self.config)
+            if isinstance(self.config, dict)
+            else {f.name: getattr(self.config, f.name) for f in fields(self.config)}
+        )
         self.output_base = output_base or Path("data/output")
         self._llm_client = llm_client
+        self._llm_cache = llm_cache or LLMResponseCache(
+            self.output_base / ".llm_cache.db",
+            ttl=self._cfg("llm_cache_ttl_hours", 168) * 3600,
+        )
+        # Caps concurrent LLM requests while batch items are prepared together
+        self._llm_semaphore = asyncio.Semaphore(self._cfg("llm_concurrency", 8))
 
     async def run(self, channel: ChannelType) -> VideoProject:
-        project_id = uuid.uuid4()
+        project_id, pid_str = _new_project_id()
         topic = await self._generate_topic()
         script = await self._build_script(topic)
-        output_path = self.output_base / str(project_id)
-        output_path.mkdir(parents=True, exist_ok=True)
+        output_path = self.output_base / pid_str
+        await asyncio.to_thread(output_path.mkdir, parents=True, exist_ok=True)
 
         project = VideoProject(
             id=project_id,
@@ -90,71 +156,137 @@ class HorrorPipeline(ContentPipeline):
             script=script,
             output_path=output_path,
         )
-        logger.info("pipeline_start project_id=%s", project_id)
+        logger.info("pipeline_start project_id=%s", pid_str)
 
         try:
             self._validate_script(script)
             audio_path = await self._generate_audio(output_path, script)
             visuals = await self._generate_visuals(output_path, script)
-            video_path = await self._compose_video(
-                project, output_path, audio_path, visuals, script
+            video_path, thumbnails, metadata = await self._compose_with_extras(
+                project, output_path, audio_path, visuals, script, topic
             )
-            thumbnails = await self._generate_thumbnails(output_path, topic)
-            await self._upload_video(project, video_path, thumbnails, script, topic)
+            await self._upload_video(project, video_path, thumbnails, script, topic, metadata)
             video_file = output_path / "final.mp4"
             project.mark_completed(output_path=video_file)
-            logger.info("pipeline_complete project_id=%s", project_id)
+            logger.info("pipeline_complete project_id=%s", pid_str)
         except PipelineError:
             raise
         except Exception as e:
-            logger.error("pipeline_failed project_id=%s error=%s", project_id, e)
+            logger.error("pipeline_failed project_id=%s error=%s", pid_str, e)
             project.mark_failed(error=str(e))
             raise PipelineError(f"Horror pipeline failed: {e}") from e
+        finally:
+            await self._llm_cache.flush()
 
         return project
 
     async def run_batch(self, channel: ChannelType, count: int) -> AsyncIterator[VideoProject]:
         topics = await self._generate_topics_batch(count)
-        for topic in topics:
-            project_id = uuid.uuid4()
-            script = await self._build_script(topic)
-            output_path = self.output_base / str(project_id)
-            output_path.mkdir(parents=True, exist_ok=True)
-
-            project = VideoProject(
-                id=project_id,
-                channel=ChannelType.HORROR,
-                script=script,
-                output_path=output_path,
-            )
-            logger.info("batch_item_start project_id=%s topic=%s", project_id, topic.get("title"))
+        semaphore = asyncio.Semaphore(self._cfg("batch_concurrency", 3))
+        # Finished or failed projects in completion order
+        done: asyncio.Queue[VideoProject] = asyncio.Queue(maxsize=len(topics))
+
+        async def produce(topic: dict[str, Any]) -> None:
             try:
-                self._validate_script(script)
-                audio_path = await self._generate_audio(output_path, script)
-                visuals = await self._generate_visuals(output_path, script)
-                video_path = await self._compose_video(
-                    project, output_path, audio_path, visuals, script
-                )
-                thumbnails = await self._generate_thumbnails(output_path, topic)
-                await self._upload_video(project, video_path, thumbnails, script, topic)
-                video_file = output_path / "final.mp4"
-                project.mark_completed(output_path=video_file)
+                # LLM work for every item overlaps (bounded by llm_concurrency);
+                # media generation is bounded separately by batch_concurrency
+                script, metadata = await self._prepare(topic)
+                async with semaphore:
+                    project = await self._run_batch_item(topic, script, metadata)
             except Exception as e:
-                logger.error("batch_item_failed project_id=%s error=%s", project_id, e)
-                project.mark_failed(error=str(e))
-            yield project
+                project = self._failed_batch_item(topic, e)
+            await done.put(project)
+
+        tasks = [asyncio.create_task(produce(topic)) for topic in topics]
+        try:
+            for _ in tasks:
+                yield await done.get()
+        finally:
+            # Runs on every exit. After a normal finish this only flushes the cache;
+            # when the consumer closes the generator early it also stops the
+            # remaining work
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self._llm_cache.flush()
+
+    def _failed_batch_item(self, topic: dict[str, Any], error: Exception) -> VideoProject:
+        """A failed project for an item whose script could not be produced."""
+        project_id, pid_str = _new_project_id()
+        logger.error("batch_item_failed project_id=%s error=%s", pid_str, error)
+        project = VideoProject(
+            id=project_id,
+            channel=ChannelType.HORROR,
+            script=Script(
+                title=topic.get("title", "Untitled"),
+                hook="",
+                body="",
+                cta="",
+                channel=ChannelType.HORROR,
+            ),
+        )
+        project.mark_failed(error=str(error))
+        return project
+
+    async def _prepare(
+        self, topic: dict[str, Any]
+    ) -> tuple[Script, tuple[str, list[str]] | Exception]:
+        """Generate the script, then its description and tags.
+
+        A description/tag failure is returned in place so it only fails its
+        own project; a script failure is raised and fails just this item.
+        """
+        script = await self._build_script(topic)
+        try:
+            metadata = await self._generate_description_and_tags(topic, script.body)
+        except Exception as e:
+            return script, e
+        return script, metadata
+
+    async def _run_batch_item(
+        self,
+        topic: dict[str, Any],
+        script: Script,
+        metadata: tuple[str, list[str]] | Exception,
+    ) -> VideoProject:
+        project_id, pid_str = _new_project_id()
+        output_path = self.output_base / pid_str
+        await asyncio.to_thread(output_path.mkdir, parents=True, exist_ok=True)
+
+        project = VideoProject(
+            id=project_id,
+            channel=ChannelType.HORROR,
+            script=script,
+            output_path=output_path,
+        )
+        logger.info("batch_item_start project_id=%s topic=%s", pid_str, topic.get("title"))
+        try:
+            self._validate_script(script)
+            if isinstance(metadata, Exception):
+                raise metadata
+            audio_path = await self._generate_audio(output_path, script)
+            visuals = await self._generate_visuals(output_path, script)
+            video_path, thumbnails, metadata = await self._compose_with_extras(
+                project, output_path, audio_path, visuals, script, topic, metadata
+            )
+            await self._upload_video(project, video_path, thumbnails, script, topic, metadata)
+            video_file = output_path / "final.mp4"
+            project.mark_completed(output_path=video_file)
+        except Exception as e:
+            logger.error("batch_item_failed project_id=%s error=%s", pid_str, e)
+            project.mark_failed(error=str(e))
+        return project
 
     async def _generate_topic(self) -> dict[str, Any]:
-        prompt = TOPIC_GENERATION.format(count=1)
-        response = await self._llm_generate(prompt)
+        # Topic prompts are identical on every run and must yield fresh topics
+        response = await self._llm_call("topic", cache=False, count=1)
         topics = self._parse_json_response(response)
         if not topics:
             raise PipelineError("No topics generated")
         return topics[0] if isinstance(topics, list) else topics
 
     async def _generate_topics_batch(self, count: int) -> list[dict[str, Any]]:
-        prompt = TOPIC_GENERATION.format(count=count)
-        response = await self._llm_generate(prompt)
+        response = await self._llm_call("topic", cache=False, count=count)
         topics = self._parse_json_response(response)
         if not topics:
             raise PipelineError("No topics generated")
@@ -162,13 +294,13 @@ class HorrorPipeline(ContentPipeline):
 
     async def _build_script(self, topic: dict[str, Any]) -> Script:
         duration = self._cfg("target_duration_minutes", 9)
-        prompt = SCRIPT_TEMPLATE.format(
+        body = await self._llm_call(
+            "script",
             duration_minutes=duration,
             topic=topic.get("title", ""),
             hook=topic.get("hook", ""),
             category=topic.get("category", "mystery"),
         )
-        body = await self._llm_generate(prompt)
         title_variants = await self._generate_title_variants(topic)
         title = title_variants[0] if title_variants else topic.get("title", "Untitled")
 
@@ -181,41 +313,58 @@ class HorrorPipeline(ContentPipeline):
         )
 
     async def _generate_title_variants(self, topic: dict[str, Any]) -> list[str]:
-        prompt = TITLE_OPTIMIZATION.format(
-            original_title=topic.get("title", ""),
-            topic=topic.get("title", ""),
-        )
         try:
-            response = await self._llm_generate(prompt)
-            variants = self._parse_json_response(response)
+            variants = await self._llm_call_json(
+                "title",
+                original_title=topic.get("title", ""),
+                topic=topic.get("title", ""),
+            )
             return variants if isinstance(variants, list) else [topic.get("title", "Untitled")]
         except Exception:
             return [topic.get("title", "Untitled")]
 
-    async def _generate_description(self, topic: dict[str, Any], script_content: str) -> str:
-        key_points = script_content[:500].replace("\n", " ")
-        prompt = DESCRIPTION_TEMPLATE.format(
-            title=topic.get("title", ""),
-            topic=topic.get("title", ""),
-            key_points=key_points,
-            keywords=", ".join(topic.get("keywords", [])),
-        )
-        return await self._llm_generate(prompt)
+    async def _generate_description_and_tags(
+        self, topic: dict[str, Any], script_content: str
+    ) -> tuple[str, list[str]]:
+        """Generate the description and tags in one call; they share the same context.
 
-    async def _generate_tags(self, topic: dict[str, Any]) -> list[str]:
-        prompt = TAGS_GENERATION.format(
-            title=topic.get("title", ""),
-            category=topic.get("category", "horror"),
-            keywords=", ".join(topic.get("keywords", [])),
+        A reply without a usable description falls back to the separate
+        plain-text description and comma-separated tags prompts.
+        """
+        title = topic.get("title", "")
+        category = topic.get("category", "horror")
+        key_points = script_content[:500].replace("\n", " ")
+        keywords = ", ".join(topic.get("keywords", []))
+        try:
+            data = await self._llm_call_json(
+                "description_and_tags",
+                title=title,
+                topic=title,
+                category=category,
+                key_points=key_points,
+                keywords=keywords,
+            )
+        except PipelineError:
+            data = None
+        if isinstance(data, dict) and isinstance(data.get("description"), str):
+            tags = data.get("tags", [])
+            if isinstance(tags, str):
+                tags = tags.split(",")
+            return data["description"], [str(tag).strip() for tag in tags if str(tag).strip()]
+
+        logger.warning("description_tags_fallback title=%s", title)
+        description, tags_text = await asyncio.gather(
+            self._llm_call(
+                "description", title=title, topic=title, key_points=key_points, keywords=keywords
+            ),
+            self._llm_call("tags", title=title, category=category, keywords=keywords),
         )
-        response = await self._llm_generate(prompt)
-        return [tag.strip() for tag in response.split(",") if tag.strip()]
+        return description, [tag.strip() for tag in tags_text.split(",") if tag.strip()]
 
     def _validate_script(self, script: Script) -> None:
-        content = script.body.lower()
-        for forbidden in FORBIDDEN_TOPICS:
-            if forbidden in content:
-                raise PipelineError(f"Script contains forbidden topic: {forbidden}")
+        forbidden = find_forbidden_topic(script.body)
+        if forbidden:
+            raise PipelineError(f"Script contains forbidden topic: {forbidden}")
 
         wc = script.word_count
         if wc < 1200:
@@ -238,31 +387,30 @@ class HorrorPipeline(ContentPipeline):
         return audio_file
 
     def _clean_script_for_tts(self, content: str) -> str:
-        content = re.sub(r"\[WHISPER\]", "", content)
-        content = re.sub(r"\[INTENSE\]", "", content)
-        content = re.sub(r"\[SLOW\]", "", content)
-        content = re.sub(r"\[.*?\]", "", content)
-        return content.strip()
+        return _TTS_MARKER_RE.sub("", content).strip()
 
     async def _generate_visuals(self, output_path: Path, script: Script) -> list[Path]:
         scenes = self._extract_scenes(script)
-        visual_paths: list[Path] = []
+        # Scenes are independent; the semaphore respects provider rate limits
+        semaphore = asyncio.Semaphore(self._cfg("max_concurrent_visuals", 6))
+        visual_paths: list[Path | None] = [None] * len(scenes)
 
-        for i, scene in enumerate(scenes):
+        async def make_scene(i: int, scene: dict[str, Any]) -> None:
             prompt = VISUAL_PROMPT_TEMPLATE.format(
                 scene_description=scene["description"],
                 mood=scene.get("mood", "dark, ominous"),
                 timestamp=scene.get("timestamp", f"{i * 30}s"),
             )
             image_file = output_path / f"visual_{i:03d}.png"
-            await self.image_generator.generate(prompt=prompt, output_path=image_file)
-
             video_file = output_path / f"clip_{i:03d}.mp4"
             duration = scene.get("duration", 5)
-            await self._create_video_clip(image_file, video_file, duration)
-            visual_paths.append(video_file)
+            async with semaphore:
+                await self.image_generator.generate(prompt=prompt, output_path=image_file)
+                await self._create_video_clip(image_file, video_file, duration)
+            visual_paths[i] = video_file
 
-        return visual_paths
+        await asyncio.gather(*(make_scene(i, s) for i, s in enumerate(scenes)))
+        return [path for path in visual_paths if path is not None]
 
     async def _create_video_clip(self, image_path: Path, output_path: Path, duration: int) -> None:
         motion_prompt = "slow zoom in with subtle ambient motion"
@@ -271,29 +419,69 @@ class HorrorPipeline(ContentPipeline):
             motion_prompt=motion_prompt,
             duration=float(duration),
             output_path=output_path,
+            hw_accel=self._cfg("encoder", "h264_nvenc").endswith("_nvenc"),
         )
 
     def _extract_scenes(self, script: Script) -> list[dict[str, Any]]:
-        paragraphs = [p.strip() for p in script.body.split("\n\n") if p.strip()]
+        # Lowercasing never adds or removes newlines, so both splits line up and
+        # moods are matched against the script's cached lowered body
+        paragraphs = [
+            (para, para_lower)
+            for para, para_lower in zip(
+                script.body.split("\n\n"), script.body_lower.split("\n\n"), strict=True
+            )
+            if para.strip()
+        ]
         scenes: list[dict[str, Any]] = []
         est_dur = (script.word_count / 160) * 60
         dur_per = est_dur / max(len(paragraphs), 1)
+        duration = max(3, min(10, int(dur_per)))
 
-        for i, para in enumerate(paragraphs):
-            mood = (
-                "intense"
-                if any(w in para.lower() for w in ["terror", "scream", "fear"])
-                else "ominous"
-            )
+        # Only the first 20 scenes are used, so later paragraphs are never classified
+        for i, (para, para_lower) in enumerate(paragraphs[:20]):
+            mood = "intense" if _INTENSE_MOOD_RE.search(para_lower) else "ominous"
             scenes.append(
                 {
-                    "description": para[:200],
+                    "description": para.strip()[:200],
                     "mood": mood,
                     "timestamp": f"{int(i * dur_per)}s",
-                    "duration": max(3, min(10, int(dur_per))),
+                    "duration": duration,
                 }
             )
-        return scenes[:20]
+        return scenes
+
+    async def _compose_with_extras(
+        self,
+        project: VideoProject,
+        output_path: Path,
+        audio_path: Path,
+        visual_paths: list[Path],
+        script: Script,
+        topic: dict[str, Any],
+        metadata: tuple[str, list[str]] | None = None,
+    ) -> tuple[Path, list[Path], tuple[str, list[str]]]:
+        """Compose the video while thumbnails and upload metadata are generated.
+
+        Neither depends on the encoded file, so both overlap with the encode.
+        """
+        pending: list[asyncio.Future[Any]] = [
+            asyncio.ensure_future(
+                self._compose_video(project, output_path, audio_path, visual_paths, script)
+            ),
+            asyncio.ensure_future(self._generate_thumbnails(output_path, topic)),
+        ]
+        if metadata is None:
+            pending.append(
+                asyncio.ensure_future(self._generate_description_and_tags(topic, script.body))
+            )
+        try:
+            results = await asyncio.gather(*pending)
+        except BaseException:
+            # Don't keep paying for the other stages once one has failed
+            for task in pending:
+                task.cancel()
+            raise
+        return results[0], results[1], metadata if metadata is not None else results[2]
 
     async def _compose_video(
         self,
@@ -307,21 +495,40 @@ class HorrorPipeline(ContentPipeline):
         bg_music = self._cfg("background_music_path", None)
         Path(bg_music) if bg_music else None
 
+        # GPU encoding by default; the composer falls back to libx264 without NVENC
+        encoder = self._cfg("encoder", "h264_nvenc")
+        encoder_options: dict[str, str] = {}
+        if encoder.endswith("_nvenc"):
+            encoder_options = {
+                "preset": self._cfg("nvenc_preset", "p4"),
+                "rc": self._cfg("nvenc_rc", "vbr"),
+                "cq": str(self._cfg("nvenc_cq", 23)),
+                "b:v": "0",
+            }
+
         composer = self.video_composer
         if hasattr(composer, "compose"):
-            await composer.compose(project=project, output_path=video_file)
+            await composer.compose(
+                project=project,
+                output_path=video_file,
+                encoder=encoder,
+                encoder_options=encoder_options,
+                hwaccel="cuda" if encoder.endswith("_nvenc") else None,
+            )
         return video_file
 
     async def _generate_thumbnails(self, output_path: Path, topic: dict[str, Any]) -> list[Path]:
-        thumbnails: list[Path] = []
-        for variant in range(3):
-            thumb_file = output_path / f"thumbnail_{variant}.png"
-            await self.thumbnail_generator.generate(
-                title=topic.get("title", "")[:40],
-                channel=ChannelType.HORROR,
-                output_path=thumb_file,
+        thumbnails = [output_path / f"thumbnail_{variant}.png" for variant in range(3)]
+        title = topic.get("title", "")[:40]
+        # Variants are independent, so all three are rendered at once
+        await asyncio.gather(
+            *(
+                self.thumbnail_generator.generate(
+                    title=title, channel=ChannelType.HORROR, output_path=thumb_file
+                )
+                for thumb_file in thumbnails
             )
-            thumbnails.append(thumb_file)
+        )
         return thumbnails
 
     async def _upload_video(
@@ -331,11 +538,13 @@ class HorrorPipeline(ContentPipeline):
         thumbnails: list[Path],
         script: Script,
         topic: dict[str, Any],
+        metadata: tuple[str, list[str]] | None = None,
     ) -> None:
         offset_hours = self._cfg("schedule_offset_hours", 24)
         schedule_time = datetime.now(UTC) + timedelta(hours=offset_hours)
-        description = await self._generate_description(topic, script.body)
-        tags = await self._generate_tags(topic)
+        if metadata is None:
+            metadata = await self._generate_description_and_tags(topic, script.body)
+        description, tags = metadata
 
         uploader = self.youtube_uploader
         thumbnail_path = thumbnails[0] if thumbnails else None
@@ -350,13 +559,51 @@ class HorrorPipeline(ContentPipeline):
         )
         logger.info("video_uploaded project_id=%s", project.id)
 
-    async def _llm_generate(self, prompt: str) -> str:
+    async def _llm_call(self, template_id: str, cache: bool = True, **slots: Any) -> str:
+        """Render a prompt template and generate, reusing cached responses.
+
+        The rendered prompt is fully determined by the template and its slot
+        values, so it doubles as the cache key.
+        """
+        system, template = _TEMPLATES[template_id]
+        prompt = template.format(**slots)
+        if not cache:
+            return await self._llm_generate(prompt, system)
+        return await self._llm_cache.get_or_compute(
+            f"{system}\x1f{prompt}", lambda: self._llm_generate(prompt, system)
+        )
+
+    async def _llm_call_json(self, template_id: str, **slots: Any) -> list[Any] | dict[str, Any]:
+        """Like _llm_call, but parse the reply as JSON and only cache replies that parse.
+
+        An unparseable reply would otherwise be served from the cache on
+        every retry until its TTL expired.
+        """
+        system, template = _TEMPLATES[template_id]
+        prompt = template.format(**slots)
+        key = f"{system}\x1f{prompt}"
+        if (cached := await self._llm_cache.get(key)) is not None:
+            try:
+                return self._parse_json_response(cached)
+            except PipelineError:
+                pass  # Cached before replies were checked; generate afresh
+        response = await self._llm_generate(prompt, system)
+        data = self._parse_json_response(response)
+        await self._llm_cache.put(key, response)
+        return data
+
+    async def _llm_generate(self, prompt: str, system: str | None = None) -> str:
+        async with self._llm_semaphore:
+            return await self._llm_generate_unbounded(prompt, system)
+
+    async def _llm_generate_unbounded(self, prompt: str, system: str | None = None) -> str:
         if self._llm_client is not None:
-            return await self._llm_client.generate(prompt)
+            return await self._llm_client.generate(prompt, system=system)
         gen = self.script_generator
         llm_generate = getattr(gen, "_llm_generate", None)
         if callable(llm_generate):
-            maybe_result = llm_generate(prompt)
+            # Raw generators take a single prompt, so the prefix is inlined
+            maybe_result = llm_generate(f"{system}\n\n{prompt}" if system else prompt)
             if isinstance(maybe_result, Awaitable):
                 result = await maybe_result
                 if isinstance(result, str):
@@ -364,7 +611,7 @@ class HorrorPipeline(ContentPipeline):
         client = getattr(gen, "client", None)
         client_generate = getattr(client, "generate", None)
         if callable(client_generate):
-            maybe_result = client_generate(prompt)
+            maybe_result = client_generate(prompt, system=system)
             if isinstance(maybe_result, Awaitable):
                 result = await maybe_result
                 if isinstance(result, str):
@@ -372,22 +619,26 @@ class HorrorPipeline(ContentPipeline):
         raise PipelineError("No LLM client available for raw text generation")
 
     def _cfg(self, key: str, default: Any) -> Any:
-        if isinstance(self.config, dict):
-            return self.config.get(key, default)
-        return getattr(self.config, key, default)
+        return self._settings.get(key, default)
 
     def _parse_json_response(self, response: str) -> list[Any] | dict[str, Any]:
         response = response.strip()
-        json_match = re.search(r"```(?:json)?\s*([\s\S]*?)```", response)
-        if json_match:
+        # Most replies are bare JSON; only run the fence regex when a fence exists
+        if "```" in response and (json_match := _JSON_FENCE_RE.search(response)):
             response = json_match.group(1).strip()
         try:
             return json.loads(response)
         except json.JSONDecodeError:
-            array_match = re.search(r"\[[\s\S]*\]", response)
-            if array_match:
-                return json.loads(array_match.group())
-            obj_match = re.search(r"\{[\s\S]*\}", response)
-            if obj_match:
-                return json.loads(obj_match.group())
-            raise PipelineError(f"Failed to parse JSON: {response[:100]}")
+            pass
+        # Outermost brackets by position: the same span a greedy [...]/{...}
+        # regex would match, without the regex's backtracking on long replies.
+        # Whichever opener comes first is the outer value, so an object's
+        # inner list is never mistaken for the reply
+        spans = [(response.find(opener), response.rfind(closer)) for opener, closer in ("[]", "{}")]
+        for start, end in sorted(spans):
+            if start != -1 and end > start:
+                try:
+                    return json.loads(response[start : end + 1])
+                except json.JSONDecodeError:
+                    continue
+        raise PipelineError(f"Failed to parse JSON: {response[:100]}")
@@ -1,5 +1,7 @@
 """Horror channel prompt templates."""
 
+from src.channels.forbidden_topics import ForbiddenTopicMatcher
+
 FORBIDDEN_TOPICS = frozenset(
     [
         "gore",
@@ -16,8 +18,17 @@ FORBIDDEN_TOPICS = frozenset(
     ]
 )
 
-TOPIC_GENERATION = """You are a horror content strategist for a popular YouTube channel.
-Generate {count} unique, viral-worthy horror/mystery video topics.
+# "suicid" also catches "suicidal"; the other topics match any suffix as they are
+_FORBIDDEN_MATCHER = ForbiddenTopicMatcher(FORBIDDEN_TOPICS, stems={"suicide": "suicid"})
+
+
+def find_forbidden_topic(text: str) -> str | None:
+    """Return the first forbidden topic mentioned in text, if any."""
+    return _FORBIDDEN_MATCHER.find(text)
+
+
+TOPIC_GENERATION_STATIC = """You are a horror content strategist for a popular YouTube channel.
+Generate unique, viral-worthy horror/mystery video topics.
 
 REQUIREMENTS:
 - Topics must be fascinating yet NOT contain: gore, suicide, self-harm, child abuse
@@ -28,19 +39,21 @@ REQUIREMENTS:
 
 FORMAT (JSON array):
 [
-  {{
+  {
     "title": "Hook-style title (under 60 chars)",
     "hook": "Opening line that creates immediate curiosity",
     "category": "urban_legend|true_crime|paranormal|psychological|mystery",
     "viral_potential": 1-10,
     "keywords": ["keyword1", "keyword2", "keyword3"]
-  }}
+  }
 ]
 
-Generate exactly {count} topics. Output ONLY valid JSON."""
+Output ONLY valid JSON."""
+
+TOPIC_GENERATION_DYNAMIC = """Generate exactly {count} topics."""
 
-SCRIPT_TEMPLATE = """You are an elite horror scriptwriter for a faceless YouTube channel.
-Write a compelling {duration_minutes}-minute script on: {topic}
+SCRIPT_TEMPLATE_STATIC = """You are an elite horror scriptwriter for a faceless YouTube channel.
+Write a compelling script on the topic given below.
 
 STRUCTURE:
 1. HOOK (0:00-0:30): Start mid-action or with a shocking statement. NO greetings.
@@ -64,11 +77,12 @@ FORBIDDEN CONTENT (will cause rejection):
 - Child abuse details
 - Real victim names in unsolved crimes (use pseudonyms)
 
+Output the script directly. No meta-commentary."""
+
+SCRIPT_TEMPLATE_DYNAMIC = """LENGTH: {duration_minutes} minutes
 TOPIC: {topic}
 HOOK SUGGESTION: {hook}
-CATEGORY: {category}
-
-Output the script directly. No meta-commentary."""
+CATEGORY: {category}"""
 
 VISUAL_PROMPT_TEMPLATE = """Create a cinematic horror scene for YouTube video visualization.
 
@@ -114,10 +128,7 @@ Generate 3 variant concepts:
 2. OBJECT-FOCUSED: The mysterious/creepy central object
 3. ENVIRONMENT-FOCUSED: Atmospheric establishing shot"""
 
-TITLE_OPTIMIZATION = """Optimize this horror video title for maximum CTR.
-
-ORIGINAL: {original_title}
-TOPIC: {topic}
+TITLE_OPTIMIZATION_STATIC = """Optimize the horror video title given below for maximum CTR.
 
 GENERATE 5 VARIANTS using these formulas:
 1. CURIOSITY GAP: "The [Adjective] Truth About [Topic] That [Authority] Won't Tell You"
@@ -133,11 +144,10 @@ Rules:
 
 Output as JSON array of strings."""
 
-DESCRIPTION_TEMPLATE = """Write a YouTube description for this horror video.
+TITLE_OPTIMIZATION_DYNAMIC = """ORIGINAL: {original_title}
+TOPIC: {topic}"""
 
-TITLE: {title}
-TOPIC: {topic}
-KEY POINTS: {key_points}
+DESCRIPTION_TEMPLATE_STATIC = """Write a YouTube description for the horror video given below.
 
 FORMAT:
 Line 1-2: Hook (expand on title, create more curiosity)
@@ -152,15 +162,15 @@ Line 17-20: Related video suggestions + channel promo
 Line 21: Empty
 Line 22-25: Tags as natural sentences (for SEO)
 
-KEYWORDS TO INCLUDE: {keywords}
-
+Work in the listed keywords naturally.
 NO hashtags in main body. Max 3 hashtags at the very end."""
 
-TAGS_GENERATION = """Generate YouTube tags for this horror video.
+DESCRIPTION_TEMPLATE_DYNAMIC = """TITLE: {title}
+TOPIC: {topic}
+KEY POINTS: {key_points}
+KEYWORDS TO INCLUDE: {keywords}"""
 
-TITLE: {title}
-CATEGORY: {category}
-KEYWORDS: {keywords}
+TAGS_GENERATION_STATIC = """Generate YouTube tags for the horror video given below.
 
 RULES:
 - Generate 15-20 tags
@@ -171,3 +181,65 @@ RULES:
 - Total character count under 500
 
 Output as comma-separated list."""
+
+TAGS_GENERATION_DYNAMIC = """TITLE: {title}
+CATEGORY: {category}
+KEYWORDS: {keywords}"""
+
+
+DESCRIPTION_AND_TAGS_STATIC = """Write the YouTube description and tags for the horror video given below.
+
+DESCRIPTION FORMAT:
+Line 1-2: Hook (expand on title, create more curiosity)
+Line 3: Empty
+Line 4-6: Brief content summary (no spoilers)
+Line 7: Empty
+Line 8: Engagement CTA ("Comment what YOU think happened...")
+Line 9: Empty
+Line 10-15: Timestamps (if provided)
+Line 16: Empty
+Line 17-20: Related video suggestions + channel promo
+Line 21: Empty
+Line 22-25: Tags as natural sentences (for SEO)
+
+Work in the listed keywords naturally.
+NO hashtags in main body. Max 3 hashtags at the very end.
+
+TAG RULES:
+- Generate 15-20 tags
+- Mix: broad (horror, scary stories) + specific (topic-related)
+- Include misspellings of popular searches
+- Include "what is [topic]", "[topic] explained" variations
+- No competitor channel names
+- Total character count under 500
+
+FORMAT (JSON object):
+{
+  "description": "The full description, line breaks escaped as in any JSON string",
+  "tags": ["tag1", "tag2", "tag3"]
+}
+
+Output ONLY valid JSON."""
+
+DESCRIPTION_AND_TAGS_DYNAMIC = """TITLE: {title}
+TOPIC: {topic}
+CATEGORY: {category}
+KEY POINTS: {key_points}
+KEYWORDS: {keywords}"""
+
+
+def _single_prompt(static: str, dynamic: str) -> str:
+    """Join a split template into one format string for callers without a system prompt."""
+    return static.replace("{", "{{").replace("}", "}}") + "\n\n" + dynamic
+
+
+# Static instructions come first and stay byte-identical across calls, so
+# provider prompt caching can reuse them; only the trailing block varies.
+TOPIC_GENERATION = _single_prompt(TOPIC_GENERATION_STATIC, TOPIC_GENERATION_DYNAMIC)
+SCRIPT_TEMPLATE = _single_prompt(SCRIPT_TEMPLATE_STATIC, SCRIPT_TEMPLATE_DYNAMIC)
+TITLE_OPTIMIZATION = _single_prompt(TITLE_OPTIMIZATION_STATIC, TITLE_OPTIMIZATION_DYNAMIC)
+DESCRIPTION_TEMPLATE = _single_prompt(DESCRIPTION_TEMPLATE_STATIC, DESCRIPTION_TEMPLATE_DYNAMIC)
+TAGS_GENERATION = _single_prompt(TAGS_GENERATION_STATIC, TAGS_GENERATION_DYNAMIC)
+DESCRIPTION_AND_TAGS_TEMPLATE = _single_prompt(
+    DESCRIPTION_AND_TAGS_STATIC, DESCRIPTION_AND_TAGS_DYNAMIC
+)
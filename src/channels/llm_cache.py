@@ -0,0 +1,128 @@
+"""Exact-match LLM response cache shared by channel pipelines."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import sqlite3
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
+
+
+class LLMResponseCache:
+    """Prompt -> response cache keyed by the SHA-256 of the prompt.
+
+    Hits are served from memory. When a path is given, entries are also
+    persisted to SQLite so repeated batch runs reuse earlier responses.
+    Writes are buffered and committed in batches of ``flush_every``.
+    Entries older than ``ttl`` seconds are treated as misses.
+
+    All SQLite work runs on a single-thread executor that owns the
+    connection, so the event loop never blocks on disk I/O.
+    """
+
+    def __init__(
+        self, path: Path | None = None, flush_every: int = 16, ttl: float | None = None
+    ) -> None:
+        self.path = path
+        self.flush_every = flush_every
+        self.ttl = ttl
+        self._memory: dict[str, tuple[str, float]] = {}
+        self._pending: list[tuple[str, str, float]] = []
+        self._db: sqlite3.Connection | None = None
+        self._executor: ThreadPoolExecutor | None = None
+
+    @staticmethod
+    def key(prompt: str) -> str:
+        return hashlib.sha256(prompt.encode()).hexdigest()
+
+    async def get(self, prompt: str) -> str | None:
+        key = self.key(prompt)
+        entry = self._memory.get(key)
+        if entry is None:
+            if self.path is None:
+                return None
+            row = await self._run(self._load, self.path, key)
+            if row is None:
+                return None
+            entry = self._memory[key] = row
+
+        response, created_at = entry
+        if self.ttl is not None and time.time() - created_at > self.ttl:
+            del self._memory[key]
+            return None
+        return response
+
+    async def put(self, prompt: str, response: str) -> None:
+        key = self.key(prompt)
+        created_at = time.time()
+        self._memory[key] = (response, created_at)
+        if self.path is None:
+            return
+        self._pending.append((key, response, created_at))
+        if len(self._pending) >= self.flush_every:
+            await self.flush()
+
+    async def get_or_compute(self, prompt: str, compute: Callable[[], Awaitable[str]]) -> str:
+        """Return the cached response for prompt, calling compute() and storing it on a miss."""
+        cached = await self.get(prompt)
+        if cached is not None:
+            return cached
+        response = await compute()
+        await self.put(prompt, response)
+        return response
+
+    async def flush(self) -> None:
+        """Commit buffered entries in a single transaction."""
+        if not self._pending or self.path is None:
+            return
+        # Taken before the hop so entries added meanwhile go in the next batch
+        pending, self._pending = self._pending, []
+        await self._run(self._write, self.path, pending)
+
+    async def _run(self, fn: Callable[..., _T], *args: Any) -> _T:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="llm-cache")
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    def _load(self, path: Path, key: str) -> tuple[str, float] | None:
+        row = (
+            self._connect(path)
+            .execute("SELECT response, created_at FROM responses WHERE key = ?", (key,))
+            .fetchone()
+        )
+        return None if row is None else (row[0], row[1])
+
+    def _write(self, path: Path, entries: list[tuple[str, str, float]]) -> None:
+        db = self._connect(path)
+        with db:
+            db.executemany(
+                "INSERT OR REPLACE INTO responses (key, response, created_at) VALUES (?, ?, ?)",
+                entries,
+            )
+
+    def _connect(self, path: Path) -> sqlite3.Connection:
+        # Opened on first use, on the executor thread, so constructing a
+        # pipeline has no filesystem side effects
+        if self._db is None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(path)
+            # WAL with NORMAL sync: no fsync per commit, still crash-consistent
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at REAL NOT NULL DEFAULT 0)"
+            )
+            columns = {row[1] for row in self._db.execute("PRAGMA table_info(responses)")}
+            if "created_at" not in columns:
+                # Caches written before TTL support; their entries count as oldest
+                self._db.execute(
+                    "ALTER TABLE responses ADD COLUMN created_at REAL NOT NULL DEFAULT 0"
+                )
+        return self._db
@@ -0,0 +1,32 @@
+"""Prompt templates parsed once at import instead of on every str.format call."""
+
+from __future__ import annotations
+
+from string import Formatter
+from typing import Any
+
+
+class PromptTemplate:
+    """A ``str.format``-style template with plain ``{name}`` fields.
+
+    The template is split into literal chunks and field names once, so
+    rendering is a single join with no format-string parsing.
+    """
+
+    __slots__ = ("template", "_parts")
+
+    def __init__(self, template: str) -> None:
+        self.template = template
+        self._parts: list[tuple[str, str | None]] = []
+        for literal, field, spec, conversion in Formatter().parse(template):
+            if spec or conversion:
+                raise ValueError(f"Unsupported format spec in prompt field: {field!r}")
+            self._parts.append((literal, field))
+
+    def format(self, **values: Any) -> str:
+        out: list[str] = []
+        for literal, field in self._parts:
+            out.append(literal)
+            if field is not None:
+                out.append(str(values[field]))
+        return "".join(out)
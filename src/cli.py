@@ -3,9 +3,15 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
+import json
 import logging
 import os
+from datetime import UTC, datetime
 from enum import StrEnum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import structlog
 import typer
@@ -15,7 +21,10 @@ from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeEl
 from rich.table import Table
 
 from config import get_settings
-from src.core.orchestrator import JobStatus, Orchestrator, get_orchestrator
+
+if TYPE_CHECKING:
+    # 오케스트레이터(src.core 포함)는 run/schedule/status 명령에서만 import
+    from src.core.orchestrator import Orchestrator
 
 structlog.configure(
     processors=[
@@ -59,6 +68,8 @@ def run(
     dry_run: bool = typer.Option(False, "--dry-run", "-d", help="시뮬레이션 모드"),
 ):
     """단일 영상 또는 전체 채널 실행."""
+    from src.core.orchestrator import get_orchestrator
+
     dry_run = dry_run or _get_dry_run()
     orchestrator = get_orchestrator(dry_run=dry_run)
 
@@ -83,19 +94,28 @@ def run(
 
 
 async def _run_single(orchestrator: Orchestrator, channel: str) -> str:
-    return await orchestrator.run_once(channel)
+    try:
+        return await orchestrator.run_once(channel)
+    finally:
+        await orchestrator.close_pipelines()
 
 
 async def _run_all(orchestrator: Orchestrator, progress: Progress, task) -> list[str]:
+    # Channels share no state, so they run concurrently; progress advances as each finishes
     job_ids = []
-    for ch in ["horror", "facts", "finance"]:
-        job_id = await orchestrator.run_once(ch)
-        job_ids.append(job_id)
-        progress.update(task, advance=1)
+    runs = [orchestrator.run_once(ch) for ch in ["horror", "facts", "finance"]]
+    try:
+        for next_done in asyncio.as_completed(runs):
+            job_ids.append(await next_done)
+            progress.update(task, advance=1)
+    finally:
+        await orchestrator.close_pipelines()
     return job_ids
 
 
 def _show_job_summary(orchestrator: Orchestrator):
+    from src.core.orchestrator import JobStatus
+
     jobs = orchestrator.get_recent_jobs(5)
     if not jobs:
         return
@@ -130,6 +150,8 @@ def schedule_start(
     dry_run: bool = typer.Option(False, "--dry-run", help="시뮬레이션 모드"),
 ):
     """스케줄러 시작."""
+    from src.core.orchestrator import get_orchestrator
+
     dry_run = dry_run or _get_dry_run()
     orchestrator = get_orchestrator(dry_run=dry_run)
 
@@ -174,6 +196,8 @@ def _show_schedule_table(schedules: dict[str, str]):
 @schedule_app.command("stop")
 def schedule_stop():
     """스케줄러 중지."""
+    from src.core.orchestrator import get_orchestrator
+
     orchestrator = get_orchestrator()
     asyncio.run(orchestrator.stop())
     console.print("[green]스케줄러 중지됨[/green]")
@@ -182,6 +206,8 @@ def schedule_stop():
 @app.command()
 def status():
     """현재 상태 확인."""
+    from src.core.orchestrator import get_orchestrator
+
     orchestrator = get_orchestrator()
     state = orchestrator.status()
 
@@ -333,12 +359,26 @@ def youtube_auth(
         raise typer.Exit(1)
 
 
+@functools.lru_cache(maxsize=8)
+def _load_token(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """토큰 파일 파싱. mtime/size가 캐시 키에 포함되어 파일이 바뀌면 다시 읽음.
+
+    만료 시각(_expiry)과 스코프 이름(_scope_names)도 함께 미리 계산해 둠.
+    """
+    token_data = json.loads(Path(path).read_bytes())
+    expiry_str = token_data.get("expiry", "")
+    if expiry_str:
+        with contextlib.suppress(ValueError):
+            # Python 3.11+ fromisoformat은 "Z"를 직접 처리. 시간대 없는 값은 UTC로 저장됨
+            expiry = datetime.fromisoformat(expiry_str)
+            token_data["_expiry"] = expiry if expiry.tzinfo else expiry.replace(tzinfo=UTC)
+    token_data["_scope_names"] = tuple(s.rpartition("/")[2] for s in token_data.get("scopes") or ())
+    return token_data
+
+
 @youtube_app.command("status")
 def youtube_status():
     """YouTube 인증 상태 확인."""
-    import json
-    from datetime import datetime
-
     settings = get_settings()
     token_path = settings.youtube.token_file
     client_secrets_path = settings.youtube.client_secrets_file
@@ -359,35 +399,32 @@ def youtube_status():
     # 토큰 파일 확인
     if token_path.exists():
         try:
-            with open(token_path) as f:
-                token_data = json.load(f)
-
-            expiry_str = token_data.get("expiry", "")
-            if expiry_str:
-                try:
-                    expiry = datetime.fromisoformat(expiry_str.replace("Z", "+00:00"))
-                    now = datetime.now(expiry.tzinfo)
-                    if expiry > now:
-                        remaining = expiry - now
-                        table.add_row(
-                            "토큰",
-                            "[green]✓ 유효[/green]",
-                            f"만료까지 {remaining.seconds // 3600}시간 {(remaining.seconds % 3600) // 60}분",
-                        )
-                    else:
-                        table.add_row("토큰", "[yellow]⚠ 만료됨[/yellow]", "자동 갱신됨")
-                except Exception:
-                    table.add_row("토큰", "[green]✓ 있음[/green]", "만료 시간 파싱 실패")
+            st = token_path.stat()
+            token_data = _load_token(str(token_path), st.st_mtime_ns, st.st_size)
+
+            expiry = token_data.get("_expiry")
+            if expiry is not None:
+                now = datetime.now(UTC)
+                if expiry > now:
+                    remaining = expiry - now
+                    table.add_row(
+                        "토큰",
+                        "[green]✓ 유효[/green]",
+                        f"만료까지 {remaining.seconds // 3600}시간 {(remaining.seconds % 3600) // 60}분",
+                    )
+                else:
+                    table.add_row("토큰", "[yellow]⚠ 만료됨[/yellow]", "자동 갱신됨")
+            elif token_data.get("expiry"):
+                table.add_row("토큰", "[green]✓ 있음[/green]", "만료 시간 파싱 실패")
             else:
                 table.add_row("토큰", "[green]✓ 있음[/green]", "만료 시간 없음")
 
             # 스코프 확인
-            scopes = token_data.get("scopes", [])
-            if scopes:
-                scope_names = [s.split("/")[-1] for s in scopes]
+            scope_names = token_data["_scope_names"]
+            if scope_names:
                 table.add_row("스코프", "[green]✓[/green]", ", ".join(scope_names))
 
-        except json.JSONDecodeError:
+        except (json.JSONDecodeError, UnicodeDecodeError):
             table.add_row("토큰", "[red]✗ 손상됨[/red]", "ytauto youtube auth 재실행 필요")
     else:
         table.add_row("토큰", "[red]✗ 없음[/red]", "ytauto youtube auth 실행 필요")
@@ -415,9 +452,10 @@ def youtube_revoke(
             console.print("[dim]취소됨[/dim]")
             raise typer.Exit(0)
 
+    auth = YouTubeAuth()
     try:
-        auth = YouTubeAuth()
         success = auth.revoke()
+        auth.invalidate_cache()
 
         if success:
             console.print("[green]✓ YouTube 인증이 취소되었습니다.[/green]")
@@ -427,6 +465,7 @@ def youtube_revoke(
     except Exception as e:
         # 로컬 토큰만 삭제
         token_path.unlink(missing_ok=True)
+        auth.invalidate_cache()
         console.print(f"[yellow]⚠ 오류 발생, 로컬 토큰만 삭제됨: {e}[/yellow]")
 
 
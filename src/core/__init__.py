@@ -8,6 +8,7 @@ from src.core.exceptions import (
     LLMContentFilterError,
     LLMError,
     LLMRateLimitError,
+    LLMTransientError,
     MusicGenerationError,
     PipelineError,
     ScriptValidationError,
@@ -55,6 +56,7 @@ __all__ = [
     "PipelineError",
     "LLMError",
     "LLMRateLimitError",
+    "LLMTransientError",
     "LLMContentFilterError",
     "TTSError",
     "TTSQuotaExceededError",
@@ -16,6 +16,10 @@ class LLMRateLimitError(LLMError):
     pass
 
 
+class LLMTransientError(LLMError):
+    """Connection drop, timeout or provider 5xx; safe to retry with backoff."""
+
+
 class LLMContentFilterError(LLMError):
     pass
 
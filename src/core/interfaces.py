@@ -3,6 +3,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator
 from pathlib import Path
+from typing import Any
 
 from src.core.models import (
     AudioSegment,
@@ -79,6 +80,7 @@ class VideoGenerator(ABC):
         motion_prompt: str,
         duration: float,
         output_path: Path,
+        **kwargs: Any,
     ) -> VisualAsset:
         pass
 
@@ -100,6 +102,9 @@ class VideoComposer(ABC):
         self,
         project: VideoProject,
         output_path: Path,
+        encoder: str | None = None,
+        encoder_options: dict[str, str] | None = None,
+        hwaccel: str | None = None,
     ) -> Path:
         pass
 
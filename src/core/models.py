@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import StrEnum
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 from uuid import UUID, uuid4
@@ -30,6 +31,7 @@ class VideoStyle(StrEnum):
     NEWS = "news"
 
 
+# Not slotted: word_count/body_lower are cached_property and need an instance __dict__
 @dataclass
 class Script:
     title: str
@@ -44,16 +46,31 @@ class Script:
     estimated_duration: int = 0
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
 
-    @property
+    # Derived from the text fields; computed once and dropped if any of them change
+    @cached_property
     def full_text(self) -> str:
         return f"{self.hook}\n\n{self.body}\n\n{self.cta}"
 
-    @property
+    @cached_property
     def word_count(self) -> int:
-        return len(self.full_text.split())
+        return len(self.hook.split()) + len(self.body.split()) + len(self.cta.split())
 
+    @cached_property
+    def body_lower(self) -> str:
+        return self.body.lower()
 
-@dataclass
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in _SCRIPT_TEXT_FIELDS:
+            for cached in _SCRIPT_DERIVED_FIELDS:
+                self.__dict__.pop(cached, None)
+
+
+_SCRIPT_TEXT_FIELDS = frozenset({"hook", "body", "cta"})
+_SCRIPT_DERIVED_FIELDS = ("full_text", "word_count", "body_lower")
+
+
+@dataclass(slots=True)
 class AudioSegment:
     path: Path
     duration: float
@@ -62,7 +79,7 @@ class AudioSegment:
     voice_id: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class VisualAsset:
     path: Path
     asset_type: str
@@ -72,7 +89,7 @@ class VisualAsset:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class Thumbnail:
     path: Path
     title_text: str
@@ -80,7 +97,7 @@ class Thumbnail:
     ctr_score: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoProject:
     id: UUID
     channel: ChannelType
@@ -119,7 +136,7 @@ class VideoProject:
         self.updated_at = datetime.now(UTC)
 
 
-@dataclass
+@dataclass(slots=True)
 class ChannelConfig:
     channel_type: ChannelType
     name: str
@@ -130,12 +147,12 @@ class ChannelConfig:
     target_duration: tuple[int, int] = (480, 600)
     style: VideoStyle = VideoStyle.STORYTELLING
 
-    topics: list[str] = field(default_factory=list)
-    banned_topics: list[str] = field(default_factory=list)
+    topics: tuple[str, ...] = ()
+    banned_topics: tuple[str, ...] = ()
     thumbnail_style: str = "dramatic"
 
-    hashtags: list[str] = field(default_factory=list)
-    default_tags: list[str] = field(default_factory=list)
+    hashtags: tuple[str, ...] = ()
+    default_tags: tuple[str, ...] = ()
 
 
 CHANNEL_CONFIGS: dict[ChannelType, ChannelConfig] = {
@@ -147,17 +164,17 @@ CHANNEL_CONFIGS: dict[ChannelType, ChannelConfig] = {
         upload_schedule="0 18 * * 1,3,5",
         target_duration=(480, 720),
         style=VideoStyle.STORYTELLING,
-        topics=[
+        topics=(
             "unexplained mysteries",
             "creepy stories",
             "paranormal events",
             "urban legends",
             "true crime mysteries",
-        ],
-        banned_topics=["gore", "suicide", "self-harm", "child abuse"],
+        ),
+        banned_topics=("gore", "suicide", "self-harm", "child abuse"),
         thumbnail_style="dark_dramatic",
-        hashtags=["horror", "creepy", "scary", "mystery", "paranormal"],
-        default_tags=["horror stories", "scary stories", "creepypasta", "true scary stories"],
+        hashtags=("horror", "creepy", "scary", "mystery", "paranormal"),
+        default_tags=("horror stories", "scary stories", "creepypasta", "true scary stories"),
     ),
     ChannelType.FACTS: ChannelConfig(
         channel_type=ChannelType.FACTS,
@@ -167,17 +184,17 @@ CHANNEL_CONFIGS: dict[ChannelType, ChannelConfig] = {
         upload_schedule="0 18 * * 2,4,6",
         target_duration=(300, 480),
         style=VideoStyle.EDUCATIONAL,
-        topics=[
+        topics=(
             "science facts",
             "psychology facts",
             "history mysteries",
             "space exploration",
             "human body",
-        ],
-        banned_topics=["misinformation", "conspiracy theories"],
+        ),
+        banned_topics=("misinformation", "conspiracy theories"),
         thumbnail_style="bright_curious",
-        hashtags=["facts", "science", "education", "mindblown", "didyouknow"],
-        default_tags=["facts", "amazing facts", "science facts", "education"],
+        hashtags=("facts", "science", "education", "mindblown", "didyouknow"),
+        default_tags=("facts", "amazing facts", "science facts", "education"),
     ),
     ChannelType.FINANCE: ChannelConfig(
         channel_type=ChannelType.FINANCE,
@@ -187,17 +204,17 @@ CHANNEL_CONFIGS: dict[ChannelType, ChannelConfig] = {
         upload_schedule="0 9 * * *",
         target_duration=(300, 600),
         style=VideoStyle.EDUCATIONAL,
-        topics=[
+        topics=(
             "investing strategies",
             "passive income",
             "stock market",
             "real estate",
             "crypto basics",
             "financial independence",
-        ],
-        banned_topics=["get rich quick", "gambling", "pump and dump"],
+        ),
+        banned_topics=("get rich quick", "gambling", "pump and dump"),
         thumbnail_style="professional_money",
-        hashtags=["finance", "investing", "money", "wealth", "passiveincome"],
-        default_tags=["personal finance", "investing", "money tips", "financial freedom"],
+        hashtags=("finance", "investing", "money", "wealth", "passiveincome"),
+        default_tags=("personal finance", "investing", "money tips", "financial freedom"),
     ),
 }
@@ -4,17 +4,19 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import heapq
+import importlib
+import itertools
+import secrets
 import signal
 import sys
-import uuid
-from collections import defaultdict
+import time
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from enum import Enum
 from typing import Any, Protocol
 
-import schedule
-
 try:
     import structlog
 
@@ -35,7 +37,7 @@ class JobStatus(Enum):
     RETRYING = "retrying"
 
 
-@dataclass
+@dataclass(slots=True)
 class JobRecord:
     job_id: str
     channel: str
@@ -58,6 +60,14 @@ class RunnablePipeline(Protocol):
     async def run(self, channel: ChannelType) -> Any: ...
 
 
+# Channel name -> package exposing create_pipeline(); imported on first use
+_PIPELINE_MODULES = {
+    "horror": "src.channels.horror",
+    "facts": "src.channels.facts",
+    "finance": "src.channels.finance",
+}
+
+
 class Orchestrator:
     DEFAULT_SCHEDULES = {
         "horror": "09:00",
@@ -78,14 +88,20 @@ class Orchestrator:
         self.dry_run = dry_run
 
         self._state = OrchestratorState.STOPPED
-        self._queue: asyncio.Queue[JobRecord] = asyncio.Queue()
+        # (not_before, seq, job): retries wait in the queue for their backoff
+        # instead of sleeping inside a worker's semaphore slot
+        self._queue: asyncio.PriorityQueue[tuple[float, int, JobRecord]] = asyncio.PriorityQueue()
+        self._queue_seq = itertools.count()
+        self._job_added = asyncio.Event()
         self._semaphore = asyncio.Semaphore(max_concurrent)
         self._jobs: dict[str, JobRecord] = {}
+        # Jobs per status, kept in step with _jobs so status() needn't scan every job
+        self._status_counts: dict[JobStatus, int] = defaultdict(int)
         self._stats: dict[str, dict[str, int]] = defaultdict(
             lambda: {"completed": 0, "failed": 0, "total": 0}
         )
         self._workers: list[asyncio.Task[Any]] = []
-        self._scheduler_task: asyncio.Task[Any] | None = None
+        self._schedule_handles: dict[str, asyncio.TimerHandle] = {}
         self._pipelines: dict[str, RunnablePipeline] = {}
 
     def register_pipeline(self, channel: str, pipeline: RunnablePipeline):
@@ -98,36 +114,86 @@ class Orchestrator:
         return self._pipelines.get(channel)
 
     def _lazy_load_pipeline(self, channel: str):
+        module_path = _PIPELINE_MODULES.get(channel)
+        if module_path is None:
+            return
         try:
-            if channel == "horror":
-                from src.channels import horror as horror_channel
-
-                self._pipelines[channel] = horror_channel.create_pipeline()
-            elif channel == "facts":
-                from src.channels import facts as facts_channel
-
-                self._pipelines[channel] = facts_channel.create_pipeline()
-            elif channel == "finance":
-                from src.channels import finance as finance_channel
-
-                self._pipelines[channel] = finance_channel.create_pipeline()
+            self._pipelines[channel] = importlib.import_module(module_path).create_pipeline()
         except ImportError as e:
             logger.warning("pipeline_import_failed", channel=channel, error=str(e))
 
+    async def close_pipelines(self) -> None:
+        """Release resources such as pooled HTTP clients held by loaded pipelines."""
+        for channel, pipeline in list(self._pipelines.items()):
+            aclose = getattr(pipeline, "aclose", None)
+            if aclose is None:
+                continue
+            del self._pipelines[channel]
+            try:
+                await aclose()
+            except Exception as e:
+                logger.warning("pipeline_close_failed", channel=channel, error=str(e))
+        # Factories cache their pipeline, so drop it to avoid handing out a closed one
+        for module_path in _PIPELINE_MODULES.values():
+            module = sys.modules.get(module_path)
+            if module is not None:
+                module.create_pipeline.cache_clear()
+        # Pipelines share the LLM SDK connection pools; only loaded if an LLM was used
+        llm_client = sys.modules.get("src.services.llm.client")
+        if llm_client is not None:
+            await llm_client.aclose_sdk_clients()
+
     async def enqueue(self, channel: str, priority: int = 0) -> str:
-        job_id = str(uuid.uuid4())[:8]
+        job_id = secrets.token_hex(4)
         job = JobRecord(job_id=job_id, channel=channel, status=JobStatus.PENDING)
         self._jobs[job_id] = job
-        await self._queue.put(job)
+        self._status_counts[JobStatus.PENDING] += 1
+        self._put(job)
         self._stats[channel]["total"] += 1
         logger.info("job_enqueued", job_id=job_id, channel=channel)
         return job_id
 
+    async def enqueue_many(self, channels: list[str]) -> list[str]:
+        """Enqueue one job per channel in a single pass; the queue is unbounded so nothing awaits."""
+        created_at = datetime.now(UTC)
+        jobs = [
+            JobRecord(
+                job_id=secrets.token_hex(4),
+                channel=channel,
+                status=JobStatus.PENDING,
+                created_at=created_at,
+            )
+            for channel in channels
+        ]
+        self._jobs.update((job.job_id, job) for job in jobs)
+        self._status_counts[JobStatus.PENDING] += len(jobs)
+        for job in jobs:
+            self._put(job)
+        for channel, count in Counter(channels).items():
+            self._stats[channel]["total"] += count
+        job_ids = [job.job_id for job in jobs]
+        logger.info("jobs_enqueued", job_ids=job_ids, channels=channels)
+        return job_ids
+
+    def _put(self, job: JobRecord, delay: float = 0.0) -> None:
+        self._queue.put_nowait((time.monotonic() + delay, next(self._queue_seq), job))
+        self._job_added.set()
+
+    def _transition(self, job: JobRecord, status: JobStatus) -> None:
+        if job.job_id in self._jobs:
+            self._status_counts[job.status] -= 1
+            self._status_counts[status] += 1
+        job.status = status
+
     async def _process_job(self, job: JobRecord):
         async with self._semaphore:
-            job.status = JobStatus.RUNNING
+            self._transition(job, JobStatus.RUNNING)
             job.started_at = datetime.now(UTC)
-            logger.info("job_started", job_id=job.job_id, channel=job.channel)
+            # Monotonic clock for the duration; immune to wall-clock adjustments
+            started = time.perf_counter()
+            # Bound once so start/complete/fail events share one context
+            log = logger.bind(job_id=job.job_id, channel=job.channel)
+            log.info("job_started")
 
             try:
                 if self.dry_run:
@@ -135,17 +201,12 @@ class Orchestrator:
                 else:
                     await self._execute_job(job)
 
-                job.status = JobStatus.COMPLETED
+                self._transition(job, JobStatus.COMPLETED)
                 job.completed_at = datetime.now(UTC)
                 self._stats[job.channel]["completed"] += 1
-                logger.info(
-                    "job_completed",
-                    job_id=job.job_id,
-                    channel=job.channel,
-                    duration=(job.completed_at - job.started_at).seconds,
-                )
+                log.info("job_completed", duration=int(time.perf_counter() - started))
             except Exception as e:
-                await self._handle_job_failure(job, e)
+                await self._handle_job_failure(job, e, log)
 
     async def _execute_job(self, job: JobRecord):
         pipeline = self._get_pipeline(job.channel)
@@ -158,48 +219,77 @@ class Orchestrator:
         await asyncio.sleep(2)
         job.result = {"dry_run": True, "channel": job.channel}
 
-    async def _handle_job_failure(self, job: JobRecord, error: Exception):
+    async def _handle_job_failure(self, job: JobRecord, error: Exception, log: Any):
         job.retries += 1
         job.error = str(error)
-        logger.error("job_failed", job_id=job.job_id, error=str(error), retry=job.retries)
+        log.error("job_failed", error=str(error), retry=job.retries)
 
         if job.retries < self.max_retries:
-            job.status = JobStatus.RETRYING
-            await asyncio.sleep(self.retry_delay * job.retries)
-            await self._queue.put(job)
+            self._transition(job, JobStatus.RETRYING)
+            self._put(job, delay=self.retry_delay * job.retries)
         else:
-            job.status = JobStatus.FAILED
+            self._transition(job, JobStatus.FAILED)
             job.completed_at = datetime.now(UTC)
             self._stats[job.channel]["failed"] += 1
 
     async def _worker(self, worker_id: int):
-        logger.info("worker_started", worker_id=worker_id)
+        log = logger.bind(worker_id=worker_id)
+        log.info("worker_started")
         while self._state == OrchestratorState.RUNNING:
             try:
-                job = await asyncio.wait_for(self._queue.get(), timeout=1.0)
-                await self._process_job(job)
+                # Idle workers block here until a job arrives; stop() cancels them
+                entry = await self._queue.get()
+                wait = entry[0] - time.monotonic()
+                if wait > 0:
+                    # Earliest job is a retry still backing off; requeue it (before
+                    # task_done, so join() keeps waiting) and sleep until it is due
+                    # or a new job arrives
+                    self._queue.put_nowait(entry)
+                    self._queue.task_done()
+                    await self._wait_for_job(wait)
+                    continue
+                await self._process_job(entry[2])
                 self._queue.task_done()
-            except TimeoutError:
-                continue
             except asyncio.CancelledError:
                 break
-        logger.info("worker_stopped", worker_id=worker_id)
+        log.info("worker_stopped")
+
+    async def _wait_for_job(self, timeout: float):
+        self._job_added.clear()
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self._job_added.wait(), timeout)
 
     def _setup_schedules(self, schedules: dict[str, str] | None = None):
-        schedule.clear()
+        self._cancel_schedules()
         schedules = schedules or self.DEFAULT_SCHEDULES
         for channel, time_str in schedules.items():
-            schedule.every().day.at(time_str).do(
-                lambda ch=channel: asyncio.create_task(self.enqueue(ch))
-            )
+            self._schedule_next(channel, time_str)
             logger.info("schedule_registered", channel=channel, time=time_str)
 
-    async def _scheduler_loop(self):
-        logger.info("scheduler_started")
-        while self._state == OrchestratorState.RUNNING:
-            schedule.run_pending()
-            await asyncio.sleep(1)
-        logger.info("scheduler_stopped")
+    def _schedule_next(self, channel: str, time_str: str):
+        # One timer per channel at its next local HH:MM, so the loop sleeps until then
+        hour, minute = map(int, time_str.split(":"))
+        now = datetime.now()
+        next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if next_run <= now:
+            next_run += timedelta(days=1)
+
+        loop = asyncio.get_running_loop()
+        self._schedule_handles[channel] = loop.call_at(
+            loop.time() + (next_run - now).total_seconds(),
+            self._on_schedule,
+            channel,
+            time_str,
+        )
+
+    def _on_schedule(self, channel: str, time_str: str):
+        asyncio.create_task(self.enqueue(channel))
+        self._schedule_next(channel, time_str)
+
+    def _cancel_schedules(self):
+        for handle in self._schedule_handles.values():
+            handle.cancel()
+        self._schedule_handles.clear()
 
     async def start(self, schedules: dict[str, str] | None = None):
         if self._state == OrchestratorState.RUNNING:
@@ -219,7 +309,6 @@ class Orchestrator:
 
         self._workers = [asyncio.create_task(self._worker(i)) for i in range(self.max_concurrent)]
         self._setup_schedules(schedules)
-        self._scheduler_task = asyncio.create_task(self._scheduler_loop())
 
         logger.info("orchestrator_started")
 
@@ -230,27 +319,22 @@ class Orchestrator:
         self._state = OrchestratorState.STOPPING
         logger.info("orchestrator_stopping")
 
-        if self._scheduler_task:
-            self._scheduler_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await self._scheduler_task
+        self._cancel_schedules()
 
         for worker in self._workers:
             worker.cancel()
         await asyncio.gather(*self._workers, return_exceptions=True)
+        await self.close_pipelines()
 
         self._state = OrchestratorState.STOPPED
         logger.info("orchestrator_stopped")
 
     def status(self) -> dict[str, Any]:
-        pending = sum(1 for j in self._jobs.values() if j.status == JobStatus.PENDING)
-        running = sum(1 for j in self._jobs.values() if j.status == JobStatus.RUNNING)
-
         return {
             "state": self._state.value,
             "queue_size": self._queue.qsize(),
-            "pending_jobs": pending,
-            "running_jobs": running,
+            "pending_jobs": self._status_counts[JobStatus.PENDING],
+            "running_jobs": self._status_counts[JobStatus.RUNNING],
             "total_jobs": len(self._jobs),
             "stats": dict(self._stats),
             "workers": len(self._workers),
@@ -261,7 +345,7 @@ class Orchestrator:
         return self._jobs.get(job_id)
 
     def get_recent_jobs(self, limit: int = 10) -> list[JobRecord]:
-        return sorted(self._jobs.values(), key=lambda j: j.created_at, reverse=True)[:limit]
+        return heapq.nlargest(limit, self._jobs.values(), key=lambda j: j.created_at)
 
     async def run_once(self, channel: str) -> str:
         job_id = await self.enqueue(channel)
@@ -270,11 +354,7 @@ class Orchestrator:
         return job_id
 
     async def run_all(self) -> list[str]:
-        job_ids = []
-        for channel in self._pipelines.keys() or ["horror", "facts", "finance"]:
-            job_id = await self.enqueue(channel)
-            job_ids.append(job_id)
-
+        job_ids = await self.enqueue_many(list(self._pipelines) or ["horror", "facts", "finance"])
         await self._queue.join()
         return job_ids
 
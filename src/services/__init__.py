@@ -1,58 +1,112 @@
-"""All service modules."""
+"""All service modules.
 
-# LLM
-from src.services.llm import (
-    CHANNEL_PROMPTS,
-    AnthropicClient,
-    LLMClient,
-    OpenAIClient,
-    ScriptGeneratorImpl,
-    get_llm_client,
-    get_script_generator,
-)
+Exports are resolved on first attribute access (PEP 562), so importing a
+single submodule such as ``src.services.youtube.auth`` does not pull in
+every LLM/TTS/visual backend.
+"""
 
-# Thumbnail
-from src.services.thumbnail import (
-    CHANNEL_STYLES,
-    TextPosition,
-    TextStyle,
-    ThumbnailGenerator,
-    ThumbnailStyle,
-    get_style_by_name,
-    get_styles_for_channel,
-)
+from __future__ import annotations
 
-# TTS
-from src.services.tts import (
-    EdgeTTSClient,
-    ElevenLabsClient,
-    TTSEngineImpl,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # LLM
+    from src.services.llm import (
+        CHANNEL_PROMPTS,
+        AnthropicClient,
+        LLMClient,
+        OpenAIClient,
+        ScriptGeneratorImpl,
+        get_llm_client,
+        get_script_generator,
+    )
+
+    # Thumbnail
+    from src.services.thumbnail import (
+        CHANNEL_STYLES,
+        TextPosition,
+        TextStyle,
+        ThumbnailGenerator,
+        ThumbnailStyle,
+        get_style_by_name,
+        get_styles_for_channel,
+    )
+
+    # TTS
+    from src.services.tts import (
+        EdgeTTSClient,
+        ElevenLabsClient,
+        TTSEngineImpl,
+    )
+
+    # Video
+    from src.services.video import (
+        LocalMusicProvider,
+        MusicMixer,
+        SubtitleEntry,
+        SubtitleGenerator,
+        SubtitleStyle,
+        VideoComposer,
+    )
+
+    # Visual
+    from src.services.visual import (
+        CHANNEL_MOTION_PRESETS,
+        CHANNEL_STYLE_PRESETS,
+        ImageGenerator,
+        VideoGenerator,
+    )
+
+    # YouTube
+    from src.services.youtube import (
+        SEOOptimizer,
+        YouTubeAuth,
+        YouTubeUploader,
+    )
+
+_LAZY_EXPORTS: dict[str, str] = {
+    "CHANNEL_PROMPTS": "src.services.llm",
+    "AnthropicClient": "src.services.llm",
+    "LLMClient": "src.services.llm",
+    "OpenAIClient": "src.services.llm",
+    "ScriptGeneratorImpl": "src.services.llm",
+    "get_llm_client": "src.services.llm",
+    "get_script_generator": "src.services.llm",
+    "CHANNEL_STYLES": "src.services.thumbnail",
+    "TextPosition": "src.services.thumbnail",
+    "TextStyle": "src.services.thumbnail",
+    "ThumbnailGenerator": "src.services.thumbnail",
+    "ThumbnailStyle": "src.services.thumbnail",
+    "get_style_by_name": "src.services.thumbnail",
+    "get_styles_for_channel": "src.services.thumbnail",
+    "EdgeTTSClient": "src.services.tts",
+    "ElevenLabsClient": "src.services.tts",
+    "TTSEngineImpl": "src.services.tts",
+    "LocalMusicProvider": "src.services.video",
+    "MusicMixer": "src.services.video",
+    "SubtitleEntry": "src.services.video",
+    "SubtitleGenerator": "src.services.video",
+    "SubtitleStyle": "src.services.video",
+    "VideoComposer": "src.services.video",
+    "CHANNEL_MOTION_PRESETS": "src.services.visual",
+    "CHANNEL_STYLE_PRESETS": "src.services.visual",
+    "ImageGenerator": "src.services.visual",
+    "VideoGenerator": "src.services.visual",
+    "SEOOptimizer": "src.services.youtube",
+    "YouTubeAuth": "src.services.youtube",
+    "YouTubeUploader": "src.services.youtube",
+}
 
-# Video
-from src.services.video import (
-    LocalMusicProvider,
-    MusicMixer,
-    SubtitleEntry,
-    SubtitleGenerator,
-    SubtitleStyle,
-    VideoComposer,
-)
 
-# Visual
-from src.services.visual import (
-    CHANNEL_MOTION_PRESETS,
-    CHANNEL_STYLE_PRESETS,
-    ImageGenerator,
-    VideoGenerator,
-)
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
 
-# YouTube
-from src.services.youtube import (
-    SEOOptimizer,
-    YouTubeAuth,
-    YouTubeUploader,
-)
 
 __all__ = [
     # LLM
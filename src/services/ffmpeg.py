@@ -0,0 +1,41 @@
+"""FFmpeg helpers shared by the visual and video services."""
+
+from __future__ import annotations
+
+import functools
+import subprocess
+
+# A one-frame encode is instant when it works; a hung driver counts as unavailable
+ENCODER_PROBE_TIMEOUT = 15.0
+
+
+@functools.cache
+def encoder_available(ffmpeg: str, encoder: str) -> bool:
+    """Probe an ffmpeg video encoder once by encoding a single blank frame.
+
+    Listing ``ffmpeg -encoders`` is not enough: NVENC is compiled into most
+    builds but only initialises when a supported GPU and driver are present.
+    A passing probe does not guarantee later encodes: NVENC also limits the
+    number of concurrent sessions per GPU. This blocks, so async callers run
+    it in a thread.
+    """
+    cmd = [
+        ffmpeg,
+        "-hide_banner",
+        "-f",
+        "lavfi",
+        "-i",
+        "color=black:s=256x256:d=0.04",
+        "-frames:v",
+        "1",
+        "-c:v",
+        encoder,
+        "-f",
+        "null",
+        "-",
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, timeout=ENCODER_PROBE_TIMEOUT)
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return result.returncode == 0
@@ -1,11 +1,18 @@
+import asyncio
 import json
+import sys
 import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from functools import cache
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
+import anthropic
+import openai
 from anthropic import AsyncAnthropic
-from anthropic.types import MessageParam
+from anthropic.types import MessageParam, TextBlockParam
 from anthropic.types.text_block import TextBlock
 from openai import AsyncOpenAI
 from openai.types.chat import ChatCompletionMessageParam
@@ -14,30 +21,50 @@ from tenacity import (
     retry_if_exception_type,
     stop_after_attempt,
     wait_exponential,
+    wait_random,
 )
 
 from config import get_settings
-from src.core.exceptions import LLMError, LLMRateLimitError
+from src.core.exceptions import LLMError, LLMRateLimitError, LLMTransientError
 
 # OpenCode auth.json location
 OPENCODE_AUTH_PATH = Path.home() / ".local" / "share" / "opencode" / "auth.json"
 
 
+# provider -> (access token, expires ms, auth.json mtime_ns) from the last read
+_OPENCODE_TOKEN_CACHE: dict[str, tuple[str | None, float, int]] = {}
+
+# Tokens this close to expiry count as expired
+_OPENCODE_EXPIRY_BUFFER_MS = 300_000
+
+
 def get_opencode_token(provider: str) -> str | None:
     """Read OAuth access token from OpenCode auth.json.
 
+    The parsed token is cached per provider; auth.json is only re-read
+    once the cached token nears expiry and the file has changed since.
+
     Args:
         provider: "anthropic" or "openai"
 
     Returns:
         Access token string or None if not found/expired
     """
-    if not OPENCODE_AUTH_PATH.exists():
+    now_ms = time.time() * 1000
+    cached = _OPENCODE_TOKEN_CACHE.get(provider)
+    if cached and cached[0] and not _opencode_token_expired(cached[1], now_ms):
+        return cached[0]
+
+    try:
+        mtime_ns = OPENCODE_AUTH_PATH.stat().st_mtime_ns
+    except OSError:
+        return None
+    if cached and cached[2] == mtime_ns:
+        # File unchanged since the token we already know is stale
         return None
 
     try:
-        with open(OPENCODE_AUTH_PATH) as f:
-            auth_data = json.load(f)
+        auth_data = json.loads(OPENCODE_AUTH_PATH.read_bytes())
 
         if provider not in auth_data:
             return None
@@ -45,16 +72,32 @@ def get_opencode_token(provider: str) -> str | None:
         provider_data = auth_data[provider]
         access_token = provider_data.get("access")
         expires = provider_data.get("expires", 0)
+        _OPENCODE_TOKEN_CACHE[provider] = (access_token, expires, mtime_ns)
 
-        # Check if token is expired (with 5 min buffer)
-        if expires > 0 and expires < (time.time() * 1000 + 300000):
+        if _opencode_token_expired(expires, now_ms):
             return None
 
         return access_token
-    except (json.JSONDecodeError, KeyError, OSError):
+    except (json.JSONDecodeError, UnicodeDecodeError, KeyError, OSError):
         return None
 
 
+def _current_api_key(api_key: str, opencode_provider: str | None) -> str:
+    """Prefer a live OpenCode token, falling back to the configured API key.
+
+    Called on every request: get_opencode_token serves unexpired tokens from
+    memory and only re-reads auth.json once the cached one nears expiry.
+    """
+    if opencode_provider is not None and (token := get_opencode_token(opencode_provider)):
+        return token
+    return api_key
+
+
+def _opencode_token_expired(expires: float, now_ms: float) -> bool:
+    # expires of 0 means the token carries no expiry
+    return 0 < expires < now_ms + _OPENCODE_EXPIRY_BUFFER_MS
+
+
 class LLMClient(ABC):
     @abstractmethod
     async def generate(self, prompt: str, system: str | None = None, **kwargs) -> str:
@@ -66,28 +109,190 @@ class LLMClient(ABC):
     ) -> dict[str, Any]:
         pass
 
+    async def stream(self, prompt: str, system: str | None = None, **kwargs) -> AsyncIterator[str]:
+        """Yield the response text as it arrives; non-streaming clients yield it whole."""
+        yield await self.generate(prompt, system=system, **kwargs)
+
+    async def stream_json(
+        self,
+        prompt: str,
+        system: str | None = None,
+        on_text: Callable[[str], None] | None = None,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """Stream a JSON generation, handing each chunk to on_text, and parse it once complete."""
+        chunks: list[str] = []
+        async for text in self.stream(prompt, system=_json_system(system), **kwargs):
+            chunks.append(text)
+            if on_text is not None:
+                on_text(text)
+        try:
+            return _loads_json_text("".join(chunks))
+        except json.JSONDecodeError as e:
+            raise LLMError(f"Failed to parse JSON response: {e}") from e
+
+    async def generate_json_batch(
+        self, items: list[tuple[str, str | None]], **kwargs
+    ) -> list[dict[str, Any] | BaseException]:
+        """Run (prompt, system) pairs as JSON generations; failures are returned in place.
+
+        Clients with a provider batch API override this for offline workloads.
+        """
+        return await asyncio.gather(
+            *(self.generate_json(prompt, system=system, **kwargs) for prompt, system in items),
+            return_exceptions=True,
+        )
+
+
+_SDKClientT = TypeVar("_SDKClientT", AsyncAnthropic, AsyncOpenAI)
+
+# Connection pools are bound to the event loop that opened them, so clients are
+# cached per loop. Per loop: (SDK class, api key) -> SDK client, most recently
+# used last, so every wrapper for the same account reuses one client
+_SDK_CLIENTS: dict[asyncio.AbstractEventLoop, OrderedDict[tuple[type, str | None], Any]] = {}
+# Per loop: SDK module name -> pooled HTTP client
+_SDK_HTTP_CLIENTS: dict[asyncio.AbstractEventLoop, dict[str, Any]] = {}
+# Rotating OpenCode tokens each add a key; older clients are dropped past this
+_SDK_CLIENT_CACHE_SIZE = 8
+
+
+def _sdk_module(cls: type[AsyncAnthropic | AsyncOpenAI]) -> Any:
+    return sys.modules[cls.__module__.partition(".")[0]]
+
+
+def _sdk_timeout(cls: type[AsyncAnthropic | AsyncOpenAI]) -> Any:
+    llm = get_settings().llm
+    return _sdk_module(cls).Timeout(llm.timeout, connect=llm.http_connect_timeout)
+
+
+def _sdk_http_client(
+    cls: type[AsyncAnthropic | AsyncOpenAI], loop: asyncio.AbstractEventLoop
+) -> Any:
+    """One tuned HTTP/2 keep-alive pool per SDK and loop, shared by all of its clients."""
+    sdk = _sdk_module(cls)
+    http_clients = _SDK_HTTP_CLIENTS.setdefault(loop, {})
+    http_client = http_clients.get(sdk.__name__)
+    if http_client is None:
+        llm = get_settings().llm
+        # Built from the SDK's own httpx flavour (httpx or httpx2, depending on version)
+        limits = type(sdk.DEFAULT_CONNECTION_LIMITS)(
+            max_connections=llm.http_max_connections,
+            max_keepalive_connections=llm.http_max_keepalive_connections,
+        )
+        http_client = http_clients[sdk.__name__] = sdk.DefaultAsyncHttpxClient(
+            limits=limits, timeout=_sdk_timeout(cls), http2=True
+        )
+    return http_client
+
+
+def _shared_sdk_client(cls: type[_SDKClientT], api_key: str | None) -> _SDKClientT:
+    loop = asyncio.get_running_loop()
+    clients = _SDK_CLIENTS.get(loop)
+    if clients is None:
+        _forget_closed_loops()
+        clients = _SDK_CLIENTS[loop] = OrderedDict()
+    key = (cls, api_key)
+    client = clients.get(key)
+    if client is not None:
+        clients.move_to_end(key)
+        return client
+    # The SDKs apply their own per-request timeout, so pass it alongside the pool
+    client = clients[key] = cls(
+        api_key=api_key, http_client=_sdk_http_client(cls, loop), timeout=_sdk_timeout(cls)
+    )
+    if len(clients) > _SDK_CLIENT_CACHE_SIZE:
+        # Evicted clients share the loop's pool, so there is nothing to close
+        clients.popitem(last=False)
+    return client
+
+
+def _forget_closed_loops() -> None:
+    # Pools of a closed loop can no longer be used or closed; drop them with the loop
+    for by_loop in (_SDK_CLIENTS, _SDK_HTTP_CLIENTS):
+        for loop in [loop for loop in by_loop if loop.is_closed()]:
+            del by_loop[loop]
+
+
+async def aclose_sdk_clients() -> None:
+    """Close the running loop's pooled SDK connections and forget its clients."""
+    loop = asyncio.get_running_loop()
+    _SDK_CLIENTS.pop(loop, None)
+    for http_client in _SDK_HTTP_CLIENTS.pop(loop, {}).values():
+        await http_client.aclose()
+
 
 def _retry_decorator():
     return retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=30),
-        retry=retry_if_exception_type((LLMRateLimitError,)),
+        # Exponential from 0.5s plus up to 1s of jitter so parallel callers spread out
+        wait=wait_exponential(multiplier=0.5, max=30) + wait_random(0, 1),
+        retry=retry_if_exception_type((LLMRateLimitError, LLMTransientError)),
         reraise=True,
     )
 
 
+_RATE_LIMIT_ERRORS = (anthropic.RateLimitError, openai.RateLimitError)
+# APITimeoutError subclasses APIConnectionError; InternalServerError covers 5xx/overloaded
+_TRANSIENT_ERRORS = (
+    anthropic.APIConnectionError,
+    anthropic.InternalServerError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
+
+
+def _llm_error(provider: str, action: str, error: Exception) -> LLMError:
+    """Map an SDK exception onto the LLMError subclass the retry policy understands."""
+    if isinstance(error, _RATE_LIMIT_ERRORS):
+        return LLMRateLimitError(f"{provider} rate limit: {error}")
+    if isinstance(error, _TRANSIENT_ERRORS):
+        return LLMTransientError(f"{provider} {action} failed: {error}")
+    return LLMError(f"{provider} {action} failed: {error}")
+
+
+# How often batch jobs are polled; provider batches complete within 24h
+BATCH_POLL_INTERVAL = 30.0
+
+
+def _json_system(system: str | None) -> str:
+    return (
+        system or ""
+    ) + "\n\nYou must respond with valid JSON only. No markdown, no explanation."
+
+
+def _loads_json_text(text: str) -> dict[str, Any]:
+    text = text.strip()
+    if text.startswith("```"):
+        text = text.split("\n", 1)[1] if "\n" in text else text[3:]
+        text = text.rsplit("```", 1)[0]
+    return json.loads(text)
+
+
+def _cached_system(system: str | None) -> list[TextBlockParam] | str:
+    """Mark the system prompt as a cache breakpoint so repeat prefixes are billed as reads."""
+    if not system:
+        return ""
+    return [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]
+
+
 class AnthropicClient(LLMClient):
     def __init__(self, api_key: str | None = None, model: str | None = None):
         settings = get_settings()
-        resolved_key = api_key
-        if not resolved_key and settings.llm.use_opencode_auth:
-            resolved_key = get_opencode_token("anthropic")
-        if not resolved_key:
-            resolved_key = settings.llm.anthropic_api_key.get_secret_value()
-        self._client = AsyncAnthropic(api_key=resolved_key)
+        self._api_key = api_key or settings.llm.anthropic_api_key.get_secret_value()
+        # OpenCode OAuth tokens expire, so they are looked up per call, not here
+        self._opencode_provider = (
+            "anthropic" if not api_key and settings.llm.use_opencode_auth else None
+        )
         self._model = model or settings.llm.anthropic_model
         self._max_tokens = 4096
 
+    @property
+    def _client(self) -> AsyncAnthropic:
+        # Looked up per call so each event loop gets a client on its own pool
+        return _shared_sdk_client(
+            AsyncAnthropic, _current_api_key(self._api_key, self._opencode_provider)
+        )
+
     @_retry_decorator()
     async def generate(self, prompt: str, system: str | None = None, **kwargs) -> str:
         try:
@@ -95,7 +300,7 @@ class AnthropicClient(LLMClient):
             response = await self._client.messages.create(
                 model=self._model,
                 max_tokens=kwargs.get("max_tokens", self._max_tokens),
-                system=system or "",
+                system=_cached_system(system),
                 messages=messages,
                 temperature=kwargs.get("temperature", 0.7),
             )
@@ -104,41 +309,99 @@ class AnthropicClient(LLMClient):
                 return content_block.text
             return str(content_block)
         except Exception as e:
-            error_str = str(e).lower()
-            if "rate" in error_str or "429" in error_str:
-                raise LLMRateLimitError(f"Anthropic rate limit: {e}") from e
-            raise LLMError(f"Anthropic generation failed: {e}") from e
+            raise _llm_error("Anthropic", "generation", e) from e
 
-    @_retry_decorator()
+    async def stream(self, prompt: str, system: str | None = None, **kwargs) -> AsyncIterator[str]:
+        try:
+            messages: list[MessageParam] = [{"role": "user", "content": prompt}]
+            # Sampling options go in untyped: not every SDK version declares them on stream()
+            sampling: dict[str, Any] = {"temperature": kwargs.get("temperature", 0.7)}
+            async with self._client.messages.stream(
+                model=self._model,
+                max_tokens=kwargs.get("max_tokens", self._max_tokens),
+                system=_cached_system(system),
+                messages=messages,
+                **sampling,
+            ) as response:
+                async for text in response.text_stream:
+                    yield text
+        except Exception as e:
+            raise _llm_error("Anthropic", "streaming", e) from e
+
+    # Not decorated: generate() already retries, and nesting would multiply the attempts
     async def generate_json(
         self, prompt: str, system: str | None = None, **kwargs
     ) -> dict[str, Any]:
-        json_system = (
-            system or ""
-        ) + "\n\nYou must respond with valid JSON only. No markdown, no explanation."
         try:
-            text = await self.generate(prompt, system=json_system, **kwargs)
-            text = text.strip()
-            if text.startswith("```"):
-                text = text.split("\n", 1)[1] if "\n" in text else text[3:]
-                text = text.rsplit("```", 1)[0]
-            return json.loads(text)
+            text = await self.generate(prompt, system=_json_system(system), **kwargs)
+            return _loads_json_text(text)
         except json.JSONDecodeError as e:
             raise LLMError(f"Failed to parse JSON response: {e}") from e
 
+    async def generate_json_batch(
+        self,
+        items: list[tuple[str, str | None]],
+        poll_interval: float = BATCH_POLL_INTERVAL,
+        **kwargs,
+    ) -> list[dict[str, Any] | BaseException]:
+        """Submit the pairs as one Message Batch (half price, async) and wait for it to end."""
+        requests: list[Any] = [
+            {
+                "custom_id": str(index),
+                "params": {
+                    "model": self._model,
+                    "max_tokens": kwargs.get("max_tokens", self._max_tokens),
+                    "system": _cached_system(_json_system(system)),
+                    "messages": [{"role": "user", "content": prompt}],
+                    "temperature": kwargs.get("temperature", 0.7),
+                },
+            }
+            for index, (prompt, system) in enumerate(items)
+        ]
+        results: list[dict[str, Any] | BaseException] = [
+            LLMError("Missing from batch results") for _ in items
+        ]
+        try:
+            batch = await self._client.messages.batches.create(requests=requests)
+            while batch.processing_status != "ended":
+                await asyncio.sleep(poll_interval)
+                batch = await self._client.messages.batches.retrieve(batch.id)
+
+            async for entry in await self._client.messages.batches.results(batch.id):
+                index = int(entry.custom_id)
+                if entry.result.type != "succeeded":
+                    results[index] = LLMError(f"Batch request {index} {entry.result.type}")
+                    continue
+                text = "".join(
+                    block.text for block in entry.result.message.content if block.type == "text"
+                )
+                try:
+                    results[index] = _loads_json_text(text)
+                except json.JSONDecodeError as e:
+                    results[index] = LLMError(f"Failed to parse JSON response: {e}")
+        except Exception as e:
+            raise _llm_error("Anthropic", "batch", e) from e
+        return results
+
 
 class OpenAIClient(LLMClient):
     def __init__(self, api_key: str | None = None, model: str = "gpt-4o"):
         settings = get_settings()
-        resolved_key = api_key
-        if not resolved_key and settings.llm.use_opencode_auth:
-            resolved_key = get_opencode_token("openai")
-        if not resolved_key:
-            resolved_key = settings.llm.openai_api_key.get_secret_value()
-        self._client = AsyncOpenAI(api_key=resolved_key)
+        self._api_key = api_key or settings.llm.openai_api_key.get_secret_value()
+        # OpenCode OAuth tokens expire, so they are looked up per call, not here
+        self._opencode_provider = (
+            "openai" if not api_key and settings.llm.use_opencode_auth else None
+        )
         self._model = model
         self._max_tokens = 4096
 
+    @property
+    def _client(self) -> AsyncOpenAI:
+        # Looked up per call so each event loop gets a client on its own pool
+        return _shared_sdk_client(
+            AsyncOpenAI, _current_api_key(self._api_key, self._opencode_provider)
+        )
+
     @_retry_decorator()
     async def generate(self, prompt: str, system: str | None = None, **kwargs) -> str:
         try:
@@ -155,23 +418,37 @@ class OpenAIClient(LLMClient):
             )
             return response.choices[0].message.content or ""
         except Exception as e:
-            error_str = str(e).lower()
-            if "rate" in error_str or "429" in error_str:
-                raise LLMRateLimitError(f"OpenAI rate limit: {e}") from e
-            raise LLMError(f"OpenAI generation failed: {e}") from e
+            raise _llm_error("OpenAI", "generation", e) from e
+
+    async def stream(self, prompt: str, system: str | None = None, **kwargs) -> AsyncIterator[str]:
+        try:
+            messages: list[ChatCompletionMessageParam] = []
+            if system:
+                messages.append({"role": "system", "content": system})
+            messages.append({"role": "user", "content": prompt})
+
+            response = await self._client.chat.completions.create(
+                model=self._model,
+                messages=messages,
+                max_tokens=kwargs.get("max_tokens", self._max_tokens),
+                temperature=kwargs.get("temperature", 0.7),
+                stream=True,
+            )
+            async for chunk in response:
+                if chunk.choices and (text := chunk.choices[0].delta.content):
+                    yield text
+        except Exception as e:
+            raise _llm_error("OpenAI", "streaming", e) from e
 
     @_retry_decorator()
     async def generate_json(
         self, prompt: str, system: str | None = None, **kwargs
     ) -> dict[str, Any]:
-        json_system = (
-            system or ""
-        ) + "\n\nYou must respond with valid JSON only. No markdown, no explanation."
         try:
             response = await self._client.chat.completions.create(
                 model=self._model,
                 messages=[
-                    {"role": "system", "content": json_system},
+                    {"role": "system", "content": _json_system(system)},
                     {"role": "user", "content": prompt},
                 ],
                 max_tokens=kwargs.get("max_tokens", self._max_tokens),
@@ -183,12 +460,78 @@ class OpenAIClient(LLMClient):
         except json.JSONDecodeError as e:
             raise LLMError(f"Failed to parse JSON response: {e}") from e
         except Exception as e:
-            error_str = str(e).lower()
-            if "rate" in error_str or "429" in error_str:
-                raise LLMRateLimitError(f"OpenAI rate limit: {e}") from e
-            raise LLMError(f"OpenAI JSON generation failed: {e}") from e
+            raise _llm_error("OpenAI", "JSON generation", e) from e
+
+    async def generate_json_batch(
+        self,
+        items: list[tuple[str, str | None]],
+        poll_interval: float = BATCH_POLL_INTERVAL,
+        **kwargs,
+    ) -> list[dict[str, Any] | BaseException]:
+        """Upload the pairs as one Batch API job (half price, async) and wait for it to finish."""
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": str(index),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": self._model,
+                        "messages": [
+                            {"role": "system", "content": _json_system(system)},
+                            {"role": "user", "content": prompt},
+                        ],
+                        "max_tokens": kwargs.get("max_tokens", self._max_tokens),
+                        "temperature": kwargs.get("temperature", 0.7),
+                        "response_format": {"type": "json_object"},
+                    },
+                }
+            )
+            for index, (prompt, system) in enumerate(items)
+        ]
+        try:
+            upload = await self._client.files.create(
+                file=("batch.jsonl", "\n".join(lines).encode()), purpose="batch"
+            )
+            batch = await self._client.batches.create(
+                input_file_id=upload.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                await asyncio.sleep(poll_interval)
+                batch = await self._client.batches.retrieve(batch.id)
+            if batch.status != "completed" or not batch.output_file_id:
+                raise LLMError(f"OpenAI batch {batch.id} ended as {batch.status}")
+            output = await self._client.files.content(batch.output_file_id)
+        except LLMError:
+            raise
+        except Exception as e:
+            raise _llm_error("OpenAI", "batch", e) from e
+
+        results: list[dict[str, Any] | BaseException] = [
+            LLMError("Missing from batch results") for _ in items
+        ]
+        for line in output.text.splitlines():
+            if not line:
+                continue
+            entry = json.loads(line)
+            index = int(entry["custom_id"])
+            response = entry.get("response") or {}
+            if entry.get("error") or response.get("status_code") != 200:
+                results[index] = LLMError(
+                    f"Batch request {index} failed: {entry.get('error') or response.get('body')}"
+                )
+                continue
+            text = response["body"]["choices"][0]["message"]["content"] or "{}"
+            try:
+                results[index] = json.loads(text)
+            except json.JSONDecodeError as e:
+                results[index] = LLMError(f"Failed to parse JSON response: {e}")
+        return results
 
 
+@cache
 def get_llm_client(provider: str = "anthropic", **kwargs) -> LLMClient:
     providers = {
         "anthropic": AnthropicClient,
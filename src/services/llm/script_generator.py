@@ -1,6 +1,15 @@
+import asyncio
+import copy
+import hashlib
+import json
 import re
-from typing import TypedDict
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from functools import cache
+from typing import Any, TypedDict, TypeVar
 
+from config import get_settings
 from src.core.exceptions import LLMError
 from src.core.interfaces import ScriptGenerator as ScriptGeneratorABC
 from src.core.models import ChannelType, Script
@@ -91,9 +100,30 @@ Return JSON:
 }}"""
 
 
+# The marker list per channel is fixed, so join it once rather than per script
+_EMOTION_MARKERS_STR = {
+    channel: ", ".join(prompts["emotion_markers"]) for channel, prompts in CHANNEL_PROMPTS.items()
+}
+
+_SCRIPT_TEMPERATURE = 0.7
+_SCRIPT_MAX_TOKENS = 8192
+
+_T = TypeVar("_T")
+
+_PROFANITY_RE = re.compile(r"\b(fuck|shit|damn|ass)\b", re.IGNORECASE)
+
+# A complete "hook" string value, escapes included, in a partially streamed response
+_HOOK_RE = re.compile(r'"hook"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+
 class ScriptGeneratorImpl(ScriptGeneratorABC):
     def __init__(self, llm_client: LLMClient | None = None, provider: str = "anthropic"):
         self._client = llm_client or get_llm_client(provider)
+        llm = get_settings().llm
+        self._cache_ttl = llm.script_cache_ttl
+        self._cache_size = llm.script_cache_size
+        # prompt key -> (parsed script JSON, monotonic time stored), least recent first
+        self._result_cache: OrderedDict[str, tuple[dict[str, Any], float]] = OrderedDict()
 
     async def generate_topic(self, channel: ChannelType) -> str:
         prompts = CHANNEL_PROMPTS.get(channel)
@@ -107,7 +137,71 @@ class ScriptGeneratorImpl(ScriptGeneratorABC):
         )
         return result.strip()
 
-    async def generate_script(self, topic: str, channel: ChannelType) -> Script:
+    async def generate_script(
+        self,
+        topic: str,
+        channel: ChannelType,
+        on_hook: Callable[[str], None] | None = None,
+    ) -> Script:
+        """Generate a script for the topic.
+
+        With ``on_hook`` the response is streamed and the hook is handed over
+        as soon as it is complete, so TTS or thumbnail work can start while
+        the body is still being written.
+        """
+        prompt, system = self._script_request(topic, channel)
+        key = _result_cache_key(prompt, system)
+        result = self._cache_get(key)
+        if result is None:
+            result = await self._generate_script_json(prompt, system, on_hook)
+            self._cache_put(key, result)
+        elif on_hook is not None:
+            on_hook(result.get("hook", ""))
+        return self._script_from_result(result, topic, channel)
+
+    async def _generate_script_json(
+        self, prompt: str, system: str, on_hook: Callable[[str], None] | None
+    ) -> dict[str, Any]:
+        if on_hook is None:
+            return await self._client.generate_json(
+                prompt=prompt,
+                system=system,
+                temperature=_SCRIPT_TEMPERATURE,
+                max_tokens=_SCRIPT_MAX_TOKENS,
+            )
+        return await self._client.stream_json(
+            prompt=prompt,
+            system=system,
+            on_text=_hook_watcher(on_hook),
+            temperature=_SCRIPT_TEMPERATURE,
+            max_tokens=_SCRIPT_MAX_TOKENS,
+        )
+
+    def _cache_get(self, key: str) -> dict[str, Any] | None:
+        entry = self._result_cache.get(key)
+        if entry is None:
+            return None
+        result, stored_at = entry
+        if time.monotonic() - stored_at > self._cache_ttl:
+            del self._result_cache[key]
+            return None
+        self._result_cache.move_to_end(key)
+        # Scripts take the lists from the response as-is, so never hand out the cached ones
+        return copy.deepcopy(result)
+
+    def _cache_put(self, key: str, result: dict[str, Any]) -> None:
+        if self._cache_ttl <= 0 or self._cache_size <= 0:
+            return
+        self._result_cache[key] = (copy.deepcopy(result), time.monotonic())
+        self._result_cache.move_to_end(key)
+        if len(self._result_cache) > self._cache_size:
+            self._result_cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Drop every cached script response."""
+        self._result_cache.clear()
+
+    def _script_request(self, topic: str, channel: ChannelType) -> tuple[str, str]:
         prompts = CHANNEL_PROMPTS.get(channel)
         if not prompts:
             raise LLMError(f"No prompts configured for channel: {channel}")
@@ -115,16 +209,13 @@ class ScriptGeneratorImpl(ScriptGeneratorABC):
         prompt = SCRIPT_PROMPT_TEMPLATE.format(
             topic=topic,
             channel_type=channel.value,
-            emotion_markers=", ".join(prompts["emotion_markers"]),
-        )
-
-        result = await self._client.generate_json(
-            prompt=prompt,
-            system=prompts["script_system"],
-            temperature=0.7,
-            max_tokens=8192,
+            emotion_markers=_EMOTION_MARKERS_STR[channel],
         )
+        return prompt, prompts["script_system"]
 
+    def _script_from_result(
+        self, result: dict[str, Any], topic: str, channel: ChannelType
+    ) -> Script:
         return Script(
             title=result.get("title", topic[:60]),
             hook=result.get("hook", ""),
@@ -135,6 +226,58 @@ class ScriptGeneratorImpl(ScriptGeneratorABC):
             keywords=result.get("keywords", []),
         )
 
+    async def generate_topics_batch(
+        self, channels: list[ChannelType], max_concurrency: int = 16
+    ) -> list[str | BaseException]:
+        """Generate one topic per channel concurrently; failures are returned in place."""
+        return await _gather_bounded(
+            [self.generate_topic(channel) for channel in channels], max_concurrency
+        )
+
+    async def generate_scripts_batch(
+        self,
+        requests: list[tuple[str, ChannelType]],
+        max_concurrency: int = 16,
+        batch: bool = False,
+    ) -> list[Script | BaseException]:
+        """Generate scripts for (topic, channel) pairs concurrently; failures are returned in place.
+
+        With ``batch=True`` the requests go through the provider's batch API
+        instead: roughly half the cost, but results can take hours.
+        """
+        if not batch:
+            return await _gather_bounded(
+                [self.generate_script(topic, channel) for topic, channel in requests],
+                max_concurrency,
+            )
+
+        script_requests = [self._script_request(topic, channel) for topic, channel in requests]
+        keys = [_result_cache_key(prompt, system) for prompt, system in script_requests]
+        cached = [self._cache_get(key) for key in keys]
+        misses = [i for i, result in enumerate(cached) if result is None]
+        fetched: dict[int, dict[str, Any] | BaseException] = {}
+        if misses:
+            batch_results = await self._client.generate_json_batch(
+                [script_requests[i] for i in misses],
+                temperature=_SCRIPT_TEMPERATURE,
+                max_tokens=_SCRIPT_MAX_TOKENS,
+            )
+            fetched = dict(zip(misses, batch_results, strict=True))
+            for i, result in fetched.items():
+                if not isinstance(result, BaseException):
+                    self._cache_put(keys[i], result)
+
+        scripts: list[Script | BaseException] = []
+        for i, (topic, channel) in enumerate(requests):
+            hit = cached[i]
+            result = hit if hit is not None else fetched[i]
+            scripts.append(
+                result
+                if isinstance(result, BaseException)
+                else self._script_from_result(result, topic, channel)
+            )
+        return scripts
+
     async def validate_script(self, script: Script) -> tuple[bool, list[str]]:
         errors: list[str] = []
 
@@ -153,19 +296,16 @@ class ScriptGeneratorImpl(ScriptGeneratorABC):
         if not script.emotion_markers:
             errors.append("No emotion markers found")
 
-        full_script = f"{script.hook} {script.body} {script.cta}"
-        word_count = len(full_script.split())
+        # Script.word_count counts each part separately and is cached on the script
+        word_count = script.word_count
 
         if word_count < 800:
             errors.append(f"Script too short: {word_count} words (min 800)")
         elif word_count > 2500:
             errors.append(f"Script too long: {word_count} words (max 2500)")
 
-        profanity_patterns = [r"\b(fuck|shit|damn|ass)\b"]
-        for pattern in profanity_patterns:
-            if re.search(pattern, full_script, re.IGNORECASE):
-                errors.append("Script contains profanity (demonetization risk)")
-                break
+        if any(_PROFANITY_RE.search(part) for part in (script.hook, script.body, script.cta)):
+            errors.append("Script contains profanity (demonetization risk)")
 
         has_section_breaks = "[SECTION]" in script.body or "\n\n" in script.body
         if not has_section_breaks:
@@ -174,6 +314,44 @@ class ScriptGeneratorImpl(ScriptGeneratorABC):
         return len(errors) == 0, errors
 
 
+async def _gather_bounded(
+    calls: list[Awaitable[_T]], max_concurrency: int
+) -> list[_T | BaseException]:
+    # Coroutines don't start until awaited, so the semaphore bounds in-flight LLM calls
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(call: Awaitable[_T]) -> _T:
+        async with semaphore:
+            return await call
+
+    return await asyncio.gather(*(run(call) for call in calls), return_exceptions=True)
+
+
+def _result_cache_key(prompt: str, system: str) -> str:
+    # The model is fixed per generator, so prompt, system and temperature identify a request
+    payload = f"{prompt}\0{system}\0{_SCRIPT_TEMPERATURE}".encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _hook_watcher(on_hook: Callable[[str], None]) -> Callable[[str], None]:
+    """Build an on_text callback that calls on_hook once with the hook from the stream."""
+    buffer = ""
+    done = False
+
+    def on_text(text: str) -> None:
+        nonlocal buffer, done
+        if done:
+            return
+        buffer += text
+        if match := _HOOK_RE.search(buffer):
+            done = True
+            buffer = ""
+            on_hook(json.loads(f'"{match.group(1)}"'))
+
+    return on_text
+
+
+@cache
 def get_script_generator(provider: str = "anthropic", **kwargs) -> ScriptGeneratorImpl:
     client = get_llm_client(provider, **kwargs)
     return ScriptGeneratorImpl(llm_client=client)
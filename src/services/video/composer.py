@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING, Any
 
 from config import get_settings
 from src.core.exceptions import FFmpegError, VideoCompositionError
+from src.services.ffmpeg import encoder_available
 from src.services.video.music import MusicMixer
 from src.services.video.subtitles import SubtitleGenerator, SubtitleStyle
 
@@ -30,6 +31,7 @@ class VideoComposer:
 
     def __init__(self) -> None:
         settings = get_settings()
+        settings.paths.ensure_directories()
         self.output_dir = Path(settings.paths.output_dir)
         self.temp_dir = Path(getattr(settings, "temp_dir", "/tmp"))
         ffmpeg_path = shutil.which("ffmpeg")
@@ -44,13 +46,36 @@ class VideoComposer:
         self.music_mixer = MusicMixer()
         self._executor = ThreadPoolExecutor(max_workers=4)
 
-    async def compose(self, project: Any, output_path: Path) -> Path:
+    async def compose(
+        self,
+        project: Any,
+        output_path: Path,
+        encoder: str | None = None,
+        encoder_options: dict[str, str] | None = None,
+        hwaccel: str | None = None,
+    ) -> Path:
+        """Compose the final video.
+
+        encoder selects the ffmpeg video encoder (e.g. ``h264_nvenc``) and
+        encoder_options its flags; an encoder that fails to initialise on this
+        host falls back to libx264. hwaccel enables hardware decoding of the
+        intermediate clips.
+        """
         loop = asyncio.get_event_loop()
+        video_args = await loop.run_in_executor(
+            self._executor, self._video_encode_args, encoder, encoder_options
+        )
+        # Hardware decoding only pays off when the encoder is on the same device
+        hwaccel_args = (
+            ["-hwaccel", hwaccel] if hwaccel and video_args[1] != self.VIDEO_CODEC else []
+        )
         return await loop.run_in_executor(
             self._executor,
             self._compose_sync,
             project,
             output_path,
+            video_args,
+            hwaccel_args,
         )
 
     async def add_subtitles(
@@ -70,7 +95,25 @@ class VideoComposer:
             style,
         )
 
-    def _compose_sync(self, project: Any, output_path: Path) -> Path:
+    def _video_encode_args(
+        self, encoder: str | None, encoder_options: dict[str, str] | None
+    ) -> list[str]:
+        if encoder and encoder != self.VIDEO_CODEC and encoder_available(self._ffmpeg, encoder):
+            args = ["-c:v", encoder]
+            for key, value in (encoder_options or {}).items():
+                args.extend([f"-{key}", value])
+            return args
+        return ["-c:v", self.VIDEO_CODEC, "-crf", str(self.CRF), "-preset", "fast"]
+
+    def _compose_sync(
+        self,
+        project: Any,
+        output_path: Path,
+        video_args: list[str] | None = None,
+        hwaccel_args: list[str] | None = None,
+    ) -> Path:
+        video_args = video_args or self._video_encode_args(None, None)
+        hwaccel_args = hwaccel_args or []
         with tempfile.TemporaryDirectory(dir=self.temp_dir) as temp:
             temp_path = Path(temp)
 
@@ -78,9 +121,13 @@ class VideoComposer:
             audio_segments = self._get_audio_segments(project)
             channel_type = self._get_channel_type(project)
 
-            visual_clips = self._prepare_visual_clips(visuals, temp_path)
-            concatenated = self._concatenate_clips(visual_clips, temp_path / "concat.mp4")
-            scaled = self._scale_video(concatenated, temp_path / "scaled.mp4")
+            visual_clips = self._prepare_visual_clips(visuals, temp_path, video_args, hwaccel_args)
+            concatenated = self._concatenate_clips(
+                visual_clips, temp_path / "concat.mp4", video_args, hwaccel_args
+            )
+            scaled = self._scale_video(
+                concatenated, temp_path / "scaled.mp4", video_args, hwaccel_args
+            )
 
             main_audio = self._prepare_audio(audio_segments, temp_path)
 
@@ -217,6 +264,8 @@ class VideoComposer:
         self,
         visuals: list[Any],
         temp_dir: Path,
+        video_args: list[str] | None = None,
+        hwaccel_args: list[str] | None = None,
     ) -> list[Path]:
         prepared: list[Path] = []
 
@@ -225,11 +274,11 @@ class VideoComposer:
 
             asset_type = getattr(visual, "asset_type", getattr(visual, "type", "image"))
             if asset_type == "video":
-                clip = self._prepare_video_clip(visual, output_clip)
+                clip = self._prepare_video_clip(visual, output_clip, video_args, hwaccel_args)
             else:
                 duration = float(getattr(visual, "duration", 5.0))
                 visual_path = self._get_path(visual)
-                clip = self._image_to_video(visual_path, output_clip, duration)
+                clip = self._image_to_video(visual_path, output_clip, duration, video_args)
 
             prepared.append(clip)
 
@@ -245,13 +294,20 @@ class VideoComposer:
             return Path(obj)
         raise VideoCompositionError(f"Cannot extract path from {type(obj)}")
 
-    def _prepare_video_clip(self, visual: Any, output_path: Path) -> Path:
+    def _prepare_video_clip(
+        self,
+        visual: Any,
+        output_path: Path,
+        video_args: list[str] | None = None,
+        hwaccel_args: list[str] | None = None,
+    ) -> Path:
         visual_path = self._get_path(visual)
         duration = getattr(visual, "duration", None)
 
         cmd = [
             self._ffmpeg,
             "-y",
+            *(hwaccel_args or []),
             "-i",
             str(visual_path),
         ]
@@ -260,12 +316,7 @@ class VideoComposer:
 
         cmd.extend(
             [
-                "-c:v",
-                self.VIDEO_CODEC,
-                "-crf",
-                str(self.CRF),
-                "-preset",
-                "fast",
+                *(video_args or self._video_encode_args(None, None)),
                 "-an",
                 str(output_path),
             ]
@@ -282,6 +333,7 @@ class VideoComposer:
         image_path: Path,
         output_path: Path,
         duration: float,
+        video_args: list[str] | None = None,
     ) -> Path:
         zoom_filter = (
             f"scale={self.OUTPUT_WIDTH}:{self.OUTPUT_HEIGHT}:force_original_aspect_ratio=decrease,"
@@ -300,12 +352,7 @@ class VideoComposer:
             zoom_filter,
             "-t",
             str(duration),
-            "-c:v",
-            self.VIDEO_CODEC,
-            "-crf",
-            str(self.CRF),
-            "-preset",
-            "fast",
+            *(video_args or self._video_encode_args(None, None)),
             "-pix_fmt",
             "yuv420p",
             "-r",
@@ -323,6 +370,8 @@ class VideoComposer:
         self,
         clips: list[Path],
         output_path: Path,
+        video_args: list[str] | None = None,
+        hwaccel_args: list[str] | None = None,
     ) -> Path:
         if not clips:
             raise VideoCompositionError("No clips to concatenate")
@@ -339,18 +388,14 @@ class VideoComposer:
         cmd = [
             self._ffmpeg,
             "-y",
+            *(hwaccel_args or []),
             "-f",
             "concat",
             "-safe",
             "0",
             "-i",
             str(concat_file),
-            "-c:v",
-            self.VIDEO_CODEC,
-            "-crf",
-            str(self.CRF),
-            "-preset",
-            "fast",
+            *(video_args or self._video_encode_args(None, None)),
             str(output_path),
         ]
 
@@ -360,21 +405,23 @@ class VideoComposer:
 
         return output_path
 
-    def _scale_video(self, input_path: Path, output_path: Path) -> Path:
+    def _scale_video(
+        self,
+        input_path: Path,
+        output_path: Path,
+        video_args: list[str] | None = None,
+        hwaccel_args: list[str] | None = None,
+    ) -> Path:
         cmd = [
             self._ffmpeg,
             "-y",
+            *(hwaccel_args or []),
             "-i",
             str(input_path),
             "-vf",
             f"scale={self.OUTPUT_WIDTH}:{self.OUTPUT_HEIGHT}:force_original_aspect_ratio=decrease,"
             f"pad={self.OUTPUT_WIDTH}:{self.OUTPUT_HEIGHT}:(ow-iw)/2:(oh-ih)/2:black",
-            "-c:v",
-            self.VIDEO_CODEC,
-            "-crf",
-            str(self.CRF),
-            "-preset",
-            "fast",
+            *(video_args or self._video_encode_args(None, None)),
             "-r",
             str(self.OUTPUT_FPS),
             str(output_path),
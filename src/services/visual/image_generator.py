@@ -36,11 +36,19 @@ CHANNEL_STYLE_PRESETS: dict[ChannelType, dict[str, Any]] = {
 DEFAULT_STYLE = CHANNEL_STYLE_PRESETS[ChannelType.FACTS]
 
 
+def _write_image(output_path: Path, data: bytes) -> None:
+    # Directory creation and the multi-MB write share one worker-thread hop
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_bytes(data)
+
+
 class ImageGenerator(ImageGeneratorABC):
-    def __init__(self) -> None:
+    def __init__(self, http_client: httpx.AsyncClient | None = None) -> None:
         self.settings = get_settings()
         self._openai: AsyncOpenAI | None = None
-        self._http_client: httpx.AsyncClient | None = None
+        # A shared client is borrowed from the caller and left open on close()
+        self._http_client = http_client
+        self._owns_http_client = http_client is None
 
     async def _get_openai(self) -> AsyncOpenAI:
         if self._openai is None:
@@ -108,8 +116,7 @@ class ImageGenerator(ImageGeneratorABC):
         response = await client.get(image_url)
         response.raise_for_status()
 
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_bytes(response.content)
+        await asyncio.to_thread(_write_image, output_path, response.content)
 
         return VisualAsset(
             asset_type="image",
@@ -156,8 +163,7 @@ class ImageGenerator(ImageGeneratorABC):
         if b64_json is None:
             raise ImageGenerationError("DALL-E 3 returned no image data")
         image_data = base64.b64decode(b64_json)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_bytes(image_data)
+        await asyncio.to_thread(_write_image, output_path, image_data)
 
         return VisualAsset(
             asset_type="image",
@@ -222,7 +228,7 @@ class ImageGenerator(ImageGeneratorABC):
         return assets
 
     async def close(self) -> None:
-        if self._http_client:
+        if self._http_client and self._owns_http_client:
             await self._http_client.aclose()
             self._http_client = None
         if self._openai:
@@ -10,12 +10,16 @@ from pathlib import Path
 from typing import Any, Literal
 
 import httpx
+import structlog
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 from config import get_settings
 from src.core.exceptions import VideoGenerationError
 from src.core.interfaces import VideoGenerator as VideoGeneratorABC
 from src.core.models import ChannelType, VisualAsset
+from src.services.ffmpeg import encoder_available
+
+logger = structlog.get_logger(__name__)
 
 KenBurnsEffect = Literal["zoom_in", "zoom_out", "pan_left", "pan_right", "pan_up", "pan_down"]
 
@@ -50,9 +54,11 @@ CHANNEL_MOTION_PRESETS: dict[ChannelType, dict[str, Any]] = {
 class VideoGenerator(VideoGeneratorABC):
     RUNWAY_API_BASE = "https://api.dev.runwayml.com/v1"
 
-    def __init__(self) -> None:
+    def __init__(self, http_client: httpx.AsyncClient | None = None) -> None:
         self.settings = get_settings()
-        self._http_client: httpx.AsyncClient | None = None
+        # A shared client is borrowed from the caller and left open on close()
+        self._http_client = http_client
+        self._owns_http_client = http_client is None
 
     async def _get_http_client(self) -> httpx.AsyncClient:
         if self._http_client is None:
@@ -171,9 +177,62 @@ class VideoGenerator(VideoGeneratorABC):
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
+        nvenc = bool(kwargs.get("hw_accel")) and await asyncio.to_thread(
+            encoder_available, ffmpeg, "h264_nvenc"
+        )
+        try:
+            await self._encode_ken_burns(
+                ffmpeg, image_path, filter_complex, dur_int, output_path, nvenc=nvenc
+            )
+        except VideoGenerationError as e:
+            if not nvenc:
+                raise
+            # The probe only shows NVENC works at all; concurrent clips can still
+            # exceed the GPU's session limit, so this clip is redone on the CPU
+            logger.warning("ken_burns_nvenc_failed", output=str(output_path), error=str(e))
+            await self._encode_ken_burns(
+                ffmpeg, image_path, filter_complex, dur_int, output_path, nvenc=False
+            )
+
+        return VisualAsset(
+            asset_type="video",
+            path=output_path,
+            prompt=f"ken_burns_{effect}",
+            duration=duration,
+            metadata={
+                "effect": effect,
+                "source_image": str(image_path),
+                "width": width,
+                "height": height,
+                "provider": "ffmpeg_ken_burns",
+            },
+        )
+
+    async def _encode_ken_burns(
+        self,
+        ffmpeg: str,
+        image_path: Path,
+        filter_complex: str,
+        dur_int: int,
+        output_path: Path,
+        nvenc: bool,
+    ) -> None:
+        hw_device_args: list[str] = []
+        if nvenc:
+            # zoompan has no CUDA counterpart, so frames are uploaded once it has
+            # run and the encode happens on the GPU
+            hw_device_args = ["-init_hw_device", "cuda=cu", "-filter_hw_device", "cu"]
+            filter_complex += ",format=nv12,hwupload_cuda"
+            codec_args = ["-c:v", "h264_nvenc", "-preset", "p4", "-rc", "vbr", "-cq", "23"]
+            codec_args += ["-b:v", "0"]
+        else:
+            codec_args = ["-c:v", "libx264", "-preset", "medium", "-crf", "18"]
+            codec_args += ["-pix_fmt", "yuv420p"]
+
         cmd = [
             ffmpeg,
             "-y",
+            *hw_device_args,
             "-loop",
             "1",
             "-i",
@@ -182,14 +241,7 @@ class VideoGenerator(VideoGeneratorABC):
             filter_complex,
             "-t",
             str(dur_int),
-            "-c:v",
-            "libx264",
-            "-preset",
-            "medium",
-            "-crf",
-            "18",
-            "-pix_fmt",
-            "yuv420p",
+            *codec_args,
             "-movflags",
             "+faststart",
             str(output_path),
@@ -205,20 +257,6 @@ class VideoGenerator(VideoGeneratorABC):
         if process.returncode != 0:
             raise VideoGenerationError(f"FFmpeg Ken Burns failed: {stderr.decode()}")
 
-        return VisualAsset(
-            asset_type="video",
-            path=output_path,
-            prompt=f"ken_burns_{effect}",
-            duration=duration,
-            metadata={
-                "effect": effect,
-                "source_image": str(image_path),
-                "width": width,
-                "height": height,
-                "provider": "ffmpeg_ken_burns",
-            },
-        )
-
     async def generate_from_image(
         self,
         image_path: Path | str,
@@ -369,7 +407,7 @@ class VideoGenerator(VideoGeneratorABC):
         return 0.0
 
     async def close(self) -> None:
-        if self._http_client:
+        if self._http_client and self._owns_http_client:
             await self._http_client.aclose()
             self._http_client = None
 
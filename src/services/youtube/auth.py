@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import math
+import time
+from datetime import UTC, datetime
+from pathlib import Path
 from typing import Any
 
+import requests  # type: ignore[import-untyped]
 import structlog
+from google.auth.exceptions import RefreshError  # type: ignore[import-untyped]
 from google.auth.transport.requests import Request  # type: ignore[import-untyped]
 from google.oauth2.credentials import Credentials  # type: ignore[import-untyped]
 from google_auth_oauthlib.flow import InstalledAppFlow  # type: ignore[import-untyped]
@@ -21,6 +28,20 @@ SCOPES = [
     "https://www.googleapis.com/auth/yt-analytics.readonly",
 ]
 
+# Cached credentials are reused only while they have this much lifetime left
+TOKEN_EXPIRY_BUFFER_SECONDS = 300
+
+# Process-wide token_path -> (credentials, expiry epoch) so every YouTubeAuth
+# instance shares one load/refresh instead of re-reading the token file
+_TOKEN_CACHE: dict[Path, tuple[Credentials, float]] = {}
+
+
+def _expiry_epoch(creds: Credentials) -> float:
+    # google-auth stores expiry as naive UTC; no expiry means the token never expires
+    if creds.expiry is None:
+        return math.inf
+    return creds.expiry.replace(tzinfo=UTC).timestamp()
+
 
 class YouTubeAuth:
     def __init__(self) -> None:
@@ -30,15 +51,25 @@ class YouTubeAuth:
         self._credentials: Credentials | None = None
         self._youtube: Any = None
         self._analytics: Any = None
+        # One pooled HTTPS session for token refresh/revoke instead of a new one per call
+        self._transport = Request(session=requests.Session())
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task[None] | None = None
 
     def authenticate(self, headless: bool = False) -> Credentials:
         if self._credentials and self._credentials.valid:
             return self._credentials
 
+        cached = _TOKEN_CACHE.get(self._token_path)
+        if cached and cached[1] - time.time() > TOKEN_EXPIRY_BUFFER_SECONDS:
+            self._credentials = cached[0]
+            return cached[0]
+
         if self._token_path.exists():
             creds = self._load_token()
             if creds and creds.valid:
                 self._credentials = creds
+                self._cache_credentials(creds)
                 return creds
             if creds and creds.expired and creds.refresh_token:
                 try:
@@ -53,8 +84,57 @@ class YouTubeAuth:
                     )
 
         self._credentials = self._run_oauth_flow(headless=headless)
+        self._cache_credentials(self._credentials)
         return self._credentials
 
+    async def get_valid_credentials(self) -> Credentials:
+        """Return usable credentials without blocking on a refresh unless they have expired.
+
+        Credentials inside the expiry buffer are returned as-is while a single
+        background task refreshes them; expired ones are refreshed inline.
+        """
+        if self._credentials is None:
+            return await asyncio.to_thread(self.authenticate)
+
+        time_to_expiry = _expiry_epoch(self._credentials) - time.time()
+        if time_to_expiry <= 0:
+            await self._refresh_async()
+        elif time_to_expiry < TOKEN_EXPIRY_BUFFER_SECONDS and (
+            self._refresh_task is None or self._refresh_task.done()
+        ):
+            self._refresh_task = asyncio.create_task(self._background_refresh())
+
+        if self._credentials is None:
+            raise YouTubeAuthError("No credentials available")
+        return self._credentials
+
+    async def _refresh_async(self) -> None:
+        async with self._refresh_lock:
+            # Another caller may have refreshed while we waited for the lock
+            if (
+                self._credentials is not None
+                and _expiry_epoch(self._credentials) - time.time() > TOKEN_EXPIRY_BUFFER_SECONDS
+            ):
+                return
+            await asyncio.to_thread(self._refresh_token)
+
+    async def _background_refresh(self) -> None:
+        try:
+            await self._refresh_async()
+        except YouTubeAuthError:
+            logger.warning(
+                "token_background_refresh_failed",
+                token_path=str(self._token_path),
+                exc_info=True,
+            )
+
+    def _cache_credentials(self, creds: Credentials) -> None:
+        _TOKEN_CACHE[self._token_path] = (creds, _expiry_epoch(creds))
+
+    def invalidate_cache(self) -> None:
+        """Drop the process-wide cached credentials for this token file."""
+        _TOKEN_CACHE.pop(self._token_path, None)
+
     @property
     def credentials(self) -> Credentials:
         return self.authenticate(headless=False)
@@ -95,6 +175,12 @@ class YouTubeAuth:
             client_secret=token_data.get("client_secret"),
             scopes=token_data.get("scopes"),
         )
+        if expiry := token_data.get("expiry"):
+            # _save_token writes naive UTC, which is what google-auth compares against
+            parsed = datetime.fromisoformat(expiry)
+            if parsed.tzinfo is not None:
+                parsed = parsed.astimezone(UTC).replace(tzinfo=None)
+            creds.expiry = parsed
 
         if creds.expired and creds.refresh_token:
             self._credentials = creds
@@ -155,24 +241,29 @@ class YouTubeAuth:
             raise YouTubeAuthError("No credentials to refresh")
 
         try:
-            self._credentials.refresh(Request())
+            # Refreshed in place, so built API clients keep working with the new token
+            self._credentials.refresh(self._transport)
             self._save_token(self._credentials)
-            self._youtube = None
-            self._analytics = None
+            self._cache_credentials(self._credentials)
+        except RefreshError as e:
+            # Only a revoked or expired refresh token is unrecoverable; anything
+            # else (outage, rate limit) leaves the token file for the next attempt
+            if "invalid_grant" in str(e):
+                self._token_path.unlink(missing_ok=True)
+                self.invalidate_cache()
+            raise YouTubeAuthError(f"Token refresh failed: {e}") from e
         except Exception as e:
-            self._token_path.unlink(missing_ok=True)
             raise YouTubeAuthError(f"Token refresh failed: {e}") from e
 
     def revoke(self) -> bool:
         if self._credentials and self._credentials.token:
-            import requests  # type: ignore[import-untyped]
-
-            response = requests.post(
+            response = self._transport.session.post(
                 "https://oauth2.googleapis.com/revoke",
                 params={"token": self._credentials.token},
                 headers={"content-type": "application/x-www-form-urlencoded"},
             )
             self._token_path.unlink(missing_ok=True)
+            self.invalidate_cache()
             self._credentials = None
             self._youtube = None
             self._analytics = None
@@ -72,6 +72,8 @@ class YouTubeUploader(YouTubeUploaderBase):
             body["status"]["privacyStatus"] = "private"
             body["status"]["publishAt"] = self._format_scheduled_time(scheduled_at)
 
+        # Refresh expired credentials up front; near-expiry ones refresh in the background
+        await self._auth.get_valid_credentials()
         loop = asyncio.get_event_loop()
         video_id: str = await loop.run_in_executor(_executor, self._sync_upload, video_path, body)
 
@@ -0,0 +1,150 @@
+"""Tests for the finance pipeline's LLM request handling."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from src.channels.finance import FinancePipeline
+from src.channels.finance.pipeline import _retry_after_seconds
+from src.channels.llm_cache import LLMResponseCache
+from src.core.exceptions import LLMRateLimitError
+
+
+@pytest.fixture
+def llm_client() -> MagicMock:
+    client = MagicMock()
+    client.generate = AsyncMock(return_value="response")
+    return client
+
+
+@pytest.fixture
+def pipeline(mock_services, tmp_output_dir: Path, llm_client: MagicMock) -> FinancePipeline:
+    return FinancePipeline(
+        **mock_services,
+        output_base=tmp_output_dir,
+        llm_client=llm_client,
+        llm_cache=LLMResponseCache(),
+    )
+
+
+class TestSingleFlight:
+    """Test coalescing of concurrent identical prompts."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_prompts_share_one_call(
+        self, pipeline: FinancePipeline, llm_client: MagicMock
+    ):
+        """Identical prompts in flight at the same time make one LLM call."""
+        release = asyncio.Event()
+
+        async def generate(prompt: str) -> str:
+            await release.wait()
+            return f"response to {prompt}"
+
+        llm_client.generate.side_effect = generate
+        callers = [asyncio.create_task(pipeline._llm_generate("prompt")) for _ in range(3)]
+        other = asyncio.create_task(pipeline._llm_generate("other"))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*callers) == ["response to prompt"] * 3
+        assert await other == "response to other"
+        assert llm_client.generate.await_count == 2
+        assert pipeline._llm_inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_request(
+        self, pipeline: FinancePipeline, llm_client: MagicMock
+    ):
+        """Cancelling one waiter leaves the request running for the others."""
+        release = asyncio.Event()
+
+        async def generate(prompt: str) -> str:
+            await release.wait()
+            return "response"
+
+        llm_client.generate.side_effect = generate
+        first = asyncio.create_task(pipeline._llm_generate("prompt"))
+        second = asyncio.create_task(pipeline._llm_generate("prompt"))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "response"
+        assert first.cancelled()
+        assert llm_client.generate.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_uncached_prompts_are_not_coalesced(
+        self, pipeline: FinancePipeline, llm_client: MagicMock
+    ):
+        """Topic prompts opt out of caching and get a fresh response per call."""
+        await asyncio.gather(*(pipeline._llm_generate("topics", cache=False) for _ in range(2)))
+
+        assert llm_client.generate.await_count == 2
+
+
+def _http_error(status_code: int, retry_after: str | None = None) -> httpx.HTTPStatusError:
+    headers = {"retry-after": retry_after} if retry_after is not None else {}
+    request = httpx.Request("POST", "https://api.example.com/v1/messages")
+    response = httpx.Response(status_code, headers=headers, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+class TestRetryAfter:
+    """Test Retry-After parsing for LLM backoff."""
+
+    @pytest.mark.parametrize(
+        ("retry_after", "expected"),
+        [("2", 2.0), ("0.5", 0.5), ("600", 60.0), ("Wed, 21 Oct 2026 07:28:00 GMT", None)],
+    )
+    def test_header_value(self, retry_after: str, expected: float | None):
+        """Seconds are capped at a minute; HTTP dates fall back to backoff."""
+        assert _retry_after_seconds(_http_error(429, retry_after)) == expected
+
+    def test_header_on_wrapped_error(self):
+        """The header is found on the SDK error an LLMError was raised from."""
+        try:
+            try:
+                raise _http_error(429, "3")
+            except httpx.HTTPStatusError as e:
+                raise LLMRateLimitError("rate limited") from e
+        except LLMRateLimitError as e:
+            error = e
+
+        assert _retry_after_seconds(error) == 3.0
+
+    def test_missing_header(self):
+        """Without a header the jittered backoff decides the wait."""
+        assert _retry_after_seconds(_http_error(503)) is None
+        assert _retry_after_seconds(None) is None
+
+
+class TestRetry:
+    """Test retrying of transient finance LLM failures."""
+
+    @pytest.mark.asyncio
+    async def test_transient_error_is_retried(
+        self, pipeline: FinancePipeline, llm_client: MagicMock
+    ):
+        """A 429 honouring Retry-After is retried until the call succeeds."""
+        llm_client.generate.side_effect = [_http_error(429, "0"), "response"]
+
+        assert await pipeline._llm_generate("prompt") == "response"
+        assert llm_client.generate.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_client_error_is_not_retried(
+        self, pipeline: FinancePipeline, llm_client: MagicMock
+    ):
+        """A 4xx other than 429 fails on the first attempt."""
+        llm_client.generate.side_effect = _http_error(400)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await pipeline._llm_generate("prompt")
+        assert llm_client.generate.await_count == 1
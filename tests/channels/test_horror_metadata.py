@@ -0,0 +1,102 @@
+"""Tests for horror description and tag generation."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.channels.horror import HorrorPipeline
+from src.channels.llm_cache import LLMResponseCache
+
+_TOPIC = {"title": "The Lighthouse", "category": "mystery", "keywords": ["lighthouse"]}
+
+
+def _prompt_kind(system: str | None) -> str:
+    if system is None:
+        return "unknown"
+    if "description and tags" in system:
+        return "merged"
+    if "YouTube description" in system:
+        return "description"
+    return "tags"
+
+
+@pytest.fixture
+def llm_client() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture
+def llm_cache() -> LLMResponseCache:
+    return LLMResponseCache()
+
+
+@pytest.fixture
+def pipeline(
+    mock_services, tmp_output_dir: Path, llm_client: MagicMock, llm_cache: LLMResponseCache
+) -> HorrorPipeline:
+    return HorrorPipeline(
+        **mock_services, output_base=tmp_output_dir, llm_client=llm_client, llm_cache=llm_cache
+    )
+
+
+class TestParseJsonResponse:
+    """Test extraction of JSON from LLM replies."""
+
+    def test_object_wrapped_in_prose(self, pipeline: HorrorPipeline):
+        """An object is returned whole, not the list nested inside it."""
+        response = 'Here is the metadata:\n{"description": "D", "tags": ["horror", "creepy"]}'
+
+        assert pipeline._parse_json_response(response) == {
+            "description": "D",
+            "tags": ["horror", "creepy"],
+        }
+
+    def test_list_wrapped_in_prose(self, pipeline: HorrorPipeline):
+        """A list of objects is still returned as the list."""
+        response = 'Topics:\n[{"title": "A"}, {"title": "B"}]\nEnjoy!'
+
+        assert pipeline._parse_json_response(response) == [{"title": "A"}, {"title": "B"}]
+
+
+class TestDescriptionAndTags:
+    """Test the merged description and tags call."""
+
+    @pytest.mark.asyncio
+    async def test_merged_reply(self, pipeline: HorrorPipeline, llm_client: MagicMock):
+        """A JSON reply yields the description and tags from one call."""
+        reply = json.dumps({"description": "D", "tags": ["horror", " creepy "]})
+        llm_client.generate = AsyncMock(return_value=f"Sure!\n{reply}")
+
+        result = await pipeline._generate_description_and_tags(_TOPIC, "Body")
+
+        assert result == ("D", ["horror", "creepy"])
+        assert llm_client.generate.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_unusable_reply_falls_back_and_is_not_cached(
+        self, pipeline: HorrorPipeline, llm_client: MagicMock, llm_cache: LLMResponseCache
+    ):
+        """A reply without JSON falls back to the separate prompts and is not reused."""
+        replies = {
+            "merged": "I cannot help with JSON today.",
+            "description": "Plain description",
+            "tags": "horror, creepy, ",
+        }
+        llm_client.generate = AsyncMock(
+            side_effect=lambda prompt, system=None: replies[_prompt_kind(system)]
+        )
+
+        first = await pipeline._generate_description_and_tags(_TOPIC, "Body")
+        second = await pipeline._generate_description_and_tags(_TOPIC, "Body")
+
+        assert first == second == ("Plain description", ["horror", "creepy"])
+        merged_calls = [
+            call
+            for call in llm_client.generate.await_args_list
+            if _prompt_kind(call.kwargs["system"]) == "merged"
+        ]
+        assert len(merged_calls) == 2
@@ -0,0 +1,79 @@
+"""Tests for the shared LLM response cache."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.channels.llm_cache import LLMResponseCache
+
+
+class TestMemoryCache:
+    """Test the in-memory cache without persistence."""
+
+    @pytest.mark.asyncio
+    async def test_miss_then_hit(self):
+        """A stored response is returned for the same prompt only."""
+        cache = LLMResponseCache()
+
+        assert await cache.get("prompt") is None
+        await cache.put("prompt", "response")
+
+        assert await cache.get("prompt") == "response"
+        assert await cache.get("other prompt") is None
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_a_miss(self):
+        """Entries older than the TTL are dropped."""
+        cache = LLMResponseCache(ttl=60)
+        with patch("src.channels.llm_cache.time.time", return_value=1000.0):
+            await cache.put("prompt", "response")
+        with patch("src.channels.llm_cache.time.time", return_value=1061.0):
+            assert await cache.get("prompt") is None
+
+    @pytest.mark.asyncio
+    async def test_get_or_compute_only_computes_on_miss(self):
+        """compute() runs once; the second call is served from the cache."""
+        cache = LLMResponseCache()
+        compute = AsyncMock(return_value="response")
+
+        assert await cache.get_or_compute("prompt", compute) == "response"
+        assert await cache.get_or_compute("prompt", compute) == "response"
+        compute.assert_awaited_once()
+
+
+class TestPersistentCache:
+    """Test SQLite persistence and write batching."""
+
+    @pytest.mark.asyncio
+    async def test_writes_are_buffered_until_flush(self, tmp_path: Path):
+        """Entries reach SQLite only once flush_every is reached or flush() runs."""
+        db_path = tmp_path / "cache.db"
+        cache = LLMResponseCache(db_path, flush_every=2)
+
+        await cache.put("first", "one")
+        assert not db_path.exists()
+
+        await cache.put("second", "two")
+        with sqlite3.connect(db_path) as db:
+            assert db.execute("SELECT COUNT(*) FROM responses").fetchone()[0] == 2
+
+        await cache.put("third", "three")
+        await cache.flush()
+        with sqlite3.connect(db_path) as db:
+            assert db.execute("SELECT COUNT(*) FROM responses").fetchone()[0] == 3
+
+    @pytest.mark.asyncio
+    async def test_flushed_entries_are_read_by_a_new_cache(self, tmp_path: Path):
+        """A later run reuses responses persisted by an earlier one."""
+        db_path = tmp_path / "cache.db"
+        writer = LLMResponseCache(db_path)
+        await writer.put("prompt", "response")
+        await writer.flush()
+
+        reader = LLMResponseCache(db_path)
+        assert await reader.get("prompt") == "response"
+        assert await reader.get("missing") is None
@@ -41,12 +41,22 @@ def reset_singletons():
 
 
 def _reset_all_singletons():
-    """Reset orchestrator and settings singletons."""
+    """Reset orchestrator, settings and cached service factories."""
     from config.settings import reload_settings
+    from src.channels import facts, finance, horror
     from src.core.orchestrator import reset_orchestrator
+    from src.services.llm import client as llm_client
+    from src.services.llm import get_llm_client, get_script_generator
 
     reset_orchestrator()
     reload_settings()
+    for channel in (horror, facts, finance):
+        channel.create_pipeline.cache_clear()
+    get_llm_client.cache_clear()
+    get_script_generator.cache_clear()
+    llm_client._SDK_CLIENTS.clear()
+    llm_client._SDK_HTTP_CLIENTS.clear()
+    llm_client._OPENCODE_TOKEN_CACHE.clear()
 
 
 # ============================================
@@ -0,0 +1,109 @@
+"""Tests for the ffmpeg worker's job stores."""
+
+from __future__ import annotations
+
+import fnmatch
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+_WORKER_MAIN = Path(__file__).parents[2] / "deploy" / "ffmpeg-worker" / "main.py"
+
+
+def _load_worker() -> ModuleType:
+    # The worker is deployed on its own, from a directory that is not a package
+    spec = importlib.util.spec_from_file_location("ffmpeg_worker_main", _WORKER_MAIN)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+worker = _load_worker()
+
+
+class _FakeRedis:
+    """In-memory stand-in for redis.asyncio with decode_responses=True."""
+
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, str]] = {}
+
+    async def hset(self, key: str, mapping: dict[str, object]) -> int:
+        for value in mapping.values():
+            if not isinstance(value, str | int | float | bytes):
+                raise TypeError(f"Invalid input of type {type(value).__name__}")
+        self.hashes.setdefault(key, {}).update({k: str(v) for k, v in mapping.items()})
+        return len(mapping)
+
+    async def hgetall(self, key: str) -> dict[str, str]:
+        return dict(self.hashes.get(key, {}))
+
+    async def scan_iter(self, match: str):
+        for key in list(self.hashes):
+            if fnmatch.fnmatch(key, match):
+                yield key
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self)
+
+    async def delete(self, key: str) -> int:
+        return int(self.hashes.pop(key, None) is not None)
+
+
+class _FakePipeline:
+    def __init__(self, redis: _FakeRedis) -> None:
+        self._redis = redis
+        self._keys: list[str] = []
+
+    async def __aenter__(self) -> _FakePipeline:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        pass
+
+    def hgetall(self, key: str) -> None:
+        self._keys.append(key)
+
+    async def execute(self) -> list[dict[str, str]]:
+        return [await self._redis.hgetall(key) for key in self._keys]
+
+
+def _redis_store() -> object:
+    # Bypass __init__, which needs the redis package and a server URL
+    store = object.__new__(worker.RedisJobStore)
+    store._redis = _FakeRedis()
+    return store
+
+
+@pytest.fixture(params=["memory", "redis"])
+def store(request: pytest.FixtureRequest) -> object:
+    return worker.MemoryJobStore() if request.param == "memory" else _redis_store()
+
+
+class TestJobStore:
+    """Test that both job stores behave the same."""
+
+    @pytest.mark.asyncio
+    async def test_save_update_get(self, store):
+        """Updates merge into the saved job and typed fields survive the round trip."""
+        await store.save(worker.JobStatus(jobId="job-1", status="pending"))
+        await store.update("job-1", status="processing", progress=5)
+        await store.update("job-1", status="completed", progress=100, duration=42)
+
+        job = await store.get("job-1")
+
+        assert job == worker.JobStatus(jobId="job-1", status="completed", progress=100, duration=42)
+
+    @pytest.mark.asyncio
+    async def test_list_and_delete(self, store):
+        """Listed jobs reflect saves and deletes."""
+        await store.save(worker.JobStatus(jobId="job-1", status="pending"))
+        await store.save(worker.JobStatus(jobId="job-2", status="failed", error="boom"))
+
+        assert sorted(job.jobId for job in await store.list()) == ["job-1", "job-2"]
+        assert await store.delete("job-1") is True
+        assert await store.delete("job-1") is False
+        assert await store.get("job-1") is None
+        assert [job.error for job in await store.list()] == ["boom"]
@@ -0,0 +1,255 @@
+"""Tests for the LLM client module."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import anthropic
+import openai
+import pytest
+from anthropic.types import TextBlock
+from tenacity import wait_none
+
+from src.core.exceptions import LLMError, LLMRateLimitError, LLMTransientError
+from src.services.llm import client as llm_client
+from src.services.llm.client import _llm_error, get_opencode_token
+
+
+@pytest.fixture
+def auth_file(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    path = tmp_path / "auth.json"
+    monkeypatch.setattr(llm_client, "OPENCODE_AUTH_PATH", path)
+    return path
+
+
+def _write_auth(path: Path, access: str, expires_in: float) -> None:
+    expires = (time.time() + expires_in) * 1000
+    path.write_text(json.dumps({"anthropic": {"access": access, "expires": expires}}))
+
+
+class TestOpenCodeToken:
+    """Test caching of OpenCode access tokens."""
+
+    def test_fresh_token_is_served_from_cache(self, auth_file: Path):
+        """A token well before expiry is returned without re-reading auth.json."""
+        _write_auth(auth_file, "token-1", 3600)
+
+        assert get_opencode_token("anthropic") == "token-1"
+        auth_file.unlink()
+        assert get_opencode_token("anthropic") == "token-1"
+
+    def test_token_inside_buffer_is_expired(self, auth_file: Path):
+        """Tokens within the expiry buffer are treated as expired."""
+        _write_auth(auth_file, "token-1", 60)
+
+        assert get_opencode_token("anthropic") is None
+
+    def test_stale_token_rereads_only_changed_file(self, auth_file: Path):
+        """A stale cached token is replaced once auth.json changes on disk."""
+        _write_auth(auth_file, "token-1", 60)
+        assert get_opencode_token("anthropic") is None
+        mtime_ns = auth_file.stat().st_mtime_ns
+
+        # Same mtime: the file is assumed unchanged and not parsed again
+        _write_auth(auth_file, "token-2", 3600)
+        os.utime(auth_file, ns=(mtime_ns, mtime_ns))
+        assert get_opencode_token("anthropic") is None
+
+        os.utime(auth_file, ns=(mtime_ns + 1_000_000, mtime_ns + 1_000_000))
+        assert get_opencode_token("anthropic") == "token-2"
+
+    def test_missing_file(self, auth_file: Path):
+        """No auth.json means no token."""
+        assert get_opencode_token("anthropic") is None
+
+    @pytest.mark.asyncio
+    async def test_client_picks_up_rotated_token(self, auth_file: Path):
+        """A long-lived client uses the current token, not the one seen at construction."""
+        _write_auth(auth_file, "token-1", 3600)
+        client = llm_client.AnthropicClient()
+        assert client._client.api_key == "token-1"
+
+        # Simulate the cached token reaching its expiry buffer, then a refreshed file
+        llm_client._OPENCODE_TOKEN_CACHE["anthropic"] = ("token-1", 1.0, 0)
+        _write_auth(auth_file, "token-2", 3600)
+
+        assert client._client.api_key == "token-2"
+
+
+def _status_error(cls: type, status_code: int) -> Exception:
+    response = MagicMock(status_code=status_code, headers={})
+    return cls("error", response=response, body=None)
+
+
+class TestLLMErrorMapping:
+    """Test mapping of SDK exceptions onto retryable LLM errors."""
+
+    @pytest.mark.parametrize(
+        ("error", "expected"),
+        [
+            (_status_error(anthropic.RateLimitError, 429), LLMRateLimitError),
+            (_status_error(openai.RateLimitError, 429), LLMRateLimitError),
+            (anthropic.APIConnectionError(request=MagicMock()), LLMTransientError),
+            (openai.APITimeoutError(request=MagicMock()), LLMTransientError),
+            (_status_error(anthropic.InternalServerError, 529), LLMTransientError),
+            (_status_error(openai.InternalServerError, 503), LLMTransientError),
+        ],
+    )
+    def test_retryable_errors(self, error: Exception, expected: type[LLMError]):
+        """Rate limits and transient failures map onto the retried subclasses."""
+        assert type(_llm_error("Provider", "generation", error)) is expected
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            _status_error(anthropic.BadRequestError, 400),
+            _status_error(openai.AuthenticationError, 401),
+            ValueError("overloaded"),
+        ],
+    )
+    def test_other_errors_are_not_retried(self, error: Exception):
+        """Everything else becomes a plain LLMError, whatever its message says."""
+        mapped = _llm_error("Provider", "generation", error)
+
+        assert type(mapped) is LLMError
+        assert str(mapped) == "Provider generation failed: " + str(error)
+
+
+class TestRetry:
+    """Test the retry policy applied to client calls."""
+
+    @pytest.fixture
+    def sdk(self, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+        sdk = MagicMock()
+        monkeypatch.setattr(llm_client.AnthropicClient, "_client", property(lambda self: sdk))
+        # No backoff between attempts
+        monkeypatch.setattr(llm_client.AnthropicClient.generate.retry, "wait", wait_none())
+        return sdk
+
+    @pytest.mark.asyncio
+    async def test_transient_error_is_retried(self, sdk: MagicMock):
+        """A transient failure is retried and the later success returned."""
+        response = MagicMock(content=[TextBlock(type="text", text="ok")])
+        sdk.messages.create = AsyncMock(
+            side_effect=[anthropic.APIConnectionError(request=MagicMock()), response]
+        )
+
+        text = await llm_client.AnthropicClient(api_key="test").generate("prompt")
+
+        assert text == "ok"
+        assert sdk.messages.create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_permanent_error_is_not_retried(self, sdk: MagicMock):
+        """A non-retryable failure is raised after the first attempt."""
+        sdk.messages.create = AsyncMock(side_effect=_status_error(anthropic.BadRequestError, 400))
+
+        with pytest.raises(LLMError):
+            await llm_client.AnthropicClient(api_key="test").generate("prompt")
+
+        assert sdk.messages.create.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_generate_json_shares_one_retry_budget(self, sdk: MagicMock):
+        """A persistent outage costs three attempts in total, not three per layer."""
+        sdk.messages.create = AsyncMock(
+            side_effect=_status_error(anthropic.InternalServerError, 529)
+        )
+
+        with pytest.raises(LLMTransientError):
+            await llm_client.AnthropicClient(api_key="test").generate_json("prompt")
+
+        assert sdk.messages.create.await_count == 3
+
+
+def _batch_entry(index: int, result_type: str, text: str = "") -> MagicMock:
+    entry = MagicMock(custom_id=str(index))
+    entry.result.type = result_type
+    entry.result.message.content = [TextBlock(type="text", text=text)]
+    return entry
+
+
+async def _aiter(items: list) -> AsyncIterator:
+    for item in items:
+        yield item
+
+
+class TestBatch:
+    """Test provider batch APIs."""
+
+    @pytest.mark.asyncio
+    async def test_anthropic_batch(self, monkeypatch: pytest.MonkeyPatch):
+        """Results are placed by custom_id; failed and missing entries become errors."""
+        sdk = MagicMock()
+        monkeypatch.setattr(llm_client.AnthropicClient, "_client", property(lambda self: sdk))
+        sdk.messages.batches.create = AsyncMock(
+            return_value=MagicMock(id="batch-1", processing_status="in_progress")
+        )
+        sdk.messages.batches.retrieve = AsyncMock(
+            return_value=MagicMock(id="batch-1", processing_status="ended")
+        )
+        sdk.messages.batches.results = AsyncMock(
+            return_value=_aiter(
+                [_batch_entry(1, "errored"), _batch_entry(0, "succeeded", '```json\n{"a": 1}\n```')]
+            )
+        )
+
+        results = await llm_client.AnthropicClient(api_key="test").generate_json_batch(
+            [("p0", None), ("p1", "system"), ("p2", None)], poll_interval=0
+        )
+
+        assert results[0] == {"a": 1}
+        assert isinstance(results[1], LLMError)
+        assert isinstance(results[2], LLMError)
+        requests = sdk.messages.batches.create.await_args.kwargs["requests"]
+        assert [request["custom_id"] for request in requests] == ["0", "1", "2"]
+        sdk.messages.batches.retrieve.assert_awaited_once_with("batch-1")
+
+    @pytest.mark.asyncio
+    async def test_openai_batch(self, monkeypatch: pytest.MonkeyPatch):
+        """Output lines are matched back to their inputs by custom_id."""
+        sdk = MagicMock()
+        monkeypatch.setattr(llm_client.OpenAIClient, "_client", property(lambda self: sdk))
+        sdk.files.create = AsyncMock(return_value=MagicMock(id="file-1"))
+        sdk.batches.create = AsyncMock(
+            return_value=MagicMock(id="batch-1", status="completed", output_file_id="file-2")
+        )
+        lines = [
+            {"custom_id": "1", "error": {"message": "bad request"}},
+            {
+                "custom_id": "0",
+                "response": {
+                    "status_code": 200,
+                    "body": {"choices": [{"message": {"content": '{"a": 1}'}}]},
+                },
+            },
+        ]
+        sdk.files.content = AsyncMock(
+            return_value=MagicMock(text="\n".join(map(json.dumps, lines)))
+        )
+
+        results = await llm_client.OpenAIClient(api_key="test").generate_json_batch(
+            [("p0", None), ("p1", None)]
+        )
+
+        assert results[0] == {"a": 1}
+        assert isinstance(results[1], LLMError)
+        sdk.files.content.assert_awaited_once_with("file-2")
+
+    @pytest.mark.asyncio
+    async def test_openai_batch_failure_raises(self, monkeypatch: pytest.MonkeyPatch):
+        """A batch that does not complete fails the whole call."""
+        sdk = MagicMock()
+        monkeypatch.setattr(llm_client.OpenAIClient, "_client", property(lambda self: sdk))
+        sdk.files.create = AsyncMock(return_value=MagicMock(id="file-1"))
+        sdk.batches.create = AsyncMock(
+            return_value=MagicMock(id="batch-1", status="expired", output_file_id=None)
+        )
+
+        with pytest.raises(LLMError, match="expired"):
+            await llm_client.OpenAIClient(api_key="test").generate_json_batch([("p0", None)])
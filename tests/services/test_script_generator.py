@@ -0,0 +1,131 @@
+"""Tests for the script generator."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.models import ChannelType
+from src.services.llm.client import LLMClient
+from src.services.llm.script_generator import ScriptGeneratorImpl, _hook_watcher
+
+
+def _script_json() -> dict:
+    return {
+        "title": "The Lighthouse",
+        "hook": "Nobody has climbed these stairs in forty years.",
+        "body": "Body",
+        "cta": "Subscribe for more",
+        "emotion_markers": [{"timestamp": "00:05", "type": "dread", "text": "stairs"}],
+        "keywords": ["lighthouse"],
+    }
+
+
+@pytest.fixture
+def llm_client() -> MagicMock:
+    client = MagicMock()
+    client.generate_json = AsyncMock(side_effect=lambda **_: _script_json())
+    return client
+
+
+class TestScriptCache:
+    """Test caching of script responses."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_request_skips_llm(self, llm_client: MagicMock):
+        """The same topic and channel are only sent to the LLM once."""
+        generator = ScriptGeneratorImpl(llm_client=llm_client)
+
+        first = await generator.generate_script("The Lighthouse", ChannelType.HORROR)
+        first.keywords.append("edited")
+        second = await generator.generate_script("The Lighthouse", ChannelType.HORROR)
+
+        assert llm_client.generate_json.await_count == 1
+        assert second.hook == first.hook
+        assert second.keywords == ["lighthouse"]
+
+    @pytest.mark.asyncio
+    async def test_clear_cache(self, llm_client: MagicMock):
+        """Clearing the cache sends the next request to the LLM again."""
+        generator = ScriptGeneratorImpl(llm_client=llm_client)
+
+        await generator.generate_script("The Lighthouse", ChannelType.HORROR)
+        generator.clear_cache()
+        await generator.generate_script("The Lighthouse", ChannelType.HORROR)
+
+        assert llm_client.generate_json.await_count == 2
+
+
+class _ChunkedClient(LLMClient):
+    """Streams a fixed response in the given chunks."""
+
+    def __init__(self, chunks: list[str]) -> None:
+        self.chunks = chunks
+
+    async def generate(self, prompt: str, system: str | None = None, **kwargs) -> str:
+        return "".join(self.chunks)
+
+    async def generate_json(self, prompt: str, system: str | None = None, **kwargs) -> dict:
+        return json.loads(await self.generate(prompt, system=system))
+
+    async def stream(self, prompt: str, system: str | None = None, **kwargs) -> AsyncIterator[str]:
+        for chunk in self.chunks:
+            yield chunk
+
+
+def _split(text: str, size: int) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+class TestHookStreaming:
+    """Test handing the hook over while the script streams."""
+
+    @pytest.mark.parametrize("size", [1, 3, 7, 1000])
+    def test_hook_split_across_chunks(self, size: int):
+        """The hook is reported once, whole and unescaped, however the stream is split."""
+        hooks: list[str] = []
+        on_text = _hook_watcher(hooks.append)
+        response = json.dumps({"title": "T", "hook": 'She said "run" \\ twice', "body": "B"})
+
+        for chunk in _split(response, size):
+            on_text(chunk)
+
+        assert hooks == ['She said "run" \\ twice']
+
+    def test_incomplete_hook_is_not_reported(self):
+        """A hook whose closing quote has not arrived yet is held back."""
+        hooks: list[str] = []
+        on_text = _hook_watcher(hooks.append)
+
+        on_text('{"hook": "Nobody has climbed \\"')
+
+        assert hooks == []
+
+    @pytest.mark.asyncio
+    async def test_generate_script_streams_hook(self):
+        """generate_script reports the hook before returning the parsed script."""
+        client = _ChunkedClient(_split(json.dumps(_script_json()), 5))
+        generator = ScriptGeneratorImpl(llm_client=client)
+        hooks: list[str] = []
+
+        script = await generator.generate_script(
+            "The Lighthouse", ChannelType.HORROR, on_hook=hooks.append
+        )
+
+        assert hooks == [script.hook]
+        assert script.body == "Body"
+
+    @pytest.mark.asyncio
+    async def test_cached_script_still_reports_hook(self, llm_client: MagicMock):
+        """A cache hit hands the cached hook over without calling the LLM."""
+        generator = ScriptGeneratorImpl(llm_client=llm_client)
+        await generator.generate_script("The Lighthouse", ChannelType.HORROR)
+        hooks: list[str] = []
+
+        await generator.generate_script("The Lighthouse", ChannelType.HORROR, on_hook=hooks.append)
+
+        assert hooks == [_script_json()["hook"]]
+        assert llm_client.generate_json.await_count == 1
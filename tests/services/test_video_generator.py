@@ -0,0 +1,50 @@
+"""Tests for the Ken Burns video fallback."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.core.exceptions import VideoGenerationError
+from src.services.visual import video_generator
+from src.services.visual.video_generator import VideoGenerator
+
+
+@pytest.fixture
+def generator(monkeypatch: pytest.MonkeyPatch) -> VideoGenerator:
+    generator = VideoGenerator()
+    monkeypatch.setattr(generator, "_get_ffmpeg_path", lambda: "ffmpeg")
+    monkeypatch.setattr(video_generator, "encoder_available", lambda ffmpeg, encoder: True)
+    return generator
+
+
+class TestKenBurnsEncoder:
+    """Test encoder selection for Ken Burns clips."""
+
+    @pytest.mark.asyncio
+    async def test_nvenc_failure_retries_on_cpu(self, generator: VideoGenerator, tmp_path: Path):
+        """A failed NVENC encode, e.g. past the session limit, is redone with libx264."""
+        encode = AsyncMock(side_effect=[VideoGenerationError("OpenEncodeSessionEx failed"), None])
+
+        with patch.object(generator, "_encode_ken_burns", encode):
+            asset = await generator._generate_ffmpeg_ken_burns(
+                tmp_path / "in.png", 5.0, tmp_path / "out.mp4", hw_accel=True
+            )
+
+        assert [call.kwargs["nvenc"] for call in encode.await_args_list] == [True, False]
+        assert asset.path == tmp_path / "out.mp4"
+
+    @pytest.mark.asyncio
+    async def test_cpu_failure_is_raised(self, generator: VideoGenerator, tmp_path: Path):
+        """Without hardware acceleration a failed encode is not retried."""
+        encode = AsyncMock(side_effect=VideoGenerationError("bad input"))
+
+        with patch.object(generator, "_encode_ken_burns", encode):
+            with pytest.raises(VideoGenerationError):
+                await generator._generate_ffmpeg_ken_burns(
+                    tmp_path / "in.png", 5.0, tmp_path / "out.mp4"
+                )
+
+        assert encode.await_count == 1
@@ -0,0 +1,118 @@
+"""Tests for YouTube OAuth credential handling."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from google.auth.exceptions import RefreshError, TransportError
+
+from src.core.exceptions import YouTubeAuthError
+from src.services.youtube import auth
+from src.services.youtube.auth import YouTubeAuth
+
+
+@pytest.fixture
+def token_file(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Iterator[Path]:
+    path = tmp_path / "youtube_token.json"
+    path.write_text("{}")
+    monkeypatch.setenv("YOUTUBE_TOKEN_FILE", str(path))
+    auth._TOKEN_CACHE.clear()
+    yield path
+    auth._TOKEN_CACHE.clear()
+
+
+def _credentials(expires_in: float, error: Exception | None = None) -> MagicMock:
+    creds = MagicMock()
+    # Naive UTC, as google-auth stores it
+    creds.expiry = datetime.now(UTC).replace(tzinfo=None) + timedelta(seconds=expires_in)
+    creds.refresh.side_effect = error
+    return creds
+
+
+class TestTokenCache:
+    """Test the process-wide credentials cache."""
+
+    def test_fresh_cached_credentials_are_shared(self, token_file: Path):
+        """A new instance reuses cached credentials without reading the token file."""
+        creds = _credentials(3600)
+        auth._TOKEN_CACHE[token_file] = (creds, time.time() + 3600)
+
+        with patch.object(YouTubeAuth, "_load_token") as load_token:
+            assert YouTubeAuth().authenticate() is creds
+
+        load_token.assert_not_called()
+
+    def test_credentials_inside_buffer_are_reloaded(self, token_file: Path):
+        """Cached credentials close to expiry are replaced by a fresh load."""
+        stale = _credentials(60)
+        auth._TOKEN_CACHE[token_file] = (
+            stale,
+            time.time() + auth.TOKEN_EXPIRY_BUFFER_SECONDS - 60,
+        )
+        fresh = _credentials(3600)
+        fresh.valid = True
+
+        with patch.object(YouTubeAuth, "_load_token", return_value=fresh):
+            assert YouTubeAuth().authenticate() is fresh
+
+        assert auth._TOKEN_CACHE[token_file][0] is fresh
+        assert auth._TOKEN_CACHE[token_file][1] == pytest.approx(time.time() + 3600, abs=5)
+
+    def test_invalidate_cache(self, token_file: Path):
+        """Invalidating drops the shared entry for the token file."""
+        auth._TOKEN_CACHE[token_file] = (_credentials(3600), time.time() + 3600)
+
+        YouTubeAuth().invalidate_cache()
+
+        assert token_file not in auth._TOKEN_CACHE
+
+
+class TestRefreshToken:
+    """Test handling of token refresh failures."""
+
+    def test_invalid_grant_deletes_token(self, token_file: Path):
+        """A revoked refresh token removes the saved token and cache entry."""
+        youtube_auth = YouTubeAuth()
+        youtube_auth._credentials = _credentials(
+            -60, RefreshError("invalid_grant: Token has been expired or revoked.")
+        )
+        auth._TOKEN_CACHE[token_file] = (youtube_auth._credentials, 0.0)
+
+        with pytest.raises(YouTubeAuthError):
+            youtube_auth._refresh_token()
+
+        assert not token_file.exists()
+        assert token_file not in auth._TOKEN_CACHE
+
+    @pytest.mark.parametrize(
+        "error",
+        [RefreshError("temporarily_unavailable"), TransportError("connection reset")],
+    )
+    def test_transient_failure_keeps_token(self, token_file: Path, error: Exception):
+        """Other refresh failures leave the token file for the next attempt."""
+        youtube_auth = YouTubeAuth()
+        youtube_auth._credentials = _credentials(-60, error)
+
+        with pytest.raises(YouTubeAuthError):
+            youtube_auth._refresh_token()
+
+        assert token_file.exists()
+
+    @pytest.mark.asyncio
+    async def test_background_refresh_failure_keeps_token(self, token_file: Path):
+        """A failed background refresh keeps serving the still-valid credentials."""
+        youtube_auth = YouTubeAuth()
+        creds = _credentials(60, TransportError("connection reset"))
+        youtube_auth._credentials = creds
+
+        assert await youtube_auth.get_valid_credentials() is creds
+        assert youtube_auth._refresh_task is not None
+        await youtube_auth._refresh_task
+
+        assert token_file.exists()
+        assert youtube_auth._credentials is creds
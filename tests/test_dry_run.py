@@ -155,13 +155,24 @@ def test_prompts_loaded():
     from src.channels.finance.prompts import (
         TOPIC_GENERATION as FIN_TOPIC,
     )
-    from src.channels.horror.prompts import FORBIDDEN_TOPICS, TOPIC_GENERATION
+    from src.channels.horror.prompts import (
+        FORBIDDEN_TOPICS,
+        TOPIC_GENERATION,
+        find_forbidden_topic,
+    )
 
     assert "{count}" in TOPIC_GENERATION, "Horror topic template missing placeholder"
     assert "{count}" in FACTS_TOPIC, "Facts topic template missing placeholder"
     assert "{count}" in FIN_TOPIC, "Finance topic template missing placeholder"
 
     assert len(FORBIDDEN_TOPICS) > 0, "Horror forbidden topics empty"
+    assert find_forbidden_topic("A tale of Real Death Footage") == "real death footage"
+    assert find_forbidden_topic("A quiet haunted lighthouse") is None
+    assert find_forbidden_topic("a selfharm story") == "self harm"
+    assert find_forbidden_topic("gorgeous scenery") is None
+    assert find_forbidden_topic("a self-harming character") == "self harm"
+    assert find_forbidden_topic("his suicidal thoughts") == "suicide"
+    assert find_forbidden_topic("a snuffed victim") == "snuff"
 
     print("  ✅ All prompt templates loaded correctly")
 
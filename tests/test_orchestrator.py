@@ -121,6 +121,17 @@ class TestEnqueue:
         assert status["stats"]["horror"]["total"] == 2
         assert status["stats"]["facts"]["total"] == 1
 
+    @pytest.mark.asyncio
+    async def test_enqueue_many_creates_jobs(self, orchestrator_dry_run: Orchestrator):
+        job_ids = await orchestrator_dry_run.enqueue_many(["horror", "horror", "facts"])
+
+        assert len(set(job_ids)) == 3
+        assert orchestrator_dry_run._queue.qsize() == 3
+        status = orchestrator_dry_run.status()
+        assert status["pending_jobs"] == 3
+        assert status["stats"]["horror"]["total"] == 2
+        assert status["stats"]["facts"]["total"] == 1
+
     @pytest.mark.asyncio
     async def test_enqueue_adds_to_queue(self, orchestrator_dry_run: Orchestrator):
         await orchestrator_dry_run.enqueue("horror")
@@ -180,6 +191,8 @@ class TestJobProcessing:
         assert job.status == JobStatus.RETRYING
         assert job.retries == 1
         assert job.error == "Test error"
+        # Retry waits in the queue for its backoff rather than inside the worker
+        assert orchestrator_dry_run._queue.qsize() == 1
 
     @pytest.mark.asyncio
     async def test_max_retries_exhausted(self, orchestrator_dry_run: Orchestrator):
@@ -254,6 +267,17 @@ class TestStatus:
         assert status["total_jobs"] == 2
         assert status["dry_run"] is True
 
+    @pytest.mark.asyncio
+    async def test_status_counts_follow_transitions(self, orchestrator_dry_run: Orchestrator):
+        await orchestrator_dry_run.enqueue("horror")
+        await orchestrator_dry_run.run_once("facts")
+
+        status = orchestrator_dry_run.status()
+
+        assert status["pending_jobs"] == 1
+        assert status["running_jobs"] == 0
+        assert status["total_jobs"] == 2
+
 
 class TestGetJobs:
     @pytest.mark.asyncio
@@ -287,7 +311,9 @@ class TestStartStop:
         try:
             assert orchestrator_dry_run._state == OrchestratorState.RUNNING
             assert len(orchestrator_dry_run._workers) == 2
-            assert orchestrator_dry_run._scheduler_task is not None
+            assert set(orchestrator_dry_run._schedule_handles) == set(
+                Orchestrator.DEFAULT_SCHEDULES
+            )
         finally:
             await orchestrator_dry_run.stop()
 
@@ -316,6 +342,19 @@ class TestStartStop:
         await orchestrator_dry_run.stop()
         assert orchestrator_dry_run._state == OrchestratorState.STOPPED
 
+    @pytest.mark.asyncio
+    async def test_stop_closes_pipelines(self, orchestrator_dry_run: Orchestrator):
+        closable = MagicMock(aclose=AsyncMock())
+        plain = MagicMock(spec=["run"])
+        orchestrator_dry_run.register_pipeline("finance", closable)
+        orchestrator_dry_run.register_pipeline("horror", plain)
+
+        await orchestrator_dry_run.start()
+        await orchestrator_dry_run.stop()
+
+        closable.aclose.assert_awaited_once()
+        assert orchestrator_dry_run._pipelines == {"horror": plain}
+
 
 class TestPipelineRegistration:
     def test_register_pipeline(self, orchestrator_dry_run: Orchestrator):